@@ -1,24 +1,104 @@
-from typing import Optional, Tuple, List, Callable, TypeVar, Iterable, Generic
+import asyncio
+import functools
+import importlib
+import inspect
+import io
+import marshal
+import math
+import operator
+import os
+import pickle
+import struct
+import sys
+import time
+import timeit
+import tracemalloc
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import (Executor, Future, ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from itertools import chain, islice
+from types import ModuleType
+from typing import (Any, Optional, Tuple, List, Dict, Callable, TypeVar,
+                    Iterable, Iterator, Generic, Sequence, Union, Awaitable,
+                    Deque, Set, BinaryIO, cast)
 
 T = TypeVar('T')
 U = TypeVar('U')
 
+_object_new = object.__new__
+
+# Process-wide node size used whenever no node_size is passed, see
+# set_default_node_size and autotune_node_size
+_default_node_size = 4
+
+# Numeric mode: dtype name -> typecode of the node buffers (int64/float64)
+_TYPECODES: Dict[str, str] = {'i8': 'q', 'f8': 'd'}
+_DTYPES: Dict[str, str] = {'q': 'i8', 'd': 'f8'}
+
+# Element-wise reductions that can run over a whole typed node at once
+_NODE_REDUCERS: Dict[Any, Callable[[Any], Any]] = {
+    operator.add: sum, operator.mul: math.prod, max: max, min: min}
+
+# numpy is optional: when installed, map_list and filter can run array-
+# aware functions over the buffers of numeric lists (see _vectorizes).
+# Below this node_size the per-call numpy overhead costs more than calling
+# the function per element, _auto_node_size stays above it for numbers
+_VECTORIZE_MIN_NODE_SIZE = 64
+_numpy: Optional[ModuleType]
+try:
+    _numpy = importlib.import_module("numpy")
+except ImportError:
+    _numpy = None
+
+# Structural hash: a polynomial over the element hashes modulo a Mersenne
+# prime, so it only depends on the elements and not on the node layout
+_HASH_BASE = 1000003
+_HASH_MODULUS = (1 << 61) - 1
+
+# Per-node membership summaries (see _node_summary) let member, find,
+# remove and intersection skip nodes. Below this node_size checking a
+# summary costs about as much as scanning the node
+_SUMMARY_MIN_NODE_SIZE = 64
+# Element types whose ordering agrees with ==, so min/max bounds are safe
+_ORDERED_TYPES = frozenset({bool, int, float, str, bytes})
+
+# Summary of a node: a one-hash Bloom filter over the element hashes
+# (None if an element is unhashable) and the (min, max) bounds (None
+# unless every element has an _ORDERED_TYPES type)
+Summary = Tuple[Optional[bytes], Optional[Tuple[Any, Any]]]
+# A summary costs about 30 plain scans of its node to build, so it is only
+# built once the node has been scanned this many times (ski rental: at
+# most about twice the cost of never building it)
+_SUMMARY_AFTER_SCANS = 32
+
 
 class Node(Generic[T]):
     # Node for Immutable Unrolled Linked List
+    # Slotted: no per-instance __dict__, nodes are the bulk of the memory
+    # _hash stays unset until the node is first hashed (see _node_hash),
+    # _summary counts scans until the summary is built (see _node_summary)
+    # __weakref__ lets the intern pool hold nodes weakly (enable_interning)
+    __slots__ = ('_elements', '_next', '_hash', '_summary', '__weakref__')
+    _hash: int
 
     def __init__(self,
                  elements: Optional[Iterable[T]] = None,
                  next_node: Optional['Node[T]'] = None):
         # Initialize an immutable node.
 
-        self._elements: Tuple[T, ...] = tuple(
+        self._elements: Sequence[T] = tuple(
             elements) if elements is not None else tuple()
         self._next: Optional['Node[T]'] = next_node
+        # Scan count, replaced by the Summary once built
+        self._summary: Any = 0
 
     @property
-    def elements(self) -> Tuple[T, ...]:
+    def elements(self) -> Sequence[T]:
         # Returns the elements of the node as a tuple (immutable)
+        # Nodes of numeric lists hold a read-only typed memoryview instead
         return self._elements
 
     @property
@@ -28,34 +108,67 @@ class Node(Generic[T]):
 
     def __str__(self) -> str:
         # String representation of the Node for easy printing
-        elements_str = ", ".join(map(str, self._elements))
-        next_str = ""
-        if self._next:
-            next_str = ", " + str(self._next)
-        return f"[{elements_str}]{next_str}"
+        # The following nodes are walked with a loop, not recursively
+        return ", ".join(
+            "[" + ", ".join(map(str, node._elements)) + "]"
+            for node in _iter_nodes(self))
 
     def __eq__(self, other: object) -> bool:
-        # Equality check for Node objects
+        # Equality check for Node objects, node by node without recursion
         if not isinstance(other, Node):
             return False
-        return self._elements == other._elements and self._next == other._next
+        node: Optional['Node[T]'] = self
+        other_node: Optional['Node[object]'] = other
+        while node is not None and other_node is not None:
+            if node is other_node:
+                return True  # Shared tail, the rest is identical
+            if _hash_differs(node, other_node):
+                return False
+            if node._elements != other_node._elements:
+                return False
+            node = node._next
+            other_node = other_node._next
+        return node is None and other_node is None
+
+    def __hash__(self) -> int:
+        # Structural hash of the chain from this node, cached per node
+        return _node_hash(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickles the chain from this node in the dump() format instead
+        # of recursing through _next, which fails on long chains. Object
+        # identity is kept only within one dump chunk (up to 65536
+        # elements), an object shared across chunks is unpickled twice
+        node_size = max((len(node._elements) for node in _iter_nodes(self)),
+                        default=1)
+        return _load_nodes, (dumps(_new_list(self, max(node_size, 1),
+                                             None)), )
 
 
 class ImmutableUnrolledLinkedList(Generic[T]):
     # Immutable Unrolled Linked List Data Structure
+    __slots__ = ('_head_node', '_node_size', '_length', '_offsets',
+                 '_index_nodes', '_dtype')
 
     def __init__(self,
                  head_node: Optional['Node[T]'] = None,
-                 node_size: int = 4):
+                 node_size: Optional[int] = None):
         if head_node is not None and not isinstance(head_node, Node):
             raise TypeError("head_node must be a Node or None")
 
-        if not isinstance(node_size, int) or node_size <= 0:
-            raise ValueError("node_size must be a positive integer")
+        node_size = _node_size_or_default(node_size)
 
         self._head_node: Optional[
             'Node[T]'] = head_node  # Immutable head node reference
         self._node_size = node_size  # Immutable node size
+        # Cached element count, None until the first length() call
+        self._length: Optional[int] = None
+        # Skip index built lazily by nth(): start offset of every node
+        # and the matching nodes, searched with bisect
+        self._offsets: Optional[List[int]] = None
+        self._index_nodes: Optional[List['Node[T]']] = None
+        # Numeric mode ('i8' or 'f8') when the nodes hold typed buffers
+        self._dtype: Optional[str] = None
 
     @property
     def head_node(self) -> Optional['Node[T]']:
@@ -67,6 +180,11 @@ class ImmutableUnrolledLinkedList(Generic[T]):
         # Returns the fixed node size for this list (immutable)
         return self._node_size
 
+    @property
+    def dtype(self) -> Optional[str]:
+        # Returns 'i8' or 'f8' for numeric lists, None for object lists
+        return self._dtype
+
     def __str__(self) -> str:
         # String representation of the UnrolledLinkedList
         if self._head_node is None:
@@ -75,24 +193,60 @@ class ImmutableUnrolledLinkedList(Generic[T]):
 
     def __eq__(self, other: object) -> bool:
         # Equality check for ImmutableUnrolledLinkedList objects
+        # Lists are equal when they hold equal elements in the same order,
+        # however those elements are spread over nodes
         if not isinstance(other, ImmutableUnrolledLinkedList):
             return False
+        if self is other:
+            return True
 
-        check_headnode = (self._head_node == other._head_node)
         check_nodesize = (self._node_size == other._node_size)
-        return check_headnode and check_nodesize
+        if not check_nodesize or length(self) != length(other):
+            return False
+        head, other_head = self._head_node, other._head_node
+        if head is not None and other_head is not None and \
+                _hash_differs(head, other_head):
+            return False
+        return _equal_elements(head, other_head)
+
+    def __hash__(self) -> int:
+        # Hashable like a tuple: equal lists hash equal whatever their node
+        # layout, and hashing fails if an element is unhashable
+        return hash((_node_hash(self._head_node), self._node_size))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # pickle and multiprocessing go through the dump() format, which
+        # walks the nodes in a loop and also covers numeric lists. As
+        # with Node, an object shared by elements in different dump
+        # chunks is unpickled as separate copies
+        return loads, (dumps(self), )
 
     def __iter__(self) -> 'ImmutableUnrolledLinkedListIterator[T]':
         # Makes the ImmutableUnrolledLinkedList iterable. Returns an iterator
-        return ImmutableUnrolledLinkedListIterator[T](self)
+        return ImmutableUnrolledLinkedListIterator(self)
+
+    def __reversed__(self) -> Iterator[T]:
+        # Iterates from back to front, used by reversed(ul)
+        return reverse_iterator(self)
+
+    def __len__(self) -> int:
+        # Number of elements, O(1) once the count is cached
+        return length(self)
+
+    def __getitem__(self, index: int) -> T:
+        # Indexed access, negative indices count from the end
+        if not isinstance(index, int):
+            raise TypeError("list indices must be integers")
+        return nth(self, index)
 
 
 class ImmutableUnrolledLinkedListIterator(Generic[T]):
     # Iterator for ImmutableUnrolledLinkedList
+    __slots__ = ('_current_node', '_current_element_index')
 
     def __init__(self, unrolled_list: 'ImmutableUnrolledLinkedList[T]'):
         # Initialize the iterator with an UnrolledLinkedList
-        self._current_node: Optional['Node[T]'] = unrolled_list.head_node
+        self._current_node: Optional['Node[T]'] = unrolled_list._head_node
         self._current_element_index: int = 0
 
     def __iter__(self) -> 'ImmutableUnrolledLinkedListIterator[T]':
@@ -102,20 +256,382 @@ class ImmutableUnrolledLinkedListIterator(Generic[T]):
     def __next__(self) -> T:
         # Changed return type to T, will raise StopIteration, not Optional[T]
         # Returns the next element in the ImmutableUnrolledLinkedList
-        if self._current_node is None:
-            raise StopIteration
+        # Empty nodes are skipped with a loop instead of a recursive call
+        while self._current_node is not None:
+            elements = self._current_node._elements
+            if self._current_element_index < len(elements):
+                value = elements[self._current_element_index]
+                self._current_element_index += 1
+                return value
+            self._current_node = self._current_node._next
+            self._current_element_index = 0
+        raise StopIteration  # Raise StopIteration when no more nodes
+
+
+def _iter_nodes(node: Optional['Node[T]']) -> Iterator['Node[T]']:
+    # Shared traversal core: walks a Node chain front to back with a loop,
+    # so no operation needs one Python frame per node
+    while node is not None:
+        yield node
+        node = node._next
+
+
+def _node_hash(node: Optional['Node[T]']) -> int:
+    # Structural hash of a Node chain, memoized on every node
+    # The hash of a node is built on the cached hash of its next node, so
+    # a new version only hashes the nodes it does not share. The chain is
+    # walked with a loop up to the first node already hashed
+    pending: List['Node[T]'] = []
+    while node is not None:
+        try:
+            node_hash = node._hash
+            break
+        except AttributeError:
+            pending.append(node)
+            node = node._next
+    else:
+        node_hash = 0
+    for pending_node in reversed(pending):
+        for value in reversed(pending_node._elements):
+            node_hash = (node_hash * _HASH_BASE + hash(value)) % _HASH_MODULUS
+        pending_node._hash = node_hash
+    return node_hash
+
+
+def _hash_differs(node: 'Node[Any]', other_node: 'Node[Any]') -> bool:
+    # True when both nodes already cached their hashes and these differ;
+    # never hashes anything, so unhashable elements stay comparable
+    try:
+        return node._hash != other_node._hash
+    except AttributeError:
+        return False
+
 
-        if self._current_element_index < len(self._current_node.elements):
-            value = self._current_node.elements[self._current_element_index]
-            self._current_element_index += 1
-            return value
+def _build_summary(elements: Sequence[Any]) -> Summary:
+    # Bloom filter with 8 bits per element and one bit per hash (about 12%
+    # false positives), plus min/max bounds for plain ordered values
+    fingerprint: Optional[bytes] = None
+    try:
+        mask = (1 << (8 * len(elements) - 1).bit_length()) - 1
+        bits = bytearray((mask + 1) >> 3 or 1)
+        for position in map(mask.__and__, map(hash, elements)):
+            bits[position >> 3] |= 1 << (position & 7)
+        fingerprint = bytes(bits)
+    except TypeError:  # Unhashable element
+        pass
+    return fingerprint, _bounds(elements)
+
+
+def _bounds(values: Sequence[Any]) -> Optional[Tuple[Any, Any]]:
+    # (min, max) of values whose types all order consistently with ==
+    # NaN is unordered: min/max around it are meaningless, so values with
+    # a NaN get no bounds
+    types = set(map(type, values))
+    if values and types <= _ORDERED_TYPES:
+        if float in types and any(value != value for value in values):
+            return None
+        try:
+            return min(values), max(values)
+        except TypeError:  # Mixed, e.g. str and int
+            pass
+    return None
+
+
+def _node_summary(node: 'Node[Any]') -> Optional[Summary]:
+    # The cached summary of a node, built lazily on its
+    # _SUMMARY_AFTER_SCANS-th scan; until then only scans are counted, so
+    # one-off queries pay almost nothing. Nodes never change, so a summary
+    # stays valid and is shared by every list sharing the node
+    summary = node._summary
+    if type(summary) is tuple:
+        return cast(Summary, summary)
+    if summary + 1 < _SUMMARY_AFTER_SCANS:
+        node._summary = summary + 1
+        return None
+    built = node._summary = _build_summary(node._elements)
+    return built
+
+
+def _may_contain(summary: Summary, value: Any,
+                 value_hash: Optional[int]) -> bool:
+    # False only if the node summarized cannot hold an element == value
+    fingerprint, bounds = summary
+    if fingerprint is not None and value_hash is not None:
+        position = value_hash & (len(fingerprint) * 8 - 1)
+        if not fingerprint[position >> 3] >> (position & 7) & 1:
+            return False
+    if bounds is not None and type(value) in _ORDERED_TYPES:
+        try:
+            return bool(bounds[0] <= value <= bounds[1])
+        except TypeError:
+            pass
+    return True
+
+
+def _outside(node: 'Node[Any]', bounds: Tuple[Any, Any]) -> bool:
+    # True if the summary bounds of node do not overlap bounds
+    summary = _node_summary(node)
+    if summary is None or summary[1] is None:
+        return False
+    low, high = summary[1]
+    try:
+        return bool(high < bounds[0] or low > bounds[1])
+    except TypeError:  # str bounds against numbers
+        return False
+
+
+def _node_holding(node: Optional['Node[T]'], value: Any,
+                  node_size: int) -> Optional['Node[T]']:
+    # The first node from node on whose elements contain value (as the
+    # in operator sees it), or None. With node_size large enough, nodes
+    # whose summaries rule value out are skipped without a scan
+    if node_size < _SUMMARY_MIN_NODE_SIZE:
+        while node is not None:
+            if value in node._elements:
+                return node
+            node = node._next
+        return None
+
+    try:
+        value_hash: Optional[int] = hash(value)
+    except TypeError:
+        value_hash = None
+    after_scans = _SUMMARY_AFTER_SCANS
+    while node is not None:
+        summary = node._summary
+        if type(summary) is not tuple:
+            if summary + 1 < after_scans:  # Inlined from _node_summary
+                node._summary = summary + 1
+                summary = None
+            else:
+                summary = _node_summary(node)
+        if summary is not None and \
+                not _may_contain(summary, value, value_hash):
+            node = node._next
+            continue
+        if value in node._elements:
+            return node
+        node = node._next
+    return None
+
+
+def _equal_elements(node: Optional['Node[T]'],
+                    other_node: Optional['Node[Any]']) -> bool:
+    # Compares the elements of two Node chains with different layouts
+    # Both chains are walked in lockstep, comparing the overlapping parts
+    # of the current nodes; a shared node at the same position means the
+    # rest of both chains is identical
+    index = other_index = 0
+    while node is not None and other_node is not None:
+        if node is other_node and index == other_index:
+            return True
+        elements = node._elements
+        other_elements = other_node._elements
+        step = min(len(elements) - index, len(other_elements) - other_index)
+        part = elements[index:index + step]
+        other_part = other_elements[other_index:other_index + step]
+        if type(part) is not type(other_part):
+            # Tuple against typed buffer, compare the plain values
+            part, other_part = tuple(part), tuple(other_part)
+        if part != other_part:
+            return False
+        index += step
+        other_index += step
+        if index == len(elements):
+            node, index = node._next, 0
+        if other_index == len(other_elements):
+            other_node, other_index = other_node._next, 0
+
+    # Whatever is left on either side must be empty nodes only
+    for rest in (node, other_node):
+        for rest_node in _iter_nodes(rest):
+            if rest_node._elements:
+                return False
+    return True
+
+
+def _copy_path(head: Optional['Node[T]'], stop: Optional['Node[T]'],
+               tail: Optional['Node[T]']) -> Optional['Node[T]']:
+    # Path copying: copies the nodes from head up to (not including) stop
+    # and links the last copy to tail. Nodes after stop are left untouched,
+    # so everything reachable from tail is shared with the original chain
+    new_head: Optional['Node[T]'] = None
+    last_copy: Optional['Node[T]'] = None
+    node = head
+    while node is not stop and node is not None:
+        node_copy = _new_node(node._elements, None)
+        if last_copy is None:
+            new_head = node_copy
         else:
-            self._current_node = self._current_node.next_node
-            self._current_element_index = 0
-            if self._current_node is None:
-                raise StopIteration  # Raise StopIteration when no more nodes
-            return self.__next__()
-            # Recursive call to get element from new node
+            last_copy._next = node_copy
+        last_copy = node_copy
+        node = node._next
+
+    if last_copy is None:
+        return tail
+    last_copy._next = tail
+    return new_head
+
+
+def _check_node_size(node_size: int) -> None:
+    # Shared validation of node_size arguments
+    if not isinstance(node_size, int) or node_size <= 0:
+        raise ValueError("node_size must be a positive integer")
+
+
+def _node_size_or_default(node_size: Optional[int]) -> int:
+    # The validated node_size, or the process-wide default for None
+    if node_size is None:
+        return _default_node_size
+    _check_node_size(node_size)
+    return node_size
+
+
+def _check_dtype(dtype: Optional[str]) -> None:
+    # Shared validation of dtype arguments
+    if dtype is not None and dtype not in _TYPECODES:
+        raise ValueError("dtype must be None, 'i8' or 'f8'")
+
+
+def _pack(values: Iterable[T], dtype: Optional[str]) -> Sequence[T]:
+    # Node storage for values: a tuple, or for numeric lists a read-only
+    # memoryview over a packed int64/float64 buffer
+    if dtype is None:
+        return tuple(values)
+    packed = array(_TYPECODES[dtype], cast(Iterable[Any], values))
+    return _typed_buffer(packed.tobytes(), dtype)
+
+
+def _typed_buffer(data: bytes, dtype: str) -> Sequence[Any]:
+    # Read-only memoryview of dtype over packed bytes, no copy
+    view: Any = memoryview(data)
+    return cast(Sequence[Any], view.cast(_TYPECODES[dtype]))
+
+
+def _dtype_of(elements: Sequence[Any]) -> Optional[str]:
+    # dtype of a node's storage, None for tuples
+    if isinstance(elements, memoryview):
+        return _DTYPES[elements.format]
+    return None
+
+
+def _join(first: Sequence[T], second: Sequence[T]) -> Sequence[T]:
+    # Joins the elements of two nodes, typed storage is kept only when
+    # both sides share the same dtype
+    if type(first) is tuple and type(second) is tuple:
+        return first + second
+    dtype = _dtype_of(first)
+    if dtype != _dtype_of(second):
+        dtype = None
+    return _pack(chain(first, second), dtype)
+
+
+def _vectorizes(unrolled_list: 'ImmutableUnrolledLinkedList[Any]',
+                func: Callable[..., Any], vectorized: bool) -> bool:
+    # True if map_list/filter call func once per node buffer: only for
+    # numeric lists with numpy installed, and only when func is known to
+    # be array-aware (vectorized=True, or a one-argument numpy ufunc).
+    # Other functions are never trial-called on arrays, they see each
+    # element exactly once whatever the node_size
+    if _numpy is None or unrolled_list._dtype is None:
+        return False
+    return vectorized or (isinstance(func, _numpy.ufunc) and func.nin == 1)
+
+
+def _apply_to_buffer(func: Callable[[Any], Any],
+                     elements: Sequence[Any]) -> Any:
+    # Calls the array-aware func once on a node viewed as a numpy array,
+    # without copying typed nodes. Returns (array, result); ValueError if
+    # func does not return an array of the same shape
+    assert _numpy is not None
+    if isinstance(elements, memoryview):
+        buffer = _numpy.frombuffer(elements, dtype=elements.format)
+    else:  # A tuple node, e.g. behind concat with an object list
+        buffer = _numpy.array(elements)
+    result = func(buffer)
+    if not isinstance(result, _numpy.ndarray) or \
+            result.shape != buffer.shape:
+        raise ValueError("a vectorized function must return an array of "
+                         "the same shape as its argument")
+    return buffer, result
+
+
+def _vectorized_map(func: Callable[[T], U],
+                    elements: Sequence[T]) -> Sequence[U]:
+    # New node storage with func applied to the whole node: typed for
+    # integer and float results, a tuple of Python values otherwise (bool
+    # results stay bool)
+    result = _apply_to_buffer(func, elements)[1]
+    kind = result.dtype.kind
+    if kind not in 'iuf':
+        return tuple(result.tolist())
+    dtype = 'f8' if kind == 'f' else 'i8'
+    return _typed_buffer(result.astype(_TYPECODES[dtype]).tobytes(), dtype)
+
+
+def _vectorized_filter(predicate: Callable[[T], bool],
+                       elements: Sequence[T]) -> List[T]:
+    # Values of the node selected by predicate applied as a boolean mask
+    buffer, mask = _apply_to_buffer(predicate, elements)
+    if mask.dtype.kind != 'b':
+        raise ValueError("a vectorized predicate must return a boolean "
+                         "array")
+    return cast(List[T], buffer[mask].tolist())
+
+
+def _node_reducer(
+        func: Callable[[U, U], U]) -> Optional[Callable[[Any], Any]]:
+    # Whole-node reduction matching func, None when func is unknown
+    try:
+        node_reducer = _NODE_REDUCERS.get(func)
+    except TypeError:  # Unhashable callable
+        return None
+    if node_reducer is None and _numpy is not None and \
+            isinstance(func, _numpy.ufunc) and func.nin == 2:
+        def node_reducer(elements: Any) -> Any:
+            buffer = _numpy.frombuffer(elements, dtype=elements.format)
+            return func.reduce(buffer).item()
+    return node_reducer
+
+
+def _new_node(elements: Sequence[T],
+              next_node: Optional['Node[T]']) -> 'Node[T]':
+    # Fast internal Node constructor used in the inner loops
+    # Skips __init__ (elements are already a tuple) and the subscripted
+    # generic alias, whose call costs more than building the node itself
+    node: 'Node[T]' = _object_new(Node)
+    node._elements = elements
+    node._next = next_node
+    node._summary = 0
+    return node
+
+
+def _new_list(head_node: Optional['Node[T]'], node_size: int,
+              count: Optional[int],
+              dtype: Optional[str] = None) -> 'ImmutableUnrolledLinkedList[T]':
+    # Fast internal list constructor, node_size is already validated and
+    # count is the known element count (None if not known). Every finished
+    # list passes here, so this is where interning takes its nodes
+    if _interning and head_node is not None:
+        head_node = _interned(head_node)
+    unrolled_list: 'ImmutableUnrolledLinkedList[T]' = _object_new(
+        ImmutableUnrolledLinkedList)
+    unrolled_list._head_node = head_node
+    unrolled_list._node_size = node_size
+    unrolled_list._length = count
+    unrolled_list._offsets = None
+    unrolled_list._index_nodes = None
+    unrolled_list._dtype = dtype
+    return unrolled_list
+
+
+def _length_after(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+                  delta: int) -> Optional[int]:
+    # Element count of a new version that differs by delta elements,
+    # None if the count of the original has not been computed yet
+    if unrolled_list._length is None:
+        return None
+    return unrolled_list._length + delta
 
 
 def cons(
@@ -123,215 +639,720 @@ def cons(
     unrolled_list: Optional['ImmutableUnrolledLinkedList[T]'] = None
 ) -> 'ImmutableUnrolledLinkedList[T]':
     # Adds a new element to the head of the ImmutableUnrolledLinkedList
-    node_size = unrolled_list.node_size if unrolled_list else 4
+    if unrolled_list is None:
+        return _new_list(_new_node((head_value, ), None),
+                         _default_node_size, 1)
 
-    if not unrolled_list or unrolled_list.head_node is None:  # Empty list case
-        return ImmutableUnrolledLinkedList[T](Node([head_value], None),
-                                              node_size)
+    node_size = unrolled_list._node_size
+    dtype = unrolled_list._dtype
+    head_node = unrolled_list._head_node
 
-    head_node = unrolled_list.head_node
+    if head_node is None:  # Empty list case
+        return _new_list(_new_node(_pack((head_value, ), dtype), None),
+                         node_size, 1, dtype)
 
-    if len(head_node.elements) < node_size:  # Head node not full
+    head_elements = head_node._elements
+    if len(head_elements) < node_size:  # Head node not full
         # Create new tuple with prepended element
-        new_elements = (head_value, ) + head_node.elements
+        if type(head_elements) is tuple:
+            new_elements: Sequence[T] = (head_value, ) + head_elements
+        else:
+            new_elements = _pack(chain((head_value, ), head_elements),
+                                 _dtype_of(head_elements))
         # Create new head node
-        new_head_node = Node[T](new_elements, head_node.next_node)
-        # Return new list with new head
-        return ImmutableUnrolledLinkedList[T](new_head_node, node_size)
+        new_head_node = _new_node(new_elements, head_node._next)
     else:  # Head node is full, create a new node and prepend
         # Create new node pointing to old head
-        new_head_node = Node[T]([head_value], head_node)
-        # Return new list
-        return ImmutableUnrolledLinkedList[T](new_head_node, node_size)
+        new_head_node = _new_node(_pack((head_value, ), dtype), head_node)
+    # Return new list with new head, one element longer
+    return _new_list(new_head_node, node_size,
+                     _length_after(unrolled_list, 1), dtype)
+
+
+def _prepend_packed(values: Sequence[T], node_size: int,
+                    dtype: Optional[str],
+                    tail: Optional['Node[T]']) -> Optional['Node[T]']:
+    # Links values in front of tail in packed nodes, built back to front
+    # Every new node is full except the first, which takes the remainder
+    # and is the one later cons() calls fill up
+    for end in range(len(values), 0, -node_size):
+        tail = _new_node(_pack(values[max(end - node_size, 0):end], dtype),
+                         tail)
+    return tail
+
+
+def cons_many(
+    values: Iterable[T],
+    unrolled_list: Optional['ImmutableUnrolledLinkedList[T]'] = None
+) -> 'ImmutableUnrolledLinkedList[T]':
+    # Prepends all values at once, keeping their order: the result holds
+    # values followed by the elements of unrolled_list
+    # The batch is packed into full nodes, a partly filled head node is
+    # merged in, and the rest of the list is shared
+    if unrolled_list is None:
+        unrolled_list = empty()
+    batch = list(values)
+    if not batch:
+        return unrolled_list
+
+    node_size = unrolled_list._node_size
+    dtype = unrolled_list._dtype
+    added = len(batch)
+    tail = unrolled_list._head_node
+    if tail is not None and len(tail._elements) < node_size:
+        # Head node not full, repack its elements behind the batch
+        batch.extend(tail._elements)
+        tail = tail._next
+    head_node = _prepend_packed(batch, node_size, dtype, tail)
+    return _new_list(head_node, node_size,
+                     _length_after(unrolled_list, added), dtype)
 
 
 def remove(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
            element: T) -> 'ImmutableUnrolledLinkedList[T]':
     # Removes the first occurrence of an element from the IULL
-    if not unrolled_list or unrolled_list.head_node is None:
+    if unrolled_list is None or unrolled_list._head_node is None:
         return unrolled_list  # Return original empty list if empty
 
-    def _remove_recursive(current_node: Optional['Node[T]'],
-                          element_to_remove: T) -> Optional['Node[T]']:
-        if current_node is None:
-            return None  # Base case: element not found
-
-        # Work with a mutable list for now
-        current_elements = list(current_node.elements)
-        removed_index = -1
-        for i in range(len(current_elements)):
-            if current_elements[i] == element_to_remove:
-                removed_index = i
-                break
-
-        if removed_index != -1:  # Element found in current node
-            remaining_elements = current_elements[:removed_index] + \
-                current_elements[removed_index+1:]
-            if remaining_elements:  # Node still has elements
-                return Node[T](tuple(remaining_elements),
-                               current_node.next_node)
-            else:  # Node becomes empty, skip this node
-                # Return the rest of the list (tail)
-                return current_node.next_node
-        else:  # Element not found in current node, recurse
-            next_node_recursive = _remove_recursive(current_node.next_node,
-                                                    element_to_remove)
-            if next_node_recursive == current_node.next_node:
-                return current_node  # tail no change, reuse current node
-            else:  # create a new node linking to the modified tail
-                # Create new node linking to modified tail
-                return Node[T](current_node.elements, next_node_recursive)
-
-    modified_head_node = _remove_recursive(unrolled_list.head_node, element)
-    if modified_head_node == unrolled_list.head_node:
-        return unrolled_list  # No change in head, reuse original list
-    elif modified_head_node is None and unrolled_list.head_node is not None:
+    # Find the node holding the first occurrence
+    current_node = _node_holding(unrolled_list._head_node, element,
+                                 unrolled_list._node_size)
+    if current_node is None:
+        return unrolled_list  # Element not found, reuse original list
+
+    current_elements = current_node._elements
+    if type(current_elements) is tuple:
+        removed_index = current_elements.index(element)
+        remaining_elements: Sequence[T] = \
+            current_elements[:removed_index] + \
+            current_elements[removed_index + 1:]
+    else:  # Typed buffer, rebuilt without the element
+        values = list(current_elements)
+        del values[values.index(element)]
+        remaining_elements = _pack(values, _dtype_of(current_elements))
+    if remaining_elements:  # Node still has elements
+        replacement: Optional['Node[T]'] = _new_node(remaining_elements,
+                                                     current_node._next)
+    else:  # Node becomes empty, skip this node
+        replacement = current_node._next
+
+    # Copy only the nodes in front of the modified one, share the tail
+    modified_head_node = _copy_path(unrolled_list._head_node, current_node,
+                                    replacement)
+    if modified_head_node is None:
         # Handle case where head node becomes empty
-        return empty(unrolled_list.node_size)
+        return empty(unrolled_list._node_size, unrolled_list._dtype)
     else:  # Head changed, return new list with modified head
-        return ImmutableUnrolledLinkedList[T](modified_head_node,
-                                              unrolled_list.node_size)
+        return _new_list(modified_head_node, unrolled_list._node_size,
+                         _length_after(unrolled_list, -1),
+                         unrolled_list._dtype)
+
+
+def _remove_matching(
+    unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+    matches: Callable[[T], bool],
+    limit: Optional[int] = None,
+    skip_to: Optional[Callable[['Node[T]'], Optional['Node[T]']]] = None
+) -> 'ImmutableUnrolledLinkedList[T]':
+    # Removes the elements for which matches() is true (at most limit of
+    # them) in one pass. The unmodified nodes since the last edit are only
+    # remembered: on the next edit they are copied in front of it, after
+    # the pass they are the shared suffix, so only the nodes up to the
+    # last modified one are copied. Neighbouring chunks that fit into one
+    # node together are merged to keep the fill high. skip_to(node), if
+    # given, returns the first node from node on that may hold a match
+    if unrolled_list is None or unrolled_list._head_node is None:
+        return unrolled_list
+    node_size = unrolled_list._node_size
+    chunks: List[Sequence[T]] = []  # Element chunks of the copied nodes
+    left = limit
+    removed = 0
+    # Start of the current run of unmodified nodes
+    run_start: Optional['Node[T]'] = unrolled_list._head_node
+    node = run_start
+
+    def _add(chunk: Sequence[T]) -> None:
+        if chunks and len(chunks[-1]) + len(chunk) <= node_size:
+            chunks[-1] = list(chunks[-1]) + list(chunk)
+        elif chunk:
+            chunks.append(chunk)
+
+    while node is not None and left != 0:
+        if skip_to is not None:
+            node = skip_to(node)
+            if node is None:
+                break
+        elements = node._elements
+        if left is None:
+            kept = [value for value in elements if not matches(value)]
+        else:
+            kept = []
+            for value in elements:
+                if left and matches(value):
+                    left -= 1
+                else:
+                    kept.append(value)
+        if len(kept) == len(elements):
+            node = node._next
+            continue
+        removed += len(elements) - len(kept)
+        # Copy the unmodified run in front of the edited node
+        while run_start is not node:
+            assert run_start is not None
+            _add(run_start._elements)
+            run_start = run_start._next
+        _add(kept)
+        node = run_start = node._next
+
+    if not removed:
+        return unrolled_list
+    tail = run_start
+    if tail is not None and chunks and \
+            len(chunks[-1]) + len(tail._elements) <= node_size:
+        # The first shared node fits into the last copy, merge them
+        _add(tail._elements)
+        tail = tail._next
+    dtype = unrolled_list._dtype
+    for chunk in reversed(chunks):
+        if type(chunk) is list:  # Merged or edited, back to node storage
+            chunk = _pack(chunk, dtype)
+        tail = _new_node(chunk, tail)
+    return _new_list(tail, node_size,
+                     _length_after(unrolled_list, -removed), dtype)
+
+
+def remove_all(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+               values: Iterable[T]) -> 'ImmutableUnrolledLinkedList[T]':
+    # Removes every element that is equal to one of values, in one pass
+    # values are indexed once like intersection() does, and for lists
+    # with node summaries nodes outside the bounds of values are skipped
+    values = list(values)
+    if not values:
+        return unrolled_list
+    is_member = _membership_test(values, False)
+    bounds = _bounds(values) if unrolled_list is not None and \
+        unrolled_list._node_size >= _SUMMARY_MIN_NODE_SIZE else None
+
+    def _inside(node: 'Node[T]') -> Optional['Node[T]']:
+        current: Optional['Node[T]'] = node
+        while current is not None and bounds is not None and \
+                _outside(current, bounds):
+            current = current._next
+        return current
+
+    return _remove_matching(unrolled_list, is_member,
+                            skip_to=None if bounds is None else _inside)
+
+
+def remove_where(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+                 predicate: Callable[[T], bool]
+                 ) -> 'ImmutableUnrolledLinkedList[T]':
+    # Removes every element that satisfies predicate, in one pass
+    return _remove_matching(unrolled_list, predicate)
+
+
+def remove_first_n(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+                   element: T, n: int) -> 'ImmutableUnrolledLinkedList[T]':
+    # Removes the first n occurrences of element (all of them if there
+    # are fewer) in one pass that stops after the n-th; nodes without
+    # element are skipped like in remove()
+    if not isinstance(n, int) or n < 0:
+        raise ValueError("n must be a non-negative integer")
+    if n == 0 or unrolled_list is None:
+        return unrolled_list
+
+    def _is_element(value: T) -> bool:
+        # Same test as the in operator and tuple.index
+        return value is element or value == element
+
+    node_size = unrolled_list._node_size
+    return _remove_matching(
+        unrolled_list, _is_element, n,
+        lambda node: _node_holding(node, element, node_size))
 
 
 def length(unrolled_list: Optional['ImmutableUnrolledLinkedList[T]']) -> int:
     # Returns the length of the ImmutableUnrolledLinkedList
-    if not unrolled_list or unrolled_list.head_node is None:
+    # The count is computed at most once per list and cached on it
+    if unrolled_list is None or unrolled_list._head_node is None:
         return 0
 
-    def _length_recursive(current_node: Optional['Node[T]']) -> int:
-        if current_node is None:
-            return 0
-        return len(current_node.elements) + _length_recursive(
-            current_node.next_node)
-
-    return _length_recursive(unrolled_list.head_node)
+    if unrolled_list._length is None:
+        unrolled_list._length = sum(
+            len(node._elements)
+            for node in _iter_nodes(unrolled_list._head_node))
+    return unrolled_list._length
+
+
+def repack(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+           node_size: Optional[int] = None
+           ) -> 'ImmutableUnrolledLinkedList[T]':
+    # Rebuilds a fragmented list into full nodes of node_size elements
+    # (default: the list's own node size). The longest suffix that is
+    # already packed (full nodes, only the last one may be partly filled)
+    # is shared, only the nodes in front of it are rebuilt. Like cons_many
+    # the rebuilt part puts its remainder in the head node, which is
+    # accepted as packed too, so repacking twice returns the same list
+    if node_size is None:
+        node_size = unrolled_list._node_size
+    _check_node_size(node_size)
+    dtype = unrolled_list._dtype
+    head = unrolled_list._head_node
+
+    packed_suffix: Optional['Node[T]'] = None
+    for current_node in _iter_nodes(head):
+        size = len(current_node._elements)
+        if size == node_size or (0 < size < node_size and (
+                current_node is head or current_node._next is None)):
+            if packed_suffix is None:
+                packed_suffix = current_node
+        else:
+            packed_suffix = None
+
+    if packed_suffix is head and node_size == unrolled_list._node_size:
+        return unrolled_list  # Already packed
+    prefix: List[T] = []
+    for current_node in _iter_nodes(head):
+        if current_node is packed_suffix:
+            break
+        prefix.extend(current_node._elements)
+    head_node = _prepend_packed(prefix, node_size, dtype, packed_suffix)
+    return _new_list(head_node, node_size, unrolled_list._length, dtype)
+
+
+def node_fill_stats(
+        unrolled_list: 'ImmutableUnrolledLinkedList[T]') -> Dict[str, float]:
+    # Node-fill statistics of a list, to decide when repack() pays off:
+    # node and element counts, full and empty nodes, and fill_ratio, the
+    # share of node slots in use (1.0 for a fully packed list)
+    nodes = full_nodes = empty_nodes = elements = 0
+    node_size = unrolled_list._node_size
+    for current_node in _iter_nodes(unrolled_list._head_node):
+        size = len(current_node._elements)
+        nodes += 1
+        elements += size
+        if size >= node_size:
+            full_nodes += 1
+        elif size == 0:
+            empty_nodes += 1
+    return {
+        "nodes": nodes,
+        "elements": elements,
+        "full_nodes": full_nodes,
+        "empty_nodes": empty_nodes,
+        "fill_ratio": elements / (nodes * node_size) if nodes else 1.0,
+    }
+
+
+def nth(unrolled_list: 'ImmutableUnrolledLinkedList[T]', index: int) -> T:
+    # Returns the element at index, negative indices count from the end
+    # Uses the list's skip index to jump to the right node in O(log n)
+    count = length(unrolled_list)
+    if index < 0:
+        index += count
+    if index < 0 or index >= count:
+        raise IndexError("ImmutableUnrolledLinkedList index out of range")
+
+    offsets, index_nodes = _skip_index(unrolled_list)
+    position = bisect_right(offsets, index) - 1
+    return index_nodes[position]._elements[index - offsets[position]]
+
+
+def _skip_index(unrolled_list: 'ImmutableUnrolledLinkedList[T]'
+                ) -> Tuple[List[int], List['Node[T]']]:
+    # The list's skip index: the start offset of every non-empty node and
+    # the matching nodes. Built once, the list never changes afterwards
+    if unrolled_list._offsets is None or unrolled_list._index_nodes is None:
+        offsets: List[int] = []
+        index_nodes: List['Node[T]'] = []
+        offset = 0
+        for node in _iter_nodes(unrolled_list._head_node):
+            if node._elements:  # Empty nodes can never hold an index
+                offsets.append(offset)
+                index_nodes.append(node)
+                offset += len(node._elements)
+        unrolled_list._offsets = offsets
+        unrolled_list._index_nodes = index_nodes
+    return unrolled_list._offsets, unrolled_list._index_nodes
+
+
+def _checked_index(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+                   index: int) -> int:
+    # index with negative values counted from the end
+    if not isinstance(index, int):
+        raise TypeError("list indices must be integers")
+    if index < 0:
+        index += length(unrolled_list)
+        if index < 0:
+            raise IndexError(
+                "ImmutableUnrolledLinkedList index out of range")
+    return index
+
+
+def _node_at(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+             index: int) -> Optional[Tuple['Node[T]', int]]:
+    # The node holding the element at index (>= 0) and the position inside
+    # it, None past the end. Uses the skip index when nth() has built one,
+    # otherwise walks from the head in O(index / node_size)
+    offsets, index_nodes = unrolled_list._offsets, unrolled_list._index_nodes
+    if offsets is not None and index_nodes is not None:
+        if not index_nodes:
+            return None
+        position = bisect_right(offsets, index) - 1
+        node = index_nodes[position]
+        index -= offsets[position]
+        return (node, index) if index < len(node._elements) else None
+    for node in _iter_nodes(unrolled_list._head_node):
+        size = len(node._elements)
+        if index < size:
+            return node, index
+        index -= size
+    return None
+
+
+def _replaced(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+              node: 'Node[T]', replacement: Optional['Node[T]'],
+              delta: int) -> 'ImmutableUnrolledLinkedList[T]':
+    # New version with node replaced by the chain from replacement: the
+    # nodes in front of node are path-copied, the rest is shared
+    head_node = _copy_path(unrolled_list._head_node, node, replacement)
+    return _new_list(head_node, unrolled_list._node_size,
+                     _length_after(unrolled_list, delta),
+                     unrolled_list._dtype)
+
+
+def set_at(unrolled_list: 'ImmutableUnrolledLinkedList[T]', index: int,
+           value: T) -> 'ImmutableUnrolledLinkedList[T]':
+    # New list with the element at index replaced by value. Copies the
+    # node holding index and the node shells in front of it, shares the
+    # rest, so a point update costs O(index / node_size)
+    found = _node_at(unrolled_list, _checked_index(unrolled_list, index))
+    if found is None:
+        raise IndexError("ImmutableUnrolledLinkedList index out of range")
+    node, position = found
+    elements = node._elements
+    if type(elements) is tuple:
+        new_elements: Sequence[T] = \
+            elements[:position] + (value, ) + elements[position + 1:]
+    else:  # Typed buffer, rebuilt with the new value
+        values = list(elements)
+        values[position] = value
+        new_elements = _pack(values, _dtype_of(elements))
+    return _replaced(unrolled_list, node,
+                     _new_node(new_elements, node._next), 0)
+
+
+def insert_at(unrolled_list: 'ImmutableUnrolledLinkedList[T]', index: int,
+              value: T) -> 'ImmutableUnrolledLinkedList[T]':
+    # New list with value inserted before index (index == length appends),
+    # negative indices count from the end. A node that overflows is split
+    # into two halves; only the nodes up to it are copied
+    index = _checked_index(unrolled_list, index)
+    found = _node_at(unrolled_list, index)
+    if found is None:  # Past the end, only valid as an append
+        if index != length(unrolled_list):
+            raise IndexError(
+                "ImmutableUnrolledLinkedList index out of range")
+        last_node = None
+        for last_node in _iter_nodes(unrolled_list._head_node):
+            pass
+        if last_node is None:
+            return cons(value, unrolled_list)
+        found = last_node, len(last_node._elements)
+    node, position = found
+    values = list(node._elements)
+    values.insert(position, value)
+    dtype = _dtype_of(node._elements)
+    if len(values) <= unrolled_list._node_size:
+        replacement = _new_node(_pack(values, dtype), node._next)
+    else:  # Split the overfull node in two halves
+        half = len(values) // 2
+        replacement = _new_node(
+            _pack(values[:half], dtype),
+            _new_node(_pack(values[half:], dtype), node._next))
+    return _replaced(unrolled_list, node, replacement, 1)
+
+
+def delete_at(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+              index: int) -> 'ImmutableUnrolledLinkedList[T]':
+    # New list without the element at index. An emptied node is dropped,
+    # and a node that now fits together with the next one is merged with
+    # it; only the nodes up to there are copied
+    found = _node_at(unrolled_list, _checked_index(unrolled_list, index))
+    if found is None:
+        raise IndexError("ImmutableUnrolledLinkedList index out of range")
+    node, position = found
+    values = list(node._elements)
+    del values[position]
+    remaining = _pack(values, _dtype_of(node._elements))
+    next_node = node._next
+    replacement: Optional['Node[T]']
+    if not values:  # Node becomes empty, skip it
+        replacement = next_node
+    elif next_node is not None and len(values) + len(
+            next_node._elements) <= unrolled_list._node_size:
+        replacement = _new_node(_join(remaining, next_node._elements),
+                                next_node._next)
+    else:
+        replacement = _new_node(remaining, next_node)
+    return _replaced(unrolled_list, node, replacement, -1)
 
 
 def member(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
            element: T) -> bool:
     # Checks if an element is a member of the ImmutableUnrolledLinkedList
-    if not unrolled_list or unrolled_list.head_node is None:
+    if unrolled_list is None or unrolled_list._head_node is None:
         return False
 
-    def _member_recursive(current_node: Optional['Node[T]'],
-                          element_to_find: T) -> bool:
-        if current_node is None:
-            return False
-        if element_to_find in current_node.elements:
-            return True
-        return _member_recursive(current_node.next_node, element_to_find)
-
-    return _member_recursive(unrolled_list.head_node, element)
+    return _node_holding(unrolled_list._head_node, element,
+                         unrolled_list._node_size) is not None
 
 
 def reverse(
     unrolled_list: 'ImmutableUnrolledLinkedList[T]'
 ) -> 'ImmutableUnrolledLinkedList[T]':
     """Reverses the ImmutableUnrolledLinkedList."""
-    if not unrolled_list or unrolled_list.head_node is None:
+    if unrolled_list is None or unrolled_list._head_node is None:
         return unrolled_list  # Return original empty list if empty
 
-    def _reverse_recursive(
-            current_node: Optional['Node[T]'],
-            accumulated_list: Optional['Node[T]']) -> Optional['Node[T]']:
-        if current_node is None:
-            return accumulated_list
+    # Single pass from the front: the first elements of the list end up in
+    # the last node of the result, so the result is built tail first.
+    # The first chunk takes the remainder, every later one is a full node,
+    # which gives the same packed layout as from_list on reversed values
+    node_size = unrolled_list._node_size
+    dtype = unrolled_list._dtype
+    chunk_size = length(unrolled_list) % node_size or node_size
+    pending: List[T] = []
+    reversed_head_node: Optional['Node[T]'] = None
+    for current_node in _iter_nodes(unrolled_list._head_node):
+        pending.extend(current_node._elements)
+        while len(pending) >= chunk_size:
+            # Reverse the chunk and prepend it to the result
+            reversed_head_node = _new_node(
+                _pack(pending[chunk_size - 1::-1], dtype), reversed_head_node)
+            del pending[:chunk_size]
+            chunk_size = node_size
+
+    return _new_list(reversed_head_node, node_size, unrolled_list._length,
+                     dtype)
+
+
+def _membership_test(values: List[T],
+                     multiset: bool) -> Callable[[T], bool]:
+    # Builds a one-off "is val in values" test for intersection
+    # Hashable values are looked up in a set (or Counter for multiset),
+    # unhashable but orderable ones are bisected in a sorted copy, and
+    # anything else falls back to a linear scan. Probes that the fast
+    # structure cannot handle fall back to the linear scan on their own
+    remaining = list(values)  # Multiset: values not matched yet
+
+    def _linear(val: T) -> bool:
+        if not multiset:
+            return val in values
+        try:
+            remaining.remove(val)  # Consume one equal value
+        except ValueError:
+            return False
+        return True
+
+    try:
+        counts = Counter(values)
+    except TypeError:
+        pass
+    else:
+        def _hashed(val: T) -> bool:
+            try:
+                if not multiset:
+                    return val in counts
+                if counts[val] <= 0:
+                    return False
+            except TypeError:  # Unhashable probe
+                return _linear(val)
+            counts[val] -= 1
+            return True
 
-        reversed_current_node_values = reversed(
-            current_node.elements)  # Reverse elements in current node
-        reversed_node = from_list(
-            list(reversed_current_node_values), unrolled_list.node_size
-        ).head_node  # Create node from reversed values
+        return _hashed
+
+    sorted_values: List[Any] = list(values)
+    try:
+        sorted_values.sort()
+    except TypeError:
+        return _linear
+
+    taken: Dict[int, int] = {}  # Multiset: matches used per equal run
+
+    def _bisected(val: T) -> bool:
+        try:
+            start = bisect_left(sorted_values, val)
+        except TypeError:  # Probe not comparable with the values
+            return _linear(val)
+        position = start + taken.get(start, 0) if multiset else start
+        if position < len(sorted_values) and \
+                sorted_values[position] == val:
+            if multiset:
+                taken[start] = taken.get(start, 0) + 1
+            return True
+        return False
 
-        return _reverse_recursive(
-            current_node.next_node,
-            concat_nodes(reversed_node,
-                         accumulated_list))  # Prepend reversed node
+    return _bisected
 
-    reversed_head_node = _reverse_recursive(unrolled_list.head_node, None)
-    return ImmutableUnrolledLinkedList[T](reversed_head_node,
-                                          unrolled_list.node_size)
+
+def reverse_iterator(
+        unrolled_list: 'ImmutableUnrolledLinkedList[T]') -> Iterator[T]:
+    # Yields the elements from back to front without building a new list
+    # Only the node references are collected, one per node
+    if unrolled_list is None:
+        return
+    nodes = list(_iter_nodes(unrolled_list._head_node))
+    for current_node in reversed(nodes):
+        yield from reversed(current_node._elements)
 
 
 def intersection(
     unrolled_list1: 'ImmutableUnrolledLinkedList[T]',
-    unrolled_list2: 'ImmutableUnrolledLinkedList[T]'
+    unrolled_list2: 'ImmutableUnrolledLinkedList[T]',
+    multiset: bool = False
 ) -> 'ImmutableUnrolledLinkedList[T]':
     # Returns the intersection of two ImmutableUnrolledLinkedLists
-    if (not unrolled_list1 or not unrolled_list2
-            or unrolled_list1.head_node is None
-            or unrolled_list2.head_node is None):
+    # Keeps list1's order and duplicates: every element of list1 that is
+    # a member of list2 is kept. With multiset=True each element of list2
+    # can be matched only once, so counts are min(count1, count2)
+    if (unrolled_list1 is None or unrolled_list2 is None
+            or unrolled_list1._head_node is None
+            or unrolled_list2._head_node is None):
         # Return empty list
-        return ImmutableUnrolledLinkedList[T](
-            None, unrolled_list1.node_size
-            if unrolled_list1 else unrolled_list2.node_size)
+        if unrolled_list1 is None:
+            return empty(unrolled_list2._node_size, unrolled_list2._dtype)
+        return empty(unrolled_list1._node_size, unrolled_list1._dtype)
 
+    # list2 is indexed once instead of being scanned per element
+    values2 = to_list(unrolled_list2)
+    is_member = _membership_test(values2, multiset)
     intersection_values: List[T] = []
-
-    def _intersection_recursive(current_node: Optional['Node[T]']) -> None:
-        if current_node is None:
-            return
-
-        for val in current_node.elements:
-            if member(unrolled_list2, val):
+    # Nodes of list1 whose summary bounds lie outside list2's range are
+    # skipped without probing their elements
+    bounds2 = _bounds(values2) if \
+        unrolled_list1._node_size >= _SUMMARY_MIN_NODE_SIZE else None
+
+    for current_node in _iter_nodes(unrolled_list1._head_node):
+        if bounds2 is not None and _outside(current_node, bounds2):
+            continue
+        for val in current_node._elements:
+            if is_member(val):
                 intersection_values.append(val)
-        _intersection_recursive(current_node.next_node)  # Recurse
 
-    _intersection_recursive(unrolled_list1.head_node)
-    intersection_head_node = from_list(intersection_values,
-                                       unrolled_list1.node_size).head_node
-    return ImmutableUnrolledLinkedList[T](intersection_head_node,
-                                          unrolled_list1.node_size)
+    return from_list(intersection_values, unrolled_list1._node_size,
+                     unrolled_list1._dtype)
 
 
 def to_list(unrolled_list: 'ImmutableUnrolledLinkedList[T]') -> List[T]:
     # Converts the ImmutableUnrolledLinkedList to a list
     res: List[T] = []
-    if not unrolled_list or unrolled_list.head_node is None:
+    if unrolled_list is None or unrolled_list._head_node is None:
         return res  # Return empty list if empty
 
-    def _to_list_recursive(current_node: Optional['Node[T]']) -> None:
-        if current_node is None:
-            return
-        res.extend(list(current_node.elements))
-        _to_list_recursive(current_node.next_node)
-
-    _to_list_recursive(unrolled_list.head_node)
+    for current_node in _iter_nodes(unrolled_list._head_node):
+        res.extend(current_node._elements)
     return res
 
 
 def from_list(python_list: List[T],
-              node_size: int = 4) -> ImmutableUnrolledLinkedList[T]:
+              node_size: Union[int, str, None] = None,
+              dtype: Optional[str] = None) -> ImmutableUnrolledLinkedList[T]:
     # Creates an ImmutableUnrolledLinkedList from a list
-    if not python_list:
-        return ImmutableUnrolledLinkedList[T](None, node_size)
-
-    head_node = None
-    current_node_values: List[T] = []
+    # dtype='i8' or 'f8' builds a numeric list whose nodes hold packed
+    # int64/float64 buffers instead of tuples of Python objects
+    # node_size='auto' picks a size from the length and element type
+    _check_dtype(dtype)
+    if node_size == 'auto':
+        node_size = _auto_node_size(python_list, dtype)
+    node_size = _node_size_or_default(cast(Optional[int], node_size))
+    head_node: Optional['Node[T]'] = None
     current_node_pointer: Optional['Node[T]'] = None
 
-    for item in python_list:
-        current_node_values.append(item)
-        if len(current_node_values) == node_size:
-            new_node = Node[T](tuple(current_node_values), None)
-            if head_node is None:
-                head_node = new_node
-                current_node_pointer = head_node
-            else:
-                if current_node_pointer is not None:
-                    current_node_pointer._next = new_node
-                current_node_pointer = new_node
-            current_node_values = []
-
-    if current_node_values:  # Remaining elements
-        new_node = Node[T](tuple(current_node_values), None)
-        if head_node is None:
+    # Slice node-sized chunks, linking each new node behind the last one
+    for start in range(0, len(python_list), node_size):
+        chunk = python_list[start:start + node_size]
+        new_node = _new_node(
+            tuple(chunk) if dtype is None else _pack(chunk, dtype), None)
+        if current_node_pointer is None:
             head_node = new_node
         else:
-            if current_node_pointer is not None:
-                current_node_pointer._next = new_node
+            current_node_pointer._next = new_node
+        current_node_pointer = new_node
+
+    return _new_list(head_node, node_size, len(python_list), dtype)
 
-    return ImmutableUnrolledLinkedList[T](head_node, node_size)
+
+def _build_from_chunks(chunks: Iterable[Sequence[T]], node_size: int,
+                       dtype: Optional[str] = None
+                       ) -> ImmutableUnrolledLinkedList[T]:
+    # Builds a packed list from a stream of element chunks of any size
+    # Only one node worth of pending elements is held at a time
+    head_node: Optional['Node[T]'] = None
+    current_node_pointer: Optional['Node[T]'] = None
+    pending: List[T] = []
+    count = 0
+
+    def _link(node_elements: Sequence[T]) -> None:
+        nonlocal head_node, current_node_pointer
+        new_node = _new_node(node_elements, None)
+        if current_node_pointer is None:
+            head_node = new_node
+        else:
+            current_node_pointer._next = new_node
+        current_node_pointer = new_node
+
+    for chunk in chunks:
+        count += len(chunk)
+        if not pending and len(chunk) == node_size and (
+                type(chunk) is tuple if dtype is None else
+                _dtype_of(chunk) == dtype):
+            _link(chunk)  # Already a full node in the right storage
+            continue
+        pending.extend(chunk)
+        if len(pending) >= node_size:
+            full = len(pending) - len(pending) % node_size
+            for start in range(0, full, node_size):
+                _link(_pack(pending[start:start + node_size], dtype))
+            del pending[:full]
+    if pending:  # Remaining elements
+        _link(_pack(pending, dtype))
+
+    return _new_list(head_node, node_size, count, dtype)
+
+
+def from_iterable(iterable: Iterable[T],
+                  node_size: Optional[int] = None,
+                  dtype: Optional[str] = None
+                  ) -> ImmutableUnrolledLinkedList[T]:
+    # Creates an ImmutableUnrolledLinkedList from any iterable (generators,
+    # file readers, ...), consumed one node-sized chunk at a time, so no
+    # full Python list of the input is ever built
+    node_size = _node_size_or_default(node_size)
+    _check_dtype(dtype)
+    values = iter(iterable)
+
+    def _node_chunks() -> Iterator[Sequence[T]]:
+        while True:
+            chunk = _pack(islice(values, node_size), dtype)
+            if not chunk:
+                return
+            yield chunk
+
+    return _build_from_chunks(_node_chunks(), node_size, dtype)
+
+
+def iter_chunks(
+        unrolled_list: 'ImmutableUnrolledLinkedList[T]'
+) -> Iterator[Sequence[T]]:
+    # Yields the elements of every node as stored (a tuple, or a read-only
+    # buffer for numeric lists), front to back and without copying
+    if unrolled_list is None:
+        return
+    for current_node in _iter_nodes(unrolled_list._head_node):
+        if current_node._elements:
+            yield current_node._elements
 
 
 def find(
@@ -340,107 +1361,370 @@ def find(
 ) -> Tuple[bool, Optional[T]]:  # Changed return type
     # Finds the first element that satisfies the predicate in the IULL
     # Returns a tuple: (found: bool, value: Optional[T])
-    if not unrolled_list or unrolled_list.head_node is None:
+    if unrolled_list is None or unrolled_list._head_node is None:
         return False, None  # Indicate not found
 
-    def _find_recursive(
-        current_node: Optional['Node[T]'], predicate_func: Callable[[T], bool]
-    ) -> Tuple[bool,
-               Optional[T]]:  # Changed return type for recursive function
-        if current_node is None:
-            return False, None  # Base case: Not found in this branch
-
-        for value in current_node.elements:
-            if predicate_func(value):
+    # An equality predicate, functools.partial(operator.eq, x), only looks
+    # at the nodes holding x, found like member() finds them
+    if isinstance(predicate, functools.partial) and \
+            predicate.func is operator.eq and \
+            len(predicate.args) == 1 and not predicate.keywords:
+        wanted, node_size = predicate.args[0], unrolled_list._node_size
+        node = _node_holding(unrolled_list._head_node, wanted, node_size)
+        while node is not None:
+            for value in node._elements:
+                if predicate(value):
+                    return True, value
+            node = _node_holding(node._next, wanted, node_size)
+        return False, None
+
+    for current_node in _iter_nodes(unrolled_list._head_node):
+        for value in current_node._elements:
+            if predicate(value):
                 return True, value  # Found element, return (True, element)
 
-        # Recurse if not found in current node
-        return _find_recursive(
-            current_node.next_node,
-            predicate_func)  # Propagate result from recursive call
-
-    return _find_recursive(unrolled_list.head_node, predicate)
+    return False, None  # Not found in any node
 
 
 def filter(unrolled_list: ImmutableUnrolledLinkedList[T],
-           predicate: Callable[[T], bool]) -> 'ImmutableUnrolledLinkedList[T]':
+           predicate: Callable[[T], bool],
+           vectorized: bool = False) -> 'ImmutableUnrolledLinkedList[T]':
     # Filters the ImmutableUnrolledLinkedList based on a predicate
-    if not unrolled_list or unrolled_list.head_node is None:
+    # vectorized=True: predicate is array-aware, numeric lists call it once
+    # per node buffer and keep the values where it returns True
+    if unrolled_list is None or unrolled_list._head_node is None:
         return unrolled_list  # Return original empty list if empty
 
     filtered_values: List[T] = []
-
-    def _filter_recursive(current_node: Optional['Node[T]']) -> None:
-        if current_node is None:
-            return  # Base case: end of list
-
-        for value in current_node.elements:
+    vectorize = _vectorizes(unrolled_list, predicate, vectorized)
+
+    for current_node in _iter_nodes(unrolled_list._head_node):
+        if vectorize:
+            filtered_values.extend(
+                _vectorized_filter(predicate, current_node._elements))
+            continue
+        for value in current_node._elements:
             if predicate(value):
                 filtered_values.append(value)  # Add value if predicate is True
 
-        _filter_recursive(current_node.next_node)  # Recurse to next node
-
-    _filter_recursive(unrolled_list.head_node)
     # Create new list with filtered values
-    filtered_head_node = from_list(filtered_values,
-                                   unrolled_list.node_size).head_node
-    return ImmutableUnrolledLinkedList[T](filtered_head_node,
-                                          unrolled_list.node_size)
+    return from_list(filtered_values, unrolled_list._node_size,
+                     unrolled_list._dtype)
 
 
 def map_list(unrolled_list: ImmutableUnrolledLinkedList[T],
-             func: Callable[[T], U]) -> ImmutableUnrolledLinkedList[U]:
+             func: Callable[[T], U],
+             vectorized: bool = False) -> ImmutableUnrolledLinkedList[U]:
     # Maps a function over the ImmutableUnrolledLinkedList
-    if not unrolled_list or unrolled_list.head_node is None:
+    # vectorized=True: func is array-aware, numeric lists call it once per
+    # node buffer (numpy semantics, e.g. int64 arithmetic wraps around)
+    if unrolled_list is None or unrolled_list._head_node is None:
         return ImmutableUnrolledLinkedList[U]()
         # Return original empty list if empty
 
-    def _map_recursive(
-            current_node: Optional['Node[T]']) -> Optional['Node[U]']:
-        if current_node is None:
-            return None  # Base case: end of list
-
-        # Apply func to each element, create a new tuple with mapped elements
-        elements = current_node.elements
-        mapped_values = (func(value) for value in elements)
-        mapped_elements = tuple(mapped_values)
-        # Map the rest of the list recursively
-        mapped_next_node = _map_recursive(current_node.next_node)
-
-        # Create new node with mapped elements and return it
-        return Node[U](mapped_elements, mapped_next_node)
-
-    mapped_head_node = _map_recursive(unrolled_list.head_node)
+    mapped_head_node: Optional['Node[U]'] = None
+    last_node: Optional['Node[U]'] = None
+    vectorize = _vectorizes(unrolled_list, func, vectorized)
+    # The result is numeric only if every node mapped to the same dtype
+    mapped_dtypes: Set[Optional[str]] = set()
+    for current_node in _iter_nodes(unrolled_list._head_node):
+        mapped_elements: Sequence[U]
+        if vectorize:
+            mapped_elements = _vectorized_map(func, current_node._elements)
+            mapped_dtypes.add(_dtype_of(mapped_elements))
+        else:
+            # Apply func to each element, create a new tuple
+            mapped_elements = tuple(
+                [func(value) for value in current_node._elements])
+        # Link the new node behind the previous one, like from_list does
+        new_node = _new_node(mapped_elements, None)
+        if last_node is None:
+            mapped_head_node = new_node
+        else:
+            last_node._next = new_node
+        last_node = new_node
 
     # Ensure we return an ImmutableUnrolledLinkedList with the new head node
-    return ImmutableUnrolledLinkedList[U](mapped_head_node,
-                                          unrolled_list.node_size)
+    mapped_dtype = mapped_dtypes.pop() if len(mapped_dtypes) == 1 else None
+    return _new_list(mapped_head_node, unrolled_list._node_size,
+                     unrolled_list._length, mapped_dtype)
 
 
 def reduce(unrolled_list: ImmutableUnrolledLinkedList[U],
            func: Callable[[U, U],
                           U], initial_value: Optional[U]) -> Optional[U]:
     # Reduces the ImmutableUnrolledLinkedList to a single value
-    if not unrolled_list or unrolled_list.head_node is None:
+    if unrolled_list is None or unrolled_list._head_node is None:
         return initial_value  # Return initial value if the list is empty
 
     state = initial_value
-    current_node: Optional['Node[U]'] = unrolled_list.head_node
+    current_node: Optional['Node[U]'] = unrolled_list._head_node
+    # Typed nodes are folded in one call when func is a known associative
+    # operation (for floats the rounding can differ from a strict left fold)
+    node_reducer = _node_reducer(func)
 
     while current_node is not None:
-        for value in current_node.elements:
+        elements = current_node._elements
+        if node_reducer is not None and isinstance(elements, memoryview) \
+                and elements:
+            value = node_reducer(elements)
+            state = value if state is None else func(state, value)
+            current_node = current_node._next
+            continue
+        for value in elements:
             if state is None:  # Handle None case
                 state = value  # If state is None, set it to the first element
             else:
                 state = func(state, value)
-        current_node = current_node.next_node
+        current_node = current_node._next
 
     return state  # Ensure a return value
 
 
-def empty(node_size: int = 4) -> 'ImmutableUnrolledLinkedList[T]':
+def _node_batches(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+                  batch_size: int) -> Iterator[List[Sequence[T]]]:
+    # Splits the Node chain into node-aligned batches of at least
+    # batch_size elements (the last one may be smaller). Typed buffers are
+    # sent as tuples, memoryviews cannot be pickled
+    batch: List[Sequence[T]] = []
+    count = 0
+    for current_node in _iter_nodes(unrolled_list._head_node):
+        elements = current_node._elements
+        if not elements:
+            continue
+        batch.append(elements if type(elements) is tuple
+                     else tuple(elements))
+        count += len(elements)
+        if count >= batch_size:
+            yield batch
+            batch, count = [], 0
+    if batch:
+        yield batch
+
+
+def _map_batch(func: Callable[[T], U],
+               batch: List[Sequence[T]]) -> List[Tuple[U, ...]]:
+    # Worker side of parallel_map: one mapped tuple per node
+    return [tuple([func(value) for value in elements]) for elements in batch]
+
+
+def _filter_batch(predicate: Callable[[T], bool],
+                  batch: List[Sequence[T]]) -> Tuple[T, ...]:
+    # Worker side of parallel_filter: the selected elements of the batch
+    return tuple([value for elements in batch for value in elements
+                  if predicate(value)])
+
+
+def _reduce_batch(func: Callable[[T, T], T],
+                  batch: List[Sequence[T]]) -> T:
+    # Worker side of parallel_reduce: the batch folded without an initial
+    # value (batches are never empty)
+    values = chain.from_iterable(batch)
+    state = next(values)
+    for value in values:
+        state = func(state, value)
+    return state
+
+
+def _run_batches(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+                 worker: Callable[[List[Sequence[T]]], Any],
+                 max_workers: Optional[int], batch_size: Optional[int],
+                 executor: Optional[Executor]) -> Iterator[Any]:
+    # Runs worker over node-aligned batches in a process pool and yields
+    # the results in list order. batch_size defaults to about four batches
+    # per worker; a list that fits into one batch is handled in-process
+    workers = max_workers or os.cpu_count() or 1
+    if batch_size is None:
+        batch_size = max(unrolled_list._node_size,
+                         -(-length(unrolled_list) // (4 * workers)))
+    elif batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer")
+    batches = _node_batches(unrolled_list, batch_size)
+    first = next(batches, None)
+    if first is None:
+        return
+    second = next(batches, None)
+    if second is None and executor is None:
+        yield worker(first)  # A single batch is not worth a process pool
+        return
+
+    pending = chain([first], [] if second is None else [second], batches)
+    if executor is not None:
+        yield from executor.map(worker, pending)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(worker, pending)
+
+
+def parallel_map(unrolled_list: ImmutableUnrolledLinkedList[T],
+                 func: Callable[[T], U],
+                 max_workers: Optional[int] = None,
+                 batch_size: Optional[int] = None,
+                 executor: Optional[Executor] = None
+                 ) -> ImmutableUnrolledLinkedList[U]:
+    # map_list for CPU-heavy functions: node-aligned batches of batch_size
+    # elements run in a ProcessPoolExecutor of max_workers processes (or
+    # in the given executor), the results are stitched back in order into
+    # a new packed list. func must be picklable (a module-level function)
+    node_size = unrolled_list._node_size
+    mapped = _run_batches(unrolled_list, functools.partial(_map_batch, func),
+                          max_workers, batch_size, executor)
+    return _build_from_chunks(chain.from_iterable(mapped), node_size)
+
+
+def parallel_filter(unrolled_list: ImmutableUnrolledLinkedList[T],
+                    predicate: Callable[[T], bool],
+                    max_workers: Optional[int] = None,
+                    batch_size: Optional[int] = None,
+                    executor: Optional[Executor] = None
+                    ) -> ImmutableUnrolledLinkedList[T]:
+    # filter over node-aligned batches in a process pool, see parallel_map
+    selected = _run_batches(unrolled_list,
+                            functools.partial(_filter_batch, predicate),
+                            max_workers, batch_size, executor)
+    return _build_from_chunks(selected, unrolled_list._node_size,
+                              unrolled_list._dtype)
+
+
+def parallel_reduce(unrolled_list: ImmutableUnrolledLinkedList[U],
+                    func: Callable[[U, U], U],
+                    initial_value: Optional[U],
+                    max_workers: Optional[int] = None,
+                    batch_size: Optional[int] = None,
+                    executor: Optional[Executor] = None) -> Optional[U]:
+    # reduce for associative functions: every batch is folded in a worker
+    # process, then the partial results are folded in order, starting from
+    # initial_value like reduce does. See parallel_map for the arguments
+    state = initial_value
+    for value in _run_batches(unrolled_list,
+                              functools.partial(_reduce_batch, func),
+                              max_workers, batch_size, executor):
+        state = value if state is None else func(state, value)
+    return state
+
+
+def _check_error_policy(on_error: str) -> None:
+    # Shared validation of on_error arguments
+    if on_error not in ("raise", "capture"):
+        raise ValueError("on_error must be 'raise' or 'capture'")
+
+
+def _with_node_layout(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+                      results: Iterable[U]) -> ImmutableUnrolledLinkedList[U]:
+    # A new list holding results in place of the elements of unrolled_list,
+    # with the same node layout (like map_list). results is consumed one
+    # node at a time
+    results = iter(results)
+    mapped_head_node: Optional['Node[U]'] = None
+    last_node: Optional['Node[U]'] = None
+    for current_node in _iter_nodes(unrolled_list._head_node):
+        new_node = _new_node(
+            tuple(islice(results, len(current_node._elements))), None)
+        if last_node is None:
+            mapped_head_node = new_node
+        else:
+            last_node._next = new_node
+        last_node = new_node
+    return _new_list(mapped_head_node, unrolled_list._node_size,
+                     unrolled_list._length)
+
+
+def _settle(future: 'Future[U]', on_error: str) -> Any:
+    # Result of a finished call; with on_error='capture' a raised
+    # exception is returned in place of the result
+    if on_error == "raise":
+        return future.result()
+    try:
+        return future.result()
+    except Exception as error:
+        return error
+
+
+def _threaded_results(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+                      func: Callable[[T], U], max_workers: int,
+                      on_error: str) -> Iterator[Any]:
+    # Calls func on every element in a thread pool and yields the results
+    # in list order. At most max_workers calls are in flight: the next
+    # element is only submitted once the oldest result has been taken
+    in_flight: Deque['Future[U]'] = deque()
+    with ThreadPoolExecutor(max_workers) as executor:
+        try:
+            for current_node in _iter_nodes(unrolled_list._head_node):
+                for value in current_node._elements:
+                    if len(in_flight) >= max_workers:
+                        yield _settle(in_flight.popleft(), on_error)
+                    in_flight.append(executor.submit(func, value))
+            while in_flight:
+                yield _settle(in_flight.popleft(), on_error)
+        finally:
+            for future in in_flight:  # Aborted, drop the queued calls
+                future.cancel()
+
+
+def threaded_map_list(unrolled_list: ImmutableUnrolledLinkedList[T],
+                      func: Callable[[T], U],
+                      max_workers: Optional[int] = None,
+                      on_error: str = "raise"
+                      ) -> ImmutableUnrolledLinkedList[Any]:
+    # map_list for blocking I/O callbacks, with up to max_workers calls
+    # running at once in a thread pool (default as ThreadPoolExecutor).
+    # The result keeps the order and node layout of unrolled_list.
+    # on_error='raise' aborts on the first failed call and raises its
+    # exception, 'capture' puts the exception in place of the result
+    _check_error_policy(on_error)
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    elif max_workers <= 0:
+        raise ValueError("max_workers must be a positive integer")
+    return _with_node_layout(unrolled_list, _threaded_results(
+        unrolled_list, func, max_workers, on_error))
+
+
+async def amap_list(unrolled_list: ImmutableUnrolledLinkedList[T],
+                    async_fn: Callable[[T], Awaitable[U]],
+                    concurrency: int = 8,
+                    on_error: str = "raise"
+                    ) -> ImmutableUnrolledLinkedList[Any]:
+    # map_list for coroutine functions, e.g.
+    # asyncio.run(amap_list(ul, fetch, concurrency=16)). At most
+    # concurrency calls are awaited at once; the result keeps the order
+    # and node layout of unrolled_list. on_error as in threaded_map_list
+    _check_error_policy(on_error)
+    if concurrency <= 0:
+        raise ValueError("concurrency must be a positive integer")
+    in_flight: Deque['asyncio.Future[U]'] = deque()
+    results: List[Any] = []
+
+    async def settle(task: 'asyncio.Future[U]') -> Any:
+        if on_error == "raise":
+            return await task
+        try:
+            return await task
+        except Exception as error:
+            return error
+
+    try:
+        for current_node in _iter_nodes(unrolled_list._head_node):
+            for value in current_node._elements:
+                if len(in_flight) >= concurrency:
+                    results.append(await settle(in_flight.popleft()))
+                in_flight.append(asyncio.ensure_future(async_fn(value)))
+        while in_flight:
+            results.append(await settle(in_flight.popleft()))
+    finally:
+        # Aborted: cancel the calls still running and wait for them
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+    return _with_node_layout(unrolled_list, results)
+
+
+def empty(node_size: Optional[int] = None,
+          dtype: Optional[str] = None) -> 'ImmutableUnrolledLinkedList[T]':
     # Returns an empty ImmutableUnrolledLinkedList
-    return ImmutableUnrolledLinkedList[T](None, node_size)
+    node_size = _node_size_or_default(node_size)
+    _check_dtype(dtype)
+    return _new_list(None, node_size, 0, dtype)
 
 
 def concat(
@@ -448,29 +1732,1053 @@ def concat(
     unrolled_list2: 'ImmutableUnrolledLinkedList[T]'
 ) -> 'ImmutableUnrolledLinkedList[T]':
     # Concat two ImmutableUnrolledLinkedLists
-    if not unrolled_list1 or unrolled_list1.head_node is None:
+    # Only list1's nodes are copied, list2's node chain is shared as is
+    if unrolled_list1 is None or unrolled_list1._head_node is None:
         return unrolled_list2  # If list1 is empty, return list2
-    if not unrolled_list2 or unrolled_list2.head_node is None:
+    if unrolled_list2 is None or unrolled_list2._head_node is None:
         # If list2 is empty, return list1
         return unrolled_list1
 
-    concatenated_values = to_list(unrolled_list1) + to_list(
-        unrolled_list2)  # l1+l2
-
-    # Rebuild list from concatenated values
-    return from_list(concatenated_values, unrolled_list1.node_size)
+    node_size = unrolled_list1._node_size
+    head_node2 = unrolled_list2._head_node
+    for last_node1 in _iter_nodes(unrolled_list1._head_node):
+        pass  # Find the boundary node of list1
+
+    if len(last_node1._elements) + len(head_node2._elements) <= min(
+            node_size, unrolled_list2._node_size):
+        # Both boundary nodes fit into one, repack them to keep fill high
+        tail: Optional['Node[T]'] = _new_node(
+            _join(last_node1._elements, head_node2._elements),
+            head_node2._next)
+        stop: Optional['Node[T]'] = last_node1
+    else:
+        tail, stop = head_node2, None
+
+    concatenated_head_node = _copy_path(unrolled_list1._head_node, stop, tail)
+    count = None
+    if unrolled_list1._length is not None and \
+            unrolled_list2._length is not None:
+        count = unrolled_list1._length + unrolled_list2._length
+    dtype = unrolled_list1._dtype
+    if dtype != unrolled_list2._dtype:
+        dtype = None  # Mixed storage, treated as an object list
+    return _new_list(concatenated_head_node, node_size, count, dtype)
 
 
 def concat_nodes(node1: Optional['Node[T]'],
                  node2: Optional['Node[T]']) -> Optional['Node[T]']:
-    # Helper function to concatenate Node chains, used internally for reverse
-    if node1 is None:
-        return node2
-    return Node[T](node1.elements, concat_nodes(node1.next_node, node2))
+    # Helper function to concatenate Node chains
+    # Copies the node1 chain and shares node2 as its tail
+    return _copy_path(node1, None, node2)
 
 
 def iterator(
     unrolled_list: 'ImmutableUnrolledLinkedList[T]'
 ) -> 'ImmutableUnrolledLinkedListIterator[T]':
     # Returns an iterator for the ImmutableUnrolledLinkedList
-    return ImmutableUnrolledLinkedListIterator[T](unrolled_list)
+    return ImmutableUnrolledLinkedListIterator(unrolled_list)
+
+
+def get_default_node_size() -> int:
+    # The node size used when no node_size is passed (4 unless changed)
+    return _default_node_size
+
+
+def set_default_node_size(node_size: int) -> None:
+    # Sets the process-wide node size used when no node_size is passed
+    # to the constructor, cons, empty, from_list or from_iterable
+    global _default_node_size
+    _check_node_size(node_size)
+    _default_node_size = node_size
+
+
+def _auto_node_size(python_list: List[T], dtype: Optional[str]) -> int:
+    # node_size='auto': a power of two near the square root of the length,
+    # which balances the O(node_size) copy of cons and remove against the
+    # O(n / node_size) node walks. Numbers go up to 1024 (packed buffers,
+    # at least 64 for vectorized map/filter), other objects up to 64
+    count = len(python_list)
+    node_size = 1 << max(2, math.isqrt(count).bit_length() - 1)
+    numeric = dtype is not None or (count > 0 and all(
+        type(value) in (int, float) for value in python_list[:64]))
+    if not numeric:
+        return min(node_size, 64)
+    if count >= 4 * _VECTORIZE_MIN_NODE_SIZE:
+        node_size = max(node_size, _VECTORIZE_MIN_NODE_SIZE)
+    return min(node_size, 1024)
+
+
+# Representative operations timed by autotune_node_size. Each takes the
+# sample as a list of the candidate node size and the sample itself
+_TUNING_OPERATIONS: Dict[str, Callable[[Any, List[Any]], object]] = {
+    "build": lambda ul, sample: from_list(sample, ul._node_size),
+    "cons": lambda ul, sample: cons(sample[0], ul),
+    "remove": lambda ul, sample: remove(ul, sample[-1]),
+    "concat": lambda ul, sample: concat(ul, ul),
+    "nth": lambda ul, sample: nth(ul, len(sample) // 2),
+    "member": lambda ul, sample: member(ul, sample[-1]),
+    "iterate": lambda ul, sample: deque(iter(ul), maxlen=0),
+}
+
+# Named workloads: operation -> relative frequency
+_TUNING_WORKLOADS: Dict[str, Dict[str, float]] = {
+    "read": {"nth": 1, "member": 1, "iterate": 1},
+    "update": {"build": 1, "cons": 1, "remove": 1, "concat": 1},
+    "mixed": {name: 1 for name in _TUNING_OPERATIONS},
+}
+
+
+def autotune_node_size(sample: List[T],
+                       workload: Union[str, Dict[str, float]] = "mixed",
+                       candidates: Sequence[int] = (
+                           1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024),
+                       set_default: bool = False) -> int:
+    # Recommends a node size for lists like sample on this machine
+    # Every operation of the workload ("read", "update", "mixed" or a dict
+    # of operation -> relative frequency, operations as in
+    # _TUNING_OPERATIONS) is timed on sample for each candidate size; the
+    # size with the lowest weighted time wins. set_default=True also makes
+    # it the process-wide default (see set_default_node_size)
+    if not sample:
+        raise ValueError("sample must not be empty")
+    if isinstance(workload, str):
+        if workload not in _TUNING_WORKLOADS:
+            raise ValueError("workload must be 'read', 'update', 'mixed' "
+                             "or a dict of operation weights")
+        workload = _TUNING_WORKLOADS[workload]
+    weights = workload
+    for name in weights:
+        if name not in _TUNING_OPERATIONS:
+            raise ValueError(f"unknown operation in workload: {name}")
+    for candidate in candidates:
+        _check_node_size(candidate)
+
+    best_size, best_cost = _default_node_size, math.inf
+    # Sizes past the sample length all give one node, time only the first
+    for candidate in sorted(set(candidates)):
+        tuned_list = from_list(sample, candidate)
+        cost = sum(weight * _time_per_call(
+            lambda: _TUNING_OPERATIONS[name](tuned_list, sample))
+            for name, weight in weights.items() if weight)
+        if cost < best_cost:
+            best_size, best_cost = candidate, cost
+        if candidate >= len(sample):
+            break
+
+    if set_default:
+        set_default_node_size(best_size)
+    return best_size
+
+
+def _time_per_call(func: Callable[[], object],
+                   min_total: float = 0.002) -> float:
+    # Best time per call of func, batching calls until a batch takes
+    # min_total seconds so fast operations are timed reliably
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_total and number < 1 << 16:
+        number *= 2
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+# Largest number of elements a lazy pipeline runs through its stages at once
+_LAZY_BATCH_SIZE = 1024
+
+
+class LazyUnrolledLinkedListView(Generic[T]):
+    # Lazy query pipeline over an ImmutableUnrolledLinkedList
+    # filter/map/take only record stages; a terminal operation (reduce,
+    # find, to_list, materialize, iteration) runs all stages fused in one
+    # node-by-node pass. Only a bounded batch of values is alive at a
+    # time, and the pass stops as soon as a take() or find() is satisfied
+    __slots__ = ('_source', '_stages')
+
+    def __init__(self, source: 'ImmutableUnrolledLinkedList[Any]',
+                 stages: Tuple[Tuple[str, Any], ...] = ()):
+        self._source = source
+        self._stages = stages
+
+    def _then(self, kind: str, arg: Any) -> 'LazyUnrolledLinkedListView[Any]':
+        # Views are immutable, every stage returns a new view
+        return LazyUnrolledLinkedListView(self._source,
+                                          self._stages + ((kind, arg), ))
+
+    def filter(self,
+               predicate: Callable[[T], bool]
+               ) -> 'LazyUnrolledLinkedListView[T]':
+        # Keeps the elements that satisfy predicate
+        return self._then('filter', predicate)
+
+    def map(self, func: Callable[[T], U]) -> 'LazyUnrolledLinkedListView[U]':
+        # Applies func to every element
+        return self._then('map', func)
+
+    def take(self, count: int) -> 'LazyUnrolledLinkedListView[T]':
+        # Keeps at most the first count elements
+        if count < 0:
+            raise ValueError("count must be a non-negative integer")
+        return self._then('take', count)
+
+    def _chunks(self) -> Iterator[Sequence[T]]:
+        # The fused pass: elements go through all stages one batch at a
+        # time. A batch starts as one node and doubles up to
+        # _LAZY_BATCH_SIZE elements, which amortizes the per-stage cost
+        # while take()/find() still stop within about twice the elements
+        # they need
+        stages = self._stages
+        left = [arg for kind, arg in stages if kind == 'take']
+        if 0 in left:
+            return
+
+        def _run(values: Sequence[Any]) -> Tuple[Sequence[Any], bool]:
+            # Runs one batch through every stage, True once a take()
+            # is exhausted and nothing more can pass
+            finished = False
+            take_index = 0
+            for kind, arg in stages:
+                if kind == 'filter':
+                    values = [value for value in values if arg(value)]
+                elif kind == 'map':
+                    values = [arg(value) for value in values]
+                else:  # take
+                    remaining = left[take_index]
+                    if len(values) >= remaining:
+                        values = values[:remaining]
+                        finished = True
+                    left[take_index] = remaining - len(values)
+                    take_index += 1
+                if not values:
+                    break
+            return values, finished
+
+        batch: List[Any] = []
+        batch_nodes = nodes = 1
+        for node in _iter_nodes(self._source._head_node):
+            batch.extend(node._elements)
+            if nodes < batch_nodes and len(batch) < _LAZY_BATCH_SIZE:
+                nodes += 1
+                continue
+            values, finished = _run(batch)
+            if values:
+                yield values
+            if finished:
+                return
+            batch = []
+            nodes = 1
+            batch_nodes *= 2
+        if batch:
+            values, _ = _run(batch)
+            if values:
+                yield values
+
+    def __iter__(self) -> Iterator[T]:
+        for chunk in self._chunks():
+            yield from chunk
+
+    def reduce(self, func: Callable[[T, T], T],
+               initial_value: Optional[T]) -> Optional[T]:
+        # Same semantics as reduce() on a list
+        state = initial_value
+        for chunk in self._chunks():
+            for value in chunk:
+                if state is None:
+                    state = value
+                else:
+                    state = func(state, value)
+        return state
+
+    def find(self,
+             predicate: Callable[[T], bool]) -> Tuple[bool, Optional[T]]:
+        # Stops the pass at the first match, like find() on a list
+        for chunk in self._chunks():
+            for value in chunk:
+                if predicate(value):
+                    return True, value
+        return False, None
+
+    def to_list(self) -> List[T]:
+        res: List[T] = []
+        for chunk in self._chunks():
+            res.extend(chunk)
+        return res
+
+    def materialize(self, node_size: Optional[int] = None,
+                    dtype: Optional[str] = None
+                    ) -> 'ImmutableUnrolledLinkedList[T]':
+        # Builds a packed list from the pipeline, by default with the
+        # node size of the source list
+        if node_size is None:
+            node_size = self._source._node_size
+        _check_node_size(node_size)
+        _check_dtype(dtype)
+        return _build_from_chunks(self._chunks(), node_size, dtype)
+
+
+def lazy(unrolled_list: 'ImmutableUnrolledLinkedList[T]'
+         ) -> 'LazyUnrolledLinkedListView[T]':
+    # Starts a lazy, fused query pipeline over the list
+    return LazyUnrolledLinkedListView(unrolled_list)
+
+
+class TransientUnrolledLinkedList(Generic[T]):
+    # Mutable builder for a batch of edits to one list (like Clojure
+    # transients). Nodes allocated by the transient are owned by it and
+    # edited in place, so k edits allocate no intermediate lists and copy
+    # every node at most once. The owned nodes always form a prefix of the
+    # chain: owning a node copies the shells of the nodes in front of it,
+    # and everything after the last owned node is the untouched chain of
+    # the source. freeze() seals the owned nodes and returns a normal
+    # immutable list sharing that chain. Single owner, not thread-safe
+    __slots__ = ('_source', '_head_node', '_owned', '_last_owned', '_delta',
+                 '_frozen')
+
+    def __init__(self, source: 'ImmutableUnrolledLinkedList[T]'):
+        self._source = source
+        self._head_node: Optional['Node[T]'] = source._head_node
+        # ids of the owned nodes; the source keeps every shared node alive,
+        # so an id of a shared node is never reused for an owned one
+        self._owned: Set[int] = set()
+        self._last_owned: Optional['Node[T]'] = None
+        # Element count change relative to the source
+        self._delta = 0
+        self._frozen: Optional['ImmutableUnrolledLinkedList[T]'] = None
+
+    def __enter__(self) -> 'TransientUnrolledLinkedList[T]':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        # Leaving the with block freezes the list, see freeze()
+        self.freeze()
+
+    def __len__(self) -> int:
+        return length(self._source) + self._delta
+
+    def _check_editable(self) -> None:
+        if self._frozen is not None:
+            raise RuntimeError("transient list used after freeze()")
+
+    def _own(self, previous: Optional['Node[T]'], node: 'Node[T]'
+             ) -> Tuple[Optional['Node[T]'], 'Node[T]']:
+        # Makes node (previous is the node in front of it, None at the
+        # head) owned and returns the owned pair. The shells from the end
+        # of the owned prefix up to node are copied, their element tuples
+        # stay shared until _editable() needs a list
+        if id(node) in self._owned:
+            return previous, node
+        before = self._last_owned
+        current = self._head_node if before is None else before._next
+        while current is not None:
+            node_copy = _new_node(current._elements, current._next)
+            if before is None:
+                self._head_node = node_copy
+            else:
+                before._next = node_copy
+            self._owned.add(id(node_copy))
+            if current is node:
+                self._last_owned = node_copy
+                return before, node_copy
+            before, current = node_copy, current._next
+        raise ValueError("node is not in the transient list")
+
+    def _editable(self, node: 'Node[T]') -> List[T]:
+        # The elements of an owned node as a list that is edited in place
+        elements = node._elements
+        if type(elements) is not list:
+            elements = node._elements = list(elements)
+        return cast(List[T], elements)
+
+    def _tail(self) -> Optional['Node[T]']:
+        # The last node of the chain
+        node = self._head_node if self._last_owned is None \
+            else self._last_owned
+        if node is None:
+            return None
+        while node._next is not None:
+            node = node._next
+        return node
+
+    def cons(self, value: T) -> None:
+        # Adds value to the head, like cons()
+        if self._frozen is not None:
+            self._check_editable()
+        head_node = self._head_node
+        if head_node is not None and \
+                len(head_node._elements) < self._source._node_size:
+            elements = head_node._elements
+            if type(elements) is not list:  # Not yet edited in place
+                _, head_node = self._own(None, head_node)
+                elements = self._editable(head_node)
+            cast(List[T], elements).insert(0, value)
+        else:  # Head node full (or no head), link a new owned node
+            self._head_node = _new_node([value], head_node)
+            self._owned.add(id(self._head_node))
+            if self._last_owned is None:
+                self._last_owned = self._head_node
+        self._delta += 1
+
+    def append(self, value: T) -> None:
+        # Adds value to the end
+        self.extend((value, ))
+
+    def extend(self, values: Iterable[T]) -> None:
+        # Adds all values to the end, filling up the last node first
+        # The first call walks to the end of the source and copies its
+        # shells once; later calls append to the owned tail in O(1)
+        self._check_editable()
+        batch = list(values)
+        if not batch:
+            return
+        node_size = self._source._node_size
+        tail = self._tail()
+        room = 0
+        if tail is not None:
+            _, tail = self._own(None, tail)
+            elements = self._editable(tail)
+            room = max(node_size - len(elements), 0)
+            elements.extend(batch[:room])
+        for start in range(room, len(batch), node_size):
+            new_node = _new_node(batch[start:start + node_size], None)
+            self._owned.add(id(new_node))
+            if tail is None:
+                self._head_node = new_node
+            else:
+                tail._next = new_node
+            tail = new_node
+        self._last_owned = tail
+        self._delta += len(batch)
+
+    def remove(self, element: T) -> None:
+        # Removes the first occurrence of element, like remove(); nothing
+        # happens when it is not in the list
+        self._check_editable()
+        previous: Optional['Node[T]'] = None
+        node = self._head_node
+        while node is not None and element not in node._elements:
+            previous, node = node, node._next
+        if node is None:
+            return
+        previous, node = self._own(previous, node)
+        elements = self._editable(node)
+        elements.remove(element)
+        self._delta -= 1
+        if not elements:  # Unlink the emptied node
+            if previous is None:
+                self._head_node = node._next
+            else:
+                previous._next = node._next
+            if node is self._last_owned:
+                self._last_owned = previous
+            self._owned.discard(id(node))
+
+    def freeze(self) -> 'ImmutableUnrolledLinkedList[T]':
+        # Seals the owned nodes (lists back to tuples, or typed buffers for
+        # numeric lists) and returns the immutable result. Further edits
+        # raise RuntimeError; calling freeze() again returns the same list
+        if self._frozen is not None:
+            return self._frozen
+        source = self._source
+        if not self._owned and self._head_node is source._head_node:
+            self._frozen = source  # Nothing was edited
+            return source
+        dtype = source._dtype
+        node = self._head_node
+        while node is not None and id(node) in self._owned:
+            if type(node._elements) is list:
+                node._elements = _pack(node._elements, dtype)
+            node = node._next
+        self._owned.clear()
+        self._frozen = _new_list(self._head_node, source._node_size,
+                                 _length_after(source, self._delta), dtype)
+        return self._frozen
+
+
+def transient(unrolled_list: 'ImmutableUnrolledLinkedList[T]'
+              ) -> 'TransientUnrolledLinkedList[T]':
+    # Starts a batch of in-place edits on the list, e.g.
+    # with transient(ul) as t: t.append(x); t.remove(y)
+    # then t.freeze() returns the new immutable list
+    return TransientUnrolledLinkedList(unrolled_list)
+
+
+# Binary dump format of dump()/loads(), all integers little-endian:
+# a header (magic, version, node_size, element count, dtype index), then
+# chunks of consecutive nodes with the same storage, then an end chunk.
+# A chunk header (kind, node count, payload bytes) is followed by the
+# node lengths (uint32 each) and the payload: raw int64/float64 bytes for
+# numeric nodes, or a marshal dump of the chunk's elements as one flat
+# tuple (a pickle dump when an element is not _marshallable). Every
+# chunk is pickled on its own, so one object referenced from two chunks
+# comes back as two equal copies
+_DUMP_MAGIC = b'IULL'
+_DUMP_VERSION = 1
+_DUMP_HEADER = struct.Struct('<4sBQQB')
+_DUMP_CHUNK = struct.Struct('<BIQ')
+_CHUNK_END, _CHUNK_MARSHAL, _CHUNK_PICKLE, _CHUNK_I8, _CHUNK_F8 = range(5)
+_CHUNK_KINDS: Dict[Optional[str], int] = {'i8': _CHUNK_I8, 'f8': _CHUNK_F8}
+_CHUNK_DTYPES: Dict[int, str] = {_CHUNK_I8: 'i8', _CHUNK_F8: 'f8'}
+_DUMP_DTYPES: Tuple[Optional[str], ...] = (None, 'i8', 'f8')
+# Largest number of elements dump() gathers into one chunk
+_DUMP_CHUNK_ELEMENTS = 1 << 16
+_BIG_ENDIAN = sys.byteorder == 'big'
+# Exact types marshal writes and reads back unchanged; it also accepts
+# any buffer (bytearray, array, memoryview, ...) but reads it as bytes
+_MARSHAL_TYPES = frozenset({int, float, complex, str, bytes, bool,
+                            type(None)})
+
+
+def _marshallable(values: Iterable[Any]) -> bool:
+    # True if values are only _MARSHAL_TYPES and tuples or frozensets of
+    # them, so a marshal round trip keeps every element's type
+    for value in values:
+        kind = type(value)
+        if kind is tuple or kind is frozenset:
+            if not _marshallable(value):
+                return False
+        elif kind not in _MARSHAL_TYPES:
+            return False
+    return True
+
+
+def _write_chunk(fp: BinaryIO, dtype: Optional[str],
+                 nodes: List['Node[Any]']) -> None:
+    # Writes one chunk of nodes that all have the storage of dtype
+    counts = array('I', [len(node._elements) for node in nodes])
+    buffers: List[Any]
+    if dtype is None:
+        values = tuple(chain.from_iterable(node._elements for node in nodes))
+        if _marshallable(values):
+            buffers = [marshal.dumps(values)]
+            kind = _CHUNK_MARSHAL
+        else:
+            buffers = [pickle.dumps(values, pickle.HIGHEST_PROTOCOL)]
+            kind = _CHUNK_PICKLE
+    else:
+        kind = _CHUNK_KINDS[dtype]
+        buffers = [node._elements for node in nodes]
+        if _BIG_ENDIAN:
+            buffers = [_byteswapped(buffer) for buffer in buffers]
+    if _BIG_ENDIAN:
+        counts.byteswap()
+    fp.write(_DUMP_CHUNK.pack(kind, len(nodes),
+                              sum(memoryview(buffer).nbytes
+                                  for buffer in buffers)))
+    fp.write(counts)
+    for buffer in buffers:
+        fp.write(buffer)
+
+
+def _byteswapped(buffer: Any) -> bytes:
+    # The bytes of a typed buffer in the other byte order (big-endian
+    # machines only, the dump format is little-endian)
+    swapped = array(buffer.format, buffer)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def dump(unrolled_list: 'ImmutableUnrolledLinkedList[T]',
+         fp: BinaryIO) -> None:
+    # Writes the list to a binary file object, keeping node_size, dtype
+    # and the node layout. Numeric nodes are written as raw buffers, the
+    # nodes are walked in a loop and written one chunk at a time
+    fp.write(_DUMP_HEADER.pack(_DUMP_MAGIC, _DUMP_VERSION,
+                               unrolled_list._node_size,
+                               length(unrolled_list),
+                               _DUMP_DTYPES.index(unrolled_list._dtype)))
+    nodes: List['Node[T]'] = []
+    chunk_dtype: Optional[str] = None
+    elements = 0
+    for node in _iter_nodes(unrolled_list._head_node):
+        node_dtype = _dtype_of(node._elements)
+        if nodes and (node_dtype != chunk_dtype or
+                      elements >= _DUMP_CHUNK_ELEMENTS):
+            _write_chunk(fp, chunk_dtype, nodes)
+            nodes, elements = [], 0
+        chunk_dtype = node_dtype
+        nodes.append(node)
+        elements += len(node._elements)
+    if nodes:
+        _write_chunk(fp, chunk_dtype, nodes)
+    fp.write(_DUMP_CHUNK.pack(_CHUNK_END, 0, 0))
+
+
+def dumps(unrolled_list: 'ImmutableUnrolledLinkedList[T]') -> bytes:
+    # The dump() of the list as bytes
+    buffer = io.BytesIO()
+    dump(unrolled_list, buffer)
+    return buffer.getvalue()
+
+
+def _read_chunks(view: memoryview) -> Iterator[Sequence[Any]]:
+    # Yields the node elements of every chunk after the header. Numeric
+    # nodes are typed memoryviews into view, not copies
+    offset = _DUMP_HEADER.size
+    while True:
+        kind, nodes, size = _DUMP_CHUNK.unpack_from(view, offset)
+        offset += _DUMP_CHUNK.size
+        if kind == _CHUNK_END:
+            return
+        counts = array('I')
+        counts.frombytes(view[offset:offset + 4 * nodes])
+        if _BIG_ENDIAN:
+            counts.byteswap()
+        offset += 4 * nodes
+        payload = view[offset:offset + size]
+        offset += size
+        if len(payload) != size:
+            raise ValueError("truncated ImmutableUnrolledLinkedList dump")
+        if kind == _CHUNK_MARSHAL or kind == _CHUNK_PICKLE:
+            values = marshal.loads(payload) if kind == _CHUNK_MARSHAL \
+                else pickle.loads(payload)
+            start = 0
+            for count in counts:
+                yield values[start:start + count]
+                start += count
+        elif kind in _CHUNK_DTYPES:
+            typecode = _TYPECODES[_CHUNK_DTYPES[kind]]
+            start = 0
+            for count in counts:
+                node_buffer: Any = payload[start:start + 8 * count]
+                if _BIG_ENDIAN:
+                    node_buffer = memoryview(_byteswapped(
+                        node_buffer.cast(typecode))).toreadonly()
+                yield cast(Sequence[Any], node_buffer.cast(typecode))
+                start += 8 * count
+        else:
+            raise ValueError(f"unknown chunk kind {kind} in dump")
+
+
+def loads(data: Any) -> 'ImmutableUnrolledLinkedList[Any]':
+    # Rebuilds a list from dump() bytes, or any buffer such as an mmap.
+    # Numeric nodes are read-only views into data, so no element is
+    # copied; data must stay unchanged while the list is alive. Object
+    # payloads are unpickled, so only load dumps from trusted sources
+    view = memoryview(data).toreadonly()
+    if view.format != 'B':
+        view = view.cast('B')
+    try:
+        magic, version, node_size, count, dtype_index = \
+            _DUMP_HEADER.unpack_from(view, 0)
+        if magic != _DUMP_MAGIC or version != _DUMP_VERSION or \
+                dtype_index >= len(_DUMP_DTYPES):
+            raise ValueError("not an ImmutableUnrolledLinkedList dump")
+        head_node: Optional['Node[Any]'] = None
+        current_node_pointer: Optional['Node[Any]'] = None
+        for elements in _read_chunks(view):
+            new_node = _new_node(elements, None)
+            if current_node_pointer is None:
+                head_node = new_node
+            else:
+                current_node_pointer._next = new_node
+            current_node_pointer = new_node
+    except struct.error:
+        raise ValueError("truncated ImmutableUnrolledLinkedList dump")
+    return _new_list(head_node, node_size, count, _DUMP_DTYPES[dtype_index])
+
+
+def load(fp: BinaryIO) -> 'ImmutableUnrolledLinkedList[Any]':
+    # Reads a list written by dump(). The file is read with one call and
+    # the numeric nodes share that buffer, see loads()
+    return loads(fp.read())
+
+
+def _load_nodes(data: bytes) -> Optional['Node[Any]']:
+    # Unpickles a Node chain, see Node.__reduce__
+    return loads(data)._head_node
+
+
+# Opt-in metrics, see enable_metrics(). While disabled nothing is wrapped
+# and every function runs exactly as defined, so there is no cost at all.
+# Enabling replaces the public functions in this module's namespace with
+# timing wrappers and the node helpers with counting versions. Counters
+# go to the outermost public call running (nested public calls count
+# towards it), are process-wide and are not synchronized between threads
+_metrics: Dict[str, Dict[str, float]] = {}
+# Counters of the outermost public call running, None outside of one
+_metrics_call: Optional[Dict[str, float]] = None
+# Module attributes replaced while metrics are enabled, by name
+_metrics_originals: Dict[str, Any] = {}
+_metrics_options: Dict[str, bool] = {}
+# Counters of a single call
+_CALL_COUNTERS = ('nodes_allocated', 'nodes_copied', 'nodes_reused',
+                  'elements_copied', 'nodes_traversed')
+# Exported name, Prometheus type and help text of every metric
+_METRIC_EXPORTS: Dict[str, Tuple[str, str, str]] = {
+    'calls': ('calls_total', 'counter', 'Calls'),
+    'seconds': ('seconds_total', 'counter', 'Wall time in seconds'),
+    'nodes_allocated': ('nodes_allocated_total', 'counter',
+                        'Nodes allocated'),
+    'nodes_copied': ('nodes_copied_total', 'counter',
+                     'Nodes copied by path copying'),
+    'nodes_reused': ('nodes_reused_total', 'counter',
+                     'Nodes of the returned lists shared with other lists'),
+    'elements_copied': ('elements_copied_total', 'counter',
+                        'Elements stored into newly allocated node storage'),
+    'nodes_traversed': ('nodes_traversed_total', 'counter',
+                        'Nodes walked by the traversal helpers'),
+    'max_traversal': ('max_traversal_nodes', 'gauge',
+                      'Most nodes walked by a single call'),
+    'memory_bytes': ('memory_bytes_total', 'counter',
+                     'Net bytes allocated (tracemalloc)'),
+    'peak_memory_bytes': ('peak_memory_bytes', 'gauge',
+                          'Highest traced memory peak of a single call'),
+}
+# Functions that are never wrapped: the metrics API itself, and generator
+# and coroutine functions, whose work happens after the call returns
+_METRICS_API = frozenset({'enable_metrics', 'disable_metrics',
+                          'reset_metrics', 'metrics', 'metrics_prometheus'})
+
+
+def _record_call(name: str, call: Dict[str, float], seconds: float,
+                 memory: Optional[Tuple[int, int]]) -> None:
+    # Adds the counters of one finished call to the totals of name
+    totals = _metrics.get(name)
+    if totals is None:
+        totals = _metrics[name] = dict.fromkeys(_METRIC_EXPORTS, 0)
+    totals['calls'] += 1
+    totals['seconds'] += seconds
+    for counter in _CALL_COUNTERS:
+        totals[counter] += call[counter]
+    totals['max_traversal'] = max(totals['max_traversal'],
+                                  call['nodes_traversed'])
+    if memory is not None:
+        totals['memory_bytes'] += memory[0]
+        totals['peak_memory_bytes'] = max(totals['peak_memory_bytes'],
+                                          memory[1])
+
+
+def _timed(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    # Timing wrapper of the public function name
+    iter_nodes = _metrics_originals['_iter_nodes']
+    sharing = _metrics_options['sharing']
+    trace_memory = _metrics_options['trace_memory']
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        global _metrics_call
+        if _metrics_call is not None:  # Counted by the outer call
+            return func(*args, **kwargs)
+        call = _metrics_call = dict.fromkeys(_CALL_COUNTERS, 0)
+        memory = None
+        if trace_memory:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            _metrics_call = None
+            if trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                memory = (current - before, peak - before)
+        if sharing and isinstance(result, ImmutableUnrolledLinkedList):
+            # Nodes of the result that this call did not allocate
+            nodes = sum(1 for _ in iter_nodes(result._head_node))
+            call['nodes_reused'] = max(nodes - call['nodes_allocated'], 0)
+        _record_call(name, call, seconds, memory)
+        return result
+
+    return wrapper
+
+
+def _counting_helpers() -> Dict[str, Callable[..., Any]]:
+    # Versions of the node helpers that count into the running call
+    new_node = _metrics_originals['_new_node']
+    copy_path = _metrics_originals['_copy_path']
+    iter_nodes = _metrics_originals['_iter_nodes']
+    node_holding = _metrics_originals['_node_holding']
+
+    def counting_new_node(elements: Sequence[T],
+                          next_node: Optional['Node[T]']) -> 'Node[T]':
+        call = _metrics_call
+        if call is not None:
+            call['nodes_allocated'] += 1
+            call['elements_copied'] += len(elements)
+        return cast('Node[T]', new_node(elements, next_node))
+
+    def counting_copy_path(head: Optional['Node[T]'],
+                           stop: Optional['Node[T]'],
+                           tail: Optional['Node[T]']) -> Optional['Node[T]']:
+        call = _metrics_call
+        if call is not None:
+            copied = elements = 0
+            node = head
+            while node is not stop and node is not None:
+                copied += 1
+                elements += len(node._elements)
+                node = node._next
+            call['nodes_copied'] += copied
+            call['nodes_traversed'] += copied
+            # The copies share their element storage, take back what
+            # counting_new_node adds for them
+            call['elements_copied'] -= elements
+        return cast(Optional['Node[T]'], copy_path(head, stop, tail))
+
+    def counted(nodes: Iterator['Node[T]'],
+                call: Dict[str, float]) -> Iterator['Node[T]']:
+        for node in nodes:
+            call['nodes_traversed'] += 1
+            yield node
+
+    def counting_iter_nodes(node: Optional['Node[T]']
+                            ) -> Iterator['Node[T]']:
+        call = _metrics_call
+        nodes = cast(Iterator['Node[T]'], iter_nodes(node))
+        return nodes if call is None else counted(nodes, call)
+
+    def counting_node_holding(node: Optional['Node[T]'], value: Any,
+                              node_size: int) -> Optional['Node[T]']:
+        found = cast(Optional['Node[T]'],
+                     node_holding(node, value, node_size))
+        call = _metrics_call
+        if call is not None:
+            while node is not None:
+                call['nodes_traversed'] += 1
+                if node is found:
+                    break
+                node = node._next
+        return found
+
+    return {'_new_node': counting_new_node,
+            '_copy_path': counting_copy_path,
+            '_iter_nodes': counting_iter_nodes,
+            '_node_holding': counting_node_holding}
+
+
+def enable_metrics(trace_memory: bool = False, sharing: bool = True) -> None:
+    # Starts collecting metrics for the public functions of this module:
+    # calls and wall time, nodes allocated, nodes copied by path copying,
+    # elements copied into new node storage and nodes walked per call.
+    # sharing=True also counts the nodes of every returned list that the
+    # call did not allocate (this walks the result, outside the timing);
+    # trace_memory=True records allocated bytes with tracemalloc. Only
+    # calls through the module see the wrappers: names imported with
+    # "from ... import" before enabling keep calling the plain functions
+    disable_metrics()
+    module = sys.modules[__name__]
+    public = [name for name, value in vars(module).items()
+              if inspect.isfunction(value) and value.__module__ == __name__
+              and not name.startswith('_') and name not in _METRICS_API
+              and not inspect.isgeneratorfunction(value)
+              and not inspect.iscoroutinefunction(value)]
+    for name in public + ['_new_node', '_copy_path', '_iter_nodes',
+                          '_node_holding']:
+        _metrics_originals[name] = getattr(module, name)
+    _metrics_options['sharing'] = sharing
+    _metrics_options['trace_memory'] = trace_memory
+    _metrics_options['started_tracemalloc'] = False
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _metrics_options['started_tracemalloc'] = True
+    for name, helper in _counting_helpers().items():
+        setattr(module, name, helper)
+    for name in public:
+        setattr(module, name, _timed(name, _metrics_originals[name]))
+
+
+def disable_metrics() -> None:
+    # Restores the plain functions, the collected metrics are kept
+    module = sys.modules[__name__]
+    for name, original in _metrics_originals.items():
+        setattr(module, name, original)
+    _metrics_originals.clear()
+    if _metrics_options.get('started_tracemalloc'):
+        tracemalloc.stop()
+    _metrics_options.clear()
+
+
+def reset_metrics() -> None:
+    # Drops the collected metrics
+    _metrics.clear()
+
+
+def metrics() -> Dict[str, Dict[str, float]]:
+    # The collected metrics per function name: calls, seconds,
+    # nodes_allocated, nodes_copied, nodes_reused, elements_copied,
+    # nodes_traversed, max_traversal, memory_bytes and peak_memory_bytes
+    return {name: dict(totals) for name, totals in sorted(_metrics.items())}
+
+
+def metrics_prometheus(prefix: str = 'iull') -> str:
+    # The collected metrics in the Prometheus text exposition format, one
+    # series per function, e.g. iull_calls_total{function="cons"} 3
+    lines: List[str] = []
+    for field, (name, kind, description) in _METRIC_EXPORTS.items():
+        lines.append(f"# HELP {prefix}_{name} {description} per function")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for function, totals in sorted(_metrics.items()):
+            lines.append(f'{prefix}_{name}{{function="{function}"}} '
+                         f'{totals[field]}')
+    return "\n".join(lines) + "\n"
+
+
+# Hash-consing (see enable_interning). A node is pooled under its element
+# tuple and the id of its next node: the pooled node keeps that next node
+# alive, so the id stays valid as long as the entry. The pool holds weak
+# references, an entry goes away with the last list using its node, and
+# past max_nodes entries the least recently hit one is evicted
+_InternKey = Tuple[Tuple[Any, ...], int]
+_intern_pool: 'OrderedDict[_InternKey, weakref.ref[Node[Any]]]' = \
+    OrderedDict()
+# Pool key of every pooled node by id, to stop at the first pooled node
+_intern_ids: Dict[int, _InternKey] = {}
+_intern_counts: Dict[str, int] = dict.fromkeys(
+    ('hits', 'misses', 'evictions'), 0)
+_intern_max_nodes = 1 << 20
+# Element types pooled by value, see _internable
+_INTERN_TYPES = frozenset({int, float, str, bytes, bool, type(None)})
+# True while enable_interning is on, checked once per list by _new_list
+_interning = False
+
+
+def _intern_forget(key: _InternKey,
+                   node_id: int) -> Callable[[Any], None]:
+    # Weak reference callback dropping the entry of a collected node,
+    # unless the entry was evicted or replaced in the meantime
+    def forget(ref: Any) -> None:
+        if _intern_pool.get(key) is ref:
+            del _intern_pool[key]
+            del _intern_ids[node_id]
+    return forget
+
+
+def _internable(values: Sequence[Any]) -> bool:
+    # True if values are only exact-type immutable scalars (_INTERN_TYPES,
+    # floats other than NaN) and tuples of them. For these, == with the
+    # same types means the same value; a Decimal('1.00') or a list is
+    # never swapped for an equal but different object
+    for value in values:
+        kind = type(value)
+        if kind is tuple:
+            if not _internable(value):
+                return False
+        elif kind not in _INTERN_TYPES or value != value:
+            return False
+    return True
+
+
+def _same_elements(elements: Sequence[Any],
+                   other_elements: Sequence[Any]) -> bool:
+    # True if two == tuples of _internable values are interchangeable:
+    # 1, 1.0 and True are equal dict keys, and so are 0.0 and -0.0, so
+    # types are compared throughout and floats by their bit pattern
+    for x, y in zip(elements, other_elements):
+        if x is y:
+            continue
+        kind = type(x)
+        if kind is not type(y):
+            return False
+        if kind is float and x.hex() != y.hex():
+            return False
+        if kind is tuple and not _same_elements(x, y):
+            return False
+    return True
+
+
+def _interned(head_node: 'Node[T]') -> 'Node[T]':
+    # The chain from head_node with its nodes taken from the pool, or
+    # added to it. The walk stops at the first pooled node and at the
+    # first node that cannot be pooled (typed, or other than _internable
+    # elements): that node and its tail stay as they are, so cons on any
+    # list only looks at its new nodes. The nodes in front of it are
+    # looked up from the back; a node whose next node was replaced is
+    # copied (shell only)
+    pending: List['Node[T]'] = []
+    node: Optional['Node[T]'] = head_node
+    while node is not None and id(node) not in _intern_ids:
+        elements = node._elements
+        if type(elements) is not tuple or not _internable(elements):
+            break
+        pending.append(node)
+        node = node._next
+    if not pending:
+        return head_node
+    canonical = node
+    for node in reversed(pending):
+        elements = node._elements
+        key: _InternKey = (cast(Tuple[Any, ...], elements), id(canonical))
+        ref = _intern_pool.get(key)
+        pooled = None if ref is None else ref()
+        if pooled is not None and \
+                _same_elements(pooled._elements, elements):
+            _intern_counts['hits'] += 1
+            _intern_pool.move_to_end(key)
+            canonical = pooled
+            continue
+        if node._next is not canonical:
+            node = _new_node(elements, canonical)
+        _intern_counts['misses'] += 1
+        if pooled is None:
+            _intern_pool[key] = weakref.ref(node,
+                                            _intern_forget(key, id(node)))
+            _intern_ids[id(node)] = key
+            _evict_interned(_intern_max_nodes)
+        canonical = node
+    return cast('Node[T]', canonical)
+
+
+def _evict_interned(max_nodes: int) -> None:
+    # Drops the least recently hit entries until at most max_nodes remain;
+    # their nodes stay valid, they are only no longer shared
+    while len(_intern_pool) > max_nodes:
+        key, ref = _intern_pool.popitem(last=False)
+        node = ref()
+        if node is not None:
+            del _intern_ids[id(node)]
+        _intern_counts['evictions'] += 1
+
+
+def enable_interning(max_nodes: int = 1 << 20) -> None:
+    # Hash-conses the nodes of every list built from now on: a node with
+    # the same elements (tuple nodes only) in front of the same next node
+    # is allocated once and shared, e.g. by from_list calls over
+    # overlapping windows. Two lists with equal elements in the same
+    # layout then have the same head node, so == is an identity check.
+    # Interning walks the new nodes of each result up to the first pooled
+    # node, so cons or remove on an interned list only look up the nodes
+    # they create. The pool holds its nodes weakly and keeps at most
+    # max_nodes of them, least recently hit first out. Only nodes of
+    # immutable scalars (int, float, str, bytes, bool, None) and tuples of
+    # them are pooled, so a list never gets back other values than given
+    global _interning, _intern_max_nodes
+    if max_nodes < 1:
+        raise ValueError("max_nodes must be at least 1")
+    _intern_max_nodes = max_nodes
+    _evict_interned(max_nodes)
+    _interning = True
+
+
+def disable_interning() -> None:
+    # Stops interning and empties the pool; lists built meanwhile keep
+    # sharing their nodes. The counters are kept
+    global _interning
+    _interning = False
+    _intern_pool.clear()
+    _intern_ids.clear()
+
+
+def intern_list(unrolled_list: 'ImmutableUnrolledLinkedList[T]'
+                ) -> 'ImmutableUnrolledLinkedList[T]':
+    # An equal list with the same node layout whose nodes come from the
+    # pool up to the first node that cannot be pooled, also while
+    # interning is disabled (the pool then holds only the nodes of
+    # interned lists)
+    head_node = unrolled_list._head_node
+    if head_node is None or id(head_node) in _intern_ids:
+        return unrolled_list
+    return _new_list(_interned(head_node), unrolled_list._node_size,
+                     unrolled_list._length, unrolled_list._dtype)
+
+
+def intern_stats() -> Dict[str, float]:
+    # Lookups that found a pooled node (hits) or pooled a new one
+    # (misses), evictions, the pooled node count and the hit rate
+    lookups = _intern_counts['hits'] + _intern_counts['misses']
+    return {**_intern_counts, 'nodes': len(_intern_pool),
+            'hit_rate': _intern_counts['hits'] / lookups if lookups else 0.0}
+
+
+def reset_intern_stats() -> None:
+    # Zeroes the hit, miss and eviction counters
+    for counter in _intern_counts:
+        _intern_counts[counter] = 0
@@ -0,0 +1,760 @@
+from ImmutableUnrollLinkedList import (ImmutableUnrolledLinkedList, Node,
+                                       from_list, intersection, member,
+                                       reverse, reverse_iterator, to_list,
+                                       concat_nodes, map_list, filter,
+                                       reduce, find, lazy, cons, remove,
+                                       length, concat, parallel_map,
+                                       parallel_filter, parallel_reduce,
+                                       transient, dumps, loads, set_at,
+                                       nth, from_iterable, enable_interning,
+                                       disable_interning, intern_stats,
+                                       reset_intern_stats, _iter_nodes,
+                                       _new_list, _new_node)
+import argparse
+import functools
+import json
+import operator
+import os
+import pickle
+import platform
+import random
+import tempfile
+import timeit
+import tracemalloc
+from collections import deque
+from itertools import islice
+from MappedUnrolledLinkedList import MappedUnrolledLinkedList, write_mapped
+from RopeUnrolledLinkedList import from_unrolled_list
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# Quadratic baselines are only timed up to this many elements
+BASELINE_LIMIT = 20000
+
+# Node sizes covered by the per-operation and memory benchmarks
+NODE_SIZES = [1, 2, 4, 8, 16, 32, 64, 256, 1024]
+
+# One measurement: benchmark, case (operation and variant), list size,
+# value and unit ("s" for seconds, "B" for bytes per element)
+Result = Dict[str, Any]
+
+# compare flags a case when the new value exceeds the old one by this factor
+REGRESSION_THRESHOLD = 1.10
+
+
+def _best_time(func: Callable[[], object], repeat: int = 3) -> float:
+    # Best wall time of a single call, in seconds
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def _auto_time(func: Callable[[], object], min_total: float = 0.01,
+               repeat: int = 5) -> float:
+    # Best time per call for fast operations: calls are batched until one
+    # batch takes min_total seconds, so tiny lists are timed reliably
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_total and number < 1 << 20:
+        number *= 2
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _format_short(seconds: float) -> str:
+    # Compact time for wide tables: us below 1ms, ms above
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.2f}us"
+    return f"{seconds * 1000:.2f}ms"
+
+
+def _result(case: str, size: int, value: Optional[float],
+            unit: str = "s") -> Result:
+    return {"case": case, "size": size, "value": value, "unit": unit}
+
+
+def _format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    return f"{seconds * 1000:.2f}ms"
+
+
+def _intersection_baseline(
+    unrolled_list1: ImmutableUnrolledLinkedList[T],
+    unrolled_list2: ImmutableUnrolledLinkedList[T]
+) -> ImmutableUnrolledLinkedList[T]:
+    # The previous implementation: one member() scan of list2 per element
+    values: List[T] = []
+    for current_node in _iter_nodes(unrolled_list1.head_node):
+        for val in current_node.elements:
+            if member(unrolled_list2, val):
+                values.append(val)
+    return from_list(values, unrolled_list1.node_size)
+
+
+def _reverse_baseline(
+    unrolled_list: ImmutableUnrolledLinkedList[T]
+) -> ImmutableUnrolledLinkedList[T]:
+    # The previous implementation: every node reversed through from_list
+    # and prepended with concat_nodes, keeping the input's node layout
+    reversed_head_node: Optional[Node[T]] = None
+    for current_node in _iter_nodes(unrolled_list.head_node):
+        reversed_node = from_list(list(reversed(current_node.elements)),
+                                  unrolled_list.node_size).head_node
+        reversed_head_node = concat_nodes(reversed_node, reversed_head_node)
+    return ImmutableUnrolledLinkedList[T](reversed_head_node,
+                                          unrolled_list.node_size)
+
+
+def bench_intersection(sizes: List[int],
+                       node_sizes: List[int]) -> List[Result]:
+    # Hashed and sorted intersection against the member() baseline
+    results: List[Result] = []
+    print(f"{'size':>10} {'baseline':>12} {'hashed':>12} {'sorted':>12}")
+    for size in sizes:
+        rng = random.Random(size)
+        list1 = from_list([rng.randrange(2 * size) for _ in range(size)])
+        list2 = from_list([rng.randrange(2 * size) for _ in range(size)])
+        # Lists are unhashable but orderable, so they take the sorted path
+        wrapped1 = from_list([[x] for x in list1])
+        wrapped2 = from_list([[x] for x in list2])
+
+        baseline = None
+        if size <= BASELINE_LIMIT:
+            baseline = _best_time(
+                lambda: _intersection_baseline(list1, list2), repeat=1)
+        hashed = _best_time(lambda: intersection(list1, list2))
+        sorted_path = _best_time(lambda: intersection(wrapped1, wrapped2))
+        print(f"{size:>10} {_format_time(baseline):>12} "
+              f"{_format_time(hashed):>12} {_format_time(sorted_path):>12}")
+        results += [_result("baseline", size, baseline),
+                    _result("hashed", size, hashed),
+                    _result("sorted", size, sorted_path)]
+    return results
+
+
+def bench_reverse(sizes: List[int],
+                  node_sizes: List[int]) -> List[Result]:
+    # reverse() and reverse_iterator() against the previous reverse and
+    # against rebuilding from a reversed Python list
+    results: List[Result] = []
+    print(f"{'size':>10} {'baseline':>12} {'reverse':>12} "
+          f"{'rebuild':>12} {'rev_iter':>12}")
+    for size in sizes:
+        test_list = from_list(list(range(size)))
+        baseline = _best_time(lambda: _reverse_baseline(test_list), repeat=1)
+        fast = _best_time(lambda: reverse(test_list), repeat=1)
+        rebuild = _best_time(lambda: from_list(to_list(test_list)[::-1]),
+                             repeat=1)
+        # Consume the iterator without keeping the elements
+        rev_iter = _best_time(
+            lambda: deque(reverse_iterator(test_list), maxlen=0), repeat=1)
+        print(f"{size:>10} {_format_time(baseline):>12} "
+              f"{_format_time(fast):>12} {_format_time(rebuild):>12} "
+              f"{_format_time(rev_iter):>12}")
+        results += [_result("baseline", size, baseline),
+                    _result("reverse", size, fast),
+                    _result("rebuild", size, rebuild),
+                    _result("rev_iter", size, rev_iter)]
+    return results
+
+
+def _traced_bytes(build: Callable[[], object]) -> int:
+    # Bytes still allocated after build(), measured with tracemalloc
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def bench_memory(sizes: List[int],
+                 node_sizes: List[int]) -> List[Result]:
+    # Bytes per element of the list structure itself (the element objects
+    # exist before measuring) for node sizes 1 to 1024, with Python list
+    # and tuple as baselines
+    results: List[Result] = []
+    print(f"{'size':>10} {'list':>8} {'tuple':>8} " +
+          " ".join(f"{'ns=' + str(ns):>8}" for ns in node_sizes))
+    for size in sizes:
+        values = list(range(size))
+        columns = [_traced_bytes(lambda: list(values)),
+                   _traced_bytes(lambda: tuple(values))]
+        for node_size in node_sizes:
+            columns.append(_traced_bytes(
+                lambda: from_list(values, node_size)))
+        print(f"{size:>10} " + " ".join(f"{column / size:>8.2f}"
+                                        for column in columns))
+        cases = ["list", "tuple"] + [f"ns={ns}" for ns in node_sizes]
+        results += [_result(case, size, column / size, "B")
+                    for case, column in zip(cases, columns)]
+    return results
+
+
+def bench_numeric(sizes: List[int],
+                  node_sizes: List[int]) -> List[Result]:
+    # Object lists against dtype='i8' lists for map_list, filter and
+    # reduce (map_list and filter are vectorized only with numpy, the
+    # lambdas work on single values and on arrays alike)
+    node_size = 256
+    results: List[Result] = []
+    print(f"{'size':>10} {'op':>8} {'object':>12} {'i8':>12}")
+    for size in sizes:
+        values = list(range(size))
+        lists = [from_list(values, node_size),
+                 from_list(values, node_size, dtype='i8')]
+        operations: List[Tuple[str, Callable[
+                [ImmutableUnrolledLinkedList[int]], object]]] = [
+            ("map", lambda ul: map_list(ul, lambda x: x * 3 + 1,
+                                        vectorized=True)),
+            ("filter", lambda ul: filter(ul, lambda x: x % 2 == 0,
+                                         vectorized=True)),
+            ("reduce", lambda ul: reduce(ul, operator.add, 0)),
+        ]
+        for name, operation in operations:
+            times = [_best_time(lambda: operation(ul)) for ul in lists]
+            print(f"{size:>10} {name:>8} " +
+                  " ".join(f"{_format_time(t):>12}" for t in times))
+            results += [_result(f"{name}/object", size, times[0]),
+                        _result(f"{name}/i8", size, times[1])]
+    return results
+
+
+def bench_lazy(sizes: List[int],
+               node_sizes: List[int]) -> List[Result]:
+    # Eager filter/map_list/reduce chain against the fused lazy pipeline,
+    # for a full reduction and for a query that only needs a few elements
+    results: List[Result] = []
+    print(f"{'size':>10} {'query':>8} {'eager':>12} {'lazy':>12}")
+    for size in sizes:
+        test_list = from_list(list(range(size)))
+
+        def is_even(x: int) -> bool:
+            return x % 2 == 0
+
+        def triple(x: int) -> int:
+            return x * 3
+
+        def add(acc: int, x: int) -> int:
+            return acc + x
+
+        queries: List[Tuple[str, Callable[[], object], Callable[[], object]]]
+        queries = [
+            ("reduce",
+             lambda: reduce(map_list(filter(test_list, is_even), triple),
+                            add, 0),
+             lambda: lazy(test_list).filter(is_even).map(triple).reduce(
+                 add, 0)),
+            ("find",
+             lambda: find(map_list(filter(test_list, is_even), triple),
+                          lambda x: x > 300),
+             lambda: lazy(test_list).filter(is_even).map(triple).find(
+                 lambda x: x > 300)),
+        ]
+        for name, eager, fused in queries:
+            eager_time, fused_time = _best_time(eager), _best_time(fused)
+            print(f"{size:>10} {name:>8} "
+                  f"{_format_time(eager_time):>12} "
+                  f"{_format_time(fused_time):>12}")
+            results += [_result(f"{name}/eager", size, eager_time),
+                        _result(f"{name}/lazy", size, fused_time)]
+    return results
+
+
+def bench_serialize(sizes: List[int],
+                    node_sizes: List[int]) -> List[Result]:
+    # loads() of a dumps() snapshot against rebuilding the list with
+    # from_list from a pickled Python list, for object and numeric lists
+    results: List[Result] = []
+    print(f"{'size':>10} {'list':>8} {'dumps':>12} {'loads':>12} "
+          f"{'from_list':>12}")
+    for size in sizes:
+        for kind, dtype in (("object", None), ("i8", "i8")):
+            test_list = from_list(list(range(size)), 256, dtype=dtype)
+            data = dumps(test_list)
+            python_data = pickle.dumps(to_list(test_list))
+            dump_time = _best_time(lambda: dumps(test_list))
+            load_time = _best_time(lambda: loads(data))
+            rebuild = _best_time(lambda: from_list(pickle.loads(python_data),
+                                                   256, dtype=dtype))
+            print(f"{size:>10} {kind:>8} {_format_time(dump_time):>12} "
+                  f"{_format_time(load_time):>12} "
+                  f"{_format_time(rebuild):>12}")
+            results += [_result(f"{kind}/dumps", size, dump_time),
+                        _result(f"{kind}/loads", size, load_time),
+                        _result(f"{kind}/from_list", size, rebuild)]
+    return results
+
+
+def bench_mapped(sizes: List[int],
+                 node_sizes: List[int]) -> List[Result]:
+    # Scans (reduce with operator.add and a member miss) of a mapped list,
+    # with an empty ("cold") and a full ("warm") node cache, against the
+    # same numeric list in memory, and a remove from the middle
+    results: List[Result] = []
+    print(f"{'size':>10} {'memory':>12} {'cold':>12} {'warm':>12} "
+          f"{'member':>12} {'remove':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = os.path.join(directory, f"{size}.iulm")
+            write_mapped(range(size), path, 1024, 'i8')
+            in_memory = from_list(list(range(size)), 1024, dtype='i8')
+            memory_time = _best_time(
+                lambda: reduce(in_memory, operator.add, 0))
+
+            def cold_reduce() -> Optional[int]:
+                with MappedUnrolledLinkedList[int](path) as fresh:
+                    return fresh.reduce(operator.add, 0)
+
+            cold = _best_time(cold_reduce)
+            with MappedUnrolledLinkedList[int](path,
+                                               size // 1024 + 1) as mapped:
+                warm = _best_time(lambda: mapped.reduce(operator.add, 0))
+                member_time = _best_time(lambda: mapped.member(-1))
+                remove_time = _best_time(lambda: mapped.remove(size // 2))
+            print(f"{size:>10} {_format_time(memory_time):>12} "
+                  f"{_format_time(cold):>12} {_format_time(warm):>12} "
+                  f"{_format_time(member_time):>12} "
+                  f"{_format_time(remove_time):>12}")
+            results += [_result("reduce/memory", size, memory_time),
+                        _result("reduce/cold", size, cold),
+                        _result("reduce/warm", size, warm),
+                        _result("member", size, member_time),
+                        _result("remove", size, remove_time)]
+    return results
+
+
+def _chain_split(unrolled_list: ImmutableUnrolledLinkedList[int],
+                 index: int) -> Tuple[ImmutableUnrolledLinkedList[int],
+                                      ImmutableUnrolledLinkedList[int]]:
+    # split_at for the linked chain: the prefix is copied, the suffix
+    # shares the nodes after the one holding the split
+    node_size = unrolled_list.node_size
+    prefix = from_iterable(islice(unrolled_list, index), node_size)
+    offset = 0
+    for node in _iter_nodes(unrolled_list.head_node):
+        if offset + len(node.elements) > index:
+            rest = _new_list(_new_node(node.elements[index - offset:],
+                                       node.next_node),
+                             node_size, length(unrolled_list) - index)
+            return prefix, rest
+        offset += len(node.elements)
+    return prefix, from_list([], node_size)
+
+
+def bench_rope(sizes: List[int],
+               node_sizes: List[int]) -> List[Result]:
+    # The linked chain against the chunk tree (RopeUnrolledLinkedList) with
+    # the same leaf chunks: concat of a short list behind a long one, a
+    # split in the middle, set_at followed by nth on the new version (no
+    # skip index built yet), cons and a full scan by iteration
+    results: List[Result] = []
+    print(f"{'size':>10} {'case':>8} {'chain':>12} {'rope':>12}")
+    for size in sizes:
+        chain = from_list(list(range(size)))
+        rope = from_unrolled_list(chain)
+        short_chain = from_list(list(range(10)))
+        short_rope = from_unrolled_list(short_chain)
+        middle = size // 2
+        cases: Dict[str, Tuple[Callable[[], object],
+                               Callable[[], object]]] = {
+            "concat": (lambda: concat(chain, short_chain),
+                       lambda: rope.concat(short_rope)),
+            "split": (lambda: _chain_split(chain, middle),
+                      lambda: rope.split_at(middle)),
+            "set+nth": (lambda: nth(set_at(chain, middle, -1), middle + 1),
+                        lambda: rope.set_at(middle, -1).nth(middle + 1)),
+            "cons": (lambda: cons(-1, chain), lambda: rope.cons(-1)),
+            "scan": (lambda: sum(chain), lambda: sum(rope)),
+        }
+        for case, (chain_case, rope_case) in cases.items():
+            chain_time = _best_time(chain_case)
+            rope_time = _best_time(rope_case)
+            print(f"{size:>10} {case:>8} {_format_time(chain_time):>12} "
+                  f"{_format_time(rope_time):>12}")
+            results += [_result(f"{case}/chain", size, chain_time),
+                        _result(f"{case}/rope", size, rope_time)]
+    return results
+
+
+# Number of overlapping windows in the interning benchmark
+INTERN_WINDOWS = 100
+
+
+def _windows(values: List[int], node_size: int
+             ) -> List[ImmutableUnrolledLinkedList[int]]:
+    # from_list over INTERN_WINDOWS suffixes of values that start on node
+    # boundaries, so their nodes line up
+    step = max(len(values) // INTERN_WINDOWS // node_size, 1) * node_size
+    return [from_list(values[start:], node_size)
+            for start in range(0, len(values), step)]
+
+
+def bench_interning(sizes: List[int],
+                    node_sizes: List[int]) -> List[Result]:
+    # Memory (bytes per element of the source) and build time of
+    # INTERN_WINDOWS overlapping windows without and with interning
+    results: List[Result] = []
+    node_size = 16
+    print(f"{'size':>10} {'B plain':>10} {'B intern':>10} "
+          f"{'t plain':>10} {'t intern':>10} {'hit rate':>9}")
+    for size in sizes:
+        values = list(range(size))
+        plain_bytes = _traced_bytes(lambda: _windows(values, node_size))
+        plain_time = _best_time(lambda: _windows(values, node_size))
+        enable_interning()
+        try:
+            reset_intern_stats()
+            interned_bytes = _traced_bytes(
+                lambda: _windows(values, node_size))
+            hit_rate = intern_stats()['hit_rate']
+            interned_time = _best_time(lambda: _windows(values, node_size))
+        finally:
+            disable_interning()
+        print(f"{size:>10} {plain_bytes / size:>10.2f} "
+              f"{interned_bytes / size:>10.2f} "
+              f"{_format_time(plain_time):>10} "
+              f"{_format_time(interned_time):>10} {hit_rate:>9.2f}")
+        results += [_result("memory/plain", size, plain_bytes / size, "B"),
+                    _result("memory/interned", size, interned_bytes / size,
+                            "B"),
+                    _result("build/plain", size, plain_time),
+                    _result("build/interned", size, interned_time)]
+    return results
+
+
+# Number of edits per batch in the transient benchmark
+TRANSIENT_EDITS = 1000
+
+
+def _persistent_edits(unrolled_list: ImmutableUnrolledLinkedList[int],
+                      kind: str, values: List[int]
+                      ) -> ImmutableUnrolledLinkedList[int]:
+    # One new version per edit
+    for value in values:
+        if kind == "cons":
+            unrolled_list = cons(value, unrolled_list)
+        elif kind == "remove":
+            unrolled_list = remove(unrolled_list, value)
+        else:  # append
+            unrolled_list = concat(unrolled_list, from_list([value]))
+    return unrolled_list
+
+
+def _transient_edits(unrolled_list: ImmutableUnrolledLinkedList[int],
+                     kind: str, values: List[int]
+                     ) -> ImmutableUnrolledLinkedList[int]:
+    # The same edits in place on one transient
+    with transient(unrolled_list) as edits:
+        edit = getattr(edits, kind)
+        for value in values:
+            edit(value)
+    return edits.freeze()
+
+
+def bench_transient(sizes: List[int],
+                    node_sizes: List[int]) -> List[Result]:
+    # A batch of TRANSIENT_EDITS cons, remove (spread over the list) and
+    # append calls, one persistent version per edit against one transient
+    results: List[Result] = []
+    print(f"{'size':>10} {'edit':>8} {'persistent':>12} {'transient':>12}")
+    for size in sizes:
+        test_list = from_list(list(range(size)))
+        step = max(size // TRANSIENT_EDITS, 1)
+        edits = {"cons": list(range(TRANSIENT_EDITS)),
+                 "remove": list(range(0, size, step))[:TRANSIENT_EDITS],
+                 "append": list(range(TRANSIENT_EDITS))}
+        for kind, values in edits.items():
+            persistent: Optional[float] = None
+            if kind == "cons" or size <= BASELINE_LIMIT * 5:
+                persistent = _best_time(
+                    lambda: _persistent_edits(test_list, kind, values))
+            batched = _best_time(
+                lambda: _transient_edits(test_list, kind, values))
+            print(f"{size:>10} {kind:>8} {_format_time(persistent):>12} "
+                  f"{_format_time(batched):>12}")
+            results += [_result(f"{kind}/persistent", size, persistent),
+                        _result(f"{kind}/transient", size, batched)]
+    return results
+
+
+def _cpu_heavy(x: int) -> int:
+    # CPU-bound callback for the parallel benchmark, a few microseconds
+    # per call; module-level so worker processes can unpickle it
+    return sum(i * i for i in range(x % 64))
+
+
+def _cpu_heavy_predicate(x: int) -> bool:
+    return _cpu_heavy(x) % 3 == 0
+
+
+def _cpu_heavy_max(acc: int, x: int) -> int:
+    # Associative, as parallel_reduce requires: the work is thrown away
+    _cpu_heavy(x)
+    return max(acc, x)
+
+
+def bench_parallel(sizes: List[int],
+                   node_sizes: List[int]) -> List[Result]:
+    # map_list, filter and reduce with a CPU-heavy callback against their
+    # process-pool versions on 1, 2, 4, ... workers up to the CPU count
+    # (pool start-up included)
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({min(1 << i, cpus)
+                            for i in range(cpus.bit_length() + 1)})
+    results: List[Result] = []
+    print(f"{'size':>10} {'op':>8} {'serial':>12} " +
+          " ".join(f"{'w=' + str(w):>12}" for w in worker_counts))
+    for size in sizes:
+        test_list = from_list(list(range(size)), 64)
+        operations: List[Tuple[str, Callable[[], object],
+                               Callable[[int], object]]] = [
+            ("map", lambda: map_list(test_list, _cpu_heavy),
+             lambda w: parallel_map(test_list, _cpu_heavy, w)),
+            ("filter", lambda: filter(test_list, _cpu_heavy_predicate),
+             lambda w: parallel_filter(test_list, _cpu_heavy_predicate, w)),
+            ("reduce", lambda: reduce(test_list, _cpu_heavy_max, 0),
+             lambda w: parallel_reduce(test_list, _cpu_heavy_max, 0, w)),
+        ]
+        for name, serial, parallel in operations:
+            times = [_best_time(serial, repeat=1)]
+            for workers in worker_counts:
+                times.append(_best_time(lambda: parallel(workers), repeat=1))
+            print(f"{size:>10} {name:>8} " +
+                  " ".join(f"{_format_time(t):>12}" for t in times))
+            results.append(_result(f"{name}/serial", size, times[0]))
+            results += [_result(f"{name}/workers={workers}", size, t)
+                        for workers, t in zip(worker_counts, times[1:])]
+    return results
+
+
+def _ops_cases(size: int, node_size: int) -> Dict[str, Tuple[
+        Callable[[], object], Callable[[], object], Callable[[], object]]]:
+    # operation -> (unrolled list, list baseline, tuple baseline) calls,
+    # worst cases where it matters: the last element or a missing one
+    values = list(range(size))
+    values_tuple = tuple(values)
+    ul = from_list(values, node_size)
+    other_values = list(range(size // 2, size + size // 2))
+    other = from_list(other_values, node_size)
+    last = size - 1
+
+    def remove_list() -> object:
+        copy = list(values)
+        copy.remove(last)
+        return copy
+
+    def intersection_baseline(items: Any) -> List[int]:
+        other_set = set(other_values)
+        return [x for x in items if x in other_set]
+
+    def is_negative(x: int) -> bool:
+        return x < 0
+
+    def is_even(x: int) -> bool:
+        return x % 2 == 0
+
+    def increment(x: int) -> int:
+        return x + 1
+
+    return {
+        "cons": (lambda: cons(-1, ul),
+                 lambda: [-1] + values,
+                 lambda: (-1, ) + values_tuple),
+        "remove": (lambda: remove(ul, last),
+                   remove_list,
+                   lambda: values_tuple[:last] + values_tuple[last + 1:]),
+        # A fresh list each call, the cached count would make it O(1)
+        "length": (lambda: length(ImmutableUnrolledLinkedList[int](
+                       ul.head_node, node_size)),
+                   lambda: len(values),
+                   lambda: len(values_tuple)),
+        "member": (lambda: member(ul, -1),
+                   lambda: -1 in values,
+                   lambda: -1 in values_tuple),
+        "reverse": (lambda: reverse(ul),
+                    lambda: values[::-1],
+                    lambda: values_tuple[::-1]),
+        "intersection": (lambda: intersection(ul, other),
+                         lambda: intersection_baseline(values),
+                         lambda: tuple(intersection_baseline(values_tuple))),
+        "to_list": (lambda: to_list(ul),
+                    lambda: list(values),
+                    lambda: list(values_tuple)),
+        "from_list": (lambda: from_list(values, node_size),
+                      lambda: list(values),
+                      lambda: tuple(values)),
+        "find": (lambda: find(ul, is_negative),
+                 lambda: next((x for x in values if is_negative(x)), None),
+                 lambda: next((x for x in values_tuple if is_negative(x)),
+                              None)),
+        "filter": (lambda: filter(ul, is_even),
+                   lambda: [x for x in values if is_even(x)],
+                   lambda: tuple(x for x in values_tuple if is_even(x))),
+        "map_list": (lambda: map_list(ul, increment),
+                     lambda: [increment(x) for x in values],
+                     lambda: tuple(increment(x) for x in values_tuple)),
+        "reduce": (lambda: reduce(ul, operator.add, 0),
+                   lambda: functools.reduce(operator.add, values, 0),
+                   lambda: functools.reduce(operator.add, values_tuple, 0)),
+        "concat": (lambda: concat(ul, ul),
+                   lambda: values + values,
+                   lambda: values_tuple + values_tuple),
+        "iterate": (lambda: deque(iter(ul), maxlen=0),
+                    lambda: deque(values, maxlen=0),
+                    lambda: deque(values_tuple, maxlen=0)),
+    }
+
+
+def bench_ops(sizes: List[int], node_sizes: List[int]) -> List[Result]:
+    # Time per call of every public operation for each node size, against
+    # the same operation on a Python list and tuple. Fast calls are batched
+    # (see _auto_time), so sizes from 10 up to 10**7 can be compared
+    results: List[Result] = []
+    print(f"{'size':>10} {'op':>12} {'list':>10} {'tuple':>10} " +
+          " ".join(f"{'ns=' + str(ns):>10}" for ns in node_sizes))
+    for size in sizes:
+        rows: Dict[str, List[float]] = {}
+        for index, node_size in enumerate(node_sizes):
+            for name, (unrolled, as_list, as_tuple) in _ops_cases(
+                    size, node_size).items():
+                if index == 0:  # Baselines do not depend on node_size
+                    rows[name] = [_auto_time(as_list), _auto_time(as_tuple)]
+                    results += [_result(f"{name}/list", size, rows[name][0]),
+                                _result(f"{name}/tuple", size,
+                                        rows[name][1])]
+                seconds = _auto_time(unrolled)
+                rows[name].append(seconds)
+                results.append(_result(f"{name}/ns={node_size}", size,
+                                       seconds))
+        for name, times in rows.items():
+            print(f"{size:>10} {name:>12} " +
+                  " ".join(f"{_format_short(t):>10}" for t in times))
+    return results
+
+
+def _values_by_case(results: List[Result], relative: bool
+                    ) -> Dict[Tuple[str, str, int], float]:
+    # (benchmark, case, size) -> value. With relative=True every case that
+    # has a "<op>/list" baseline in the same run is divided by it, which
+    # cancels out how fast the machine was during that run
+    values = {(result["benchmark"], result["case"], result["size"]):
+              result["value"] for result in results
+              if result["value"] is not None}
+    if not relative:
+        return values
+    normalized: Dict[Tuple[str, str, int], float] = {}
+    for (benchmark, case, size), value in values.items():
+        operation, _, variant = case.partition("/")
+        baseline = values.get((benchmark, operation + "/list", size))
+        if variant in ("list", "tuple") or not baseline:
+            continue  # Baselines only serve as the reference
+        normalized[(benchmark, case, size)] = value / baseline
+    return normalized
+
+
+def compare_results(old: List[Result], new: List[Result],
+                    threshold: float = REGRESSION_THRESHOLD,
+                    relative: bool = False
+                    ) -> List[Tuple[Tuple[str, str, int], float]]:
+    # Cases measured in both runs whose new value exceeds the old one by
+    # more than threshold, with the new/old ratio. Lower is better for
+    # every unit (seconds and bytes per element)
+    old_values = _values_by_case(old, relative)
+    regressions: List[Tuple[Tuple[str, str, int], float]] = []
+    for key, value in _values_by_case(new, relative).items():
+        old_value = old_values.get(key)
+        if not old_value:
+            continue  # Not measured in both runs
+        if value / old_value > threshold:
+            regressions.append((key, value / old_value))
+    return regressions
+
+
+def _compare_files(old_path: str, new_path: str, threshold: float,
+                   relative: bool) -> int:
+    # Prints the regressions between two JSON result files; the exit code
+    # is 1 when there are any, so the compare mode can gate CI
+    with open(old_path) as old_file, open(new_path) as new_file:
+        old, new = json.load(old_file), json.load(new_file)
+    regressions = compare_results(old["results"], new["results"], threshold,
+                                  relative)
+    for (benchmark, case, size), ratio in regressions:
+        print(f"REGRESSION {benchmark} {case} size={size}: {ratio:.2f}x")
+    print(f"{len(regressions)} regression(s) above {threshold:.2f}x")
+    return 1 if regressions else 0
+
+
+# name -> (benchmark, default list sizes)
+BENCHMARKS: Dict[str, Tuple[Callable[[List[int], List[int]], List[Result]],
+                            List[int]]] = {
+    "ops": (bench_ops, [10, 1000, 100000]),
+    "intersection": (bench_intersection, [1000, 10000, 100000]),
+    "reverse": (bench_reverse, [100000, 1000000, 10000000]),
+    "memory": (bench_memory, [1000, 100000]),
+    "numeric": (bench_numeric, [100000, 1000000]),
+    "lazy": (bench_lazy, [100000, 1000000]),
+    "parallel": (bench_parallel, [100000, 1000000]),
+    "transient": (bench_transient, [1000, 100000]),
+    "serialize": (bench_serialize, [100000, 1000000]),
+    "mapped": (bench_mapped, [1000000, 10000000]),
+    "rope": (bench_rope, [1000, 100000, 1000000]),
+    "interning": (bench_interning, [10000, 100000]),
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks for ImmutableUnrollLinkedList")
+    parser.add_argument("benchmarks", nargs="*",
+                        help="benchmarks to run, any of: " +
+                        ", ".join(BENCHMARKS) + " (default: all)")
+    parser.add_argument("--sizes",
+                        help="comma separated list sizes "
+                        "(default: per benchmark)")
+    parser.add_argument("--node-sizes",
+                        help="comma separated node sizes for ops and memory "
+                        "(default: " + ",".join(map(str, NODE_SIZES)) + ")")
+    parser.add_argument("--json", metavar="PATH",
+                        help="write all results to PATH as JSON")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="compare two JSON result files and report "
+                        "regressions instead of running benchmarks")
+    parser.add_argument("--threshold", type=float,
+                        default=REGRESSION_THRESHOLD,
+                        help="new/old ratio reported as a regression "
+                        f"(default: {REGRESSION_THRESHOLD})")
+    parser.add_argument("--relative", action="store_true",
+                        help="with --compare, compare each case relative to "
+                        "its list baseline of the same run, for results "
+                        "from different or busy machines")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return _compare_files(args.compare[0], args.compare[1],
+                              args.threshold, args.relative)
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark: {name}")
+    node_sizes = NODE_SIZES
+    if args.node_sizes:
+        node_sizes = [int(size) for size in args.node_sizes.split(",")]
+    results: List[Result] = []
+    for name in args.benchmarks or list(BENCHMARKS):
+        benchmark, sizes = BENCHMARKS[name]
+        if args.sizes:
+            sizes = [int(size) for size in args.sizes.split(",")]
+        print(f"== {name}")
+        for result in benchmark(sizes, node_sizes):
+            results.append(dict(result, benchmark=name))
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump({"python": platform.python_version(),
+                       "results": results}, json_file, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
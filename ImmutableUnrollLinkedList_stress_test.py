@@ -0,0 +1,157 @@
+from ImmutableUnrollLinkedList import (ImmutableUnrolledLinkedList, Node,
+                                       cons, length, concat, concat_nodes,
+                                       reduce, remove, reverse, map_list,
+                                       member, to_list, filter, find,
+                                       from_list, empty, intersection,
+                                       iterator, nth, reverse_iterator,
+                                       lazy, from_iterable, iter_chunks,
+                                       cons_many, repack, node_fill_stats,
+                                       parallel_map, parallel_filter,
+                                       parallel_reduce, threaded_map_list,
+                                       amap_list, remove_all, remove_where,
+                                       remove_first_n, dumps, loads, set_at,
+                                       insert_at, delete_at, intern_list,
+                                       disable_interning)
+import asyncio
+import operator
+import os
+import pickle
+import unittest
+from typing import List
+
+# Stress sizes, 10**4 by default so the regular (coverage) test run stays
+# fast. Set IULL_STRESS_SIZES to run the large lists, e.g.
+# IULL_STRESS_SIZES=1000000,10000000 (the stress CI job runs 10**6)
+STRESS_SIZES: List[int] = [
+    int(size) for size in os.environ.get("IULL_STRESS_SIZES",
+                                         "10000").split(",")
+]
+
+
+class TestStressImmutableUnrollLinkedList(unittest.TestCase):
+
+    def test_every_function_on_large_lists(self) -> None:
+        for size in STRESS_SIZES:
+            with self.subTest(size=size):
+                self._check_size(size)
+
+    def _check_size(self, size: int) -> None:
+        values: List[int] = list(range(size))
+        ul: ImmutableUnrolledLinkedList[int] = from_list(values)
+        small: ImmutableUnrolledLinkedList[int] = from_list(
+            [size - 1, -1, 0])
+
+        # length, to_list, iteration
+        self.assertEqual(length(ul), size)
+        self.assertEqual(to_list(ul), values)
+        self.assertEqual(sum(1 for _ in iterator(ul)), size)
+        self.assertEqual(next(iter(ul)), 0)
+
+        # member and find reach the last node
+        self.assertTrue(member(ul, size - 1))
+        self.assertFalse(member(ul, size))
+        self.assertEqual(find(ul, lambda x: x == size - 1), (True, size - 1))
+        self.assertEqual(find(ul, lambda x: x < 0), (False, None))
+
+        # remove path-copies up to the last node and shares nothing after
+        removed = remove(ul, size - 1)
+        self.assertEqual(length(removed), size - 1)
+        self.assertFalse(member(removed, size - 1))
+        self.assertIs(remove(ul, -1), ul)
+        # Multi-element removal runs in one pass
+        self.assertEqual(length(remove_all(ul, [0, size // 2, size - 1])),
+                         size - 3)
+        self.assertEqual(length(remove_where(ul, lambda x: x % 2 == 0)),
+                         size // 2)
+        self.assertEqual(to_list(remove_first_n(ul, 0, 2))[:2], [1, 2])
+
+        # Positional updates copy only the path up to the index
+        self.assertEqual(nth(set_at(ul, size // 2, -1), size // 2), -1)
+        self.assertEqual(length(insert_at(ul, size - 1, -1)), size + 1)
+        self.assertEqual(nth(delete_at(ul, 0), 0), 1)
+
+        # cons onto a large list
+        self.assertEqual(length(cons(-1, ul)), size + 1)
+
+        # reverse, filter, map_list, reduce
+        self.assertEqual(to_list(reverse(ul)), values[::-1])
+        self.assertEqual(length(filter(ul, lambda x: x % 2 == 0)),
+                         (size + 1) // 2)
+        self.assertEqual(reduce(map_list(ul, lambda x: x * 2),
+                                lambda acc, x: acc + x, 0),
+                         size * (size - 1))
+
+        # intersection, concat, concat_nodes
+        self.assertEqual(to_list(intersection(ul, small)), [0, size - 1])
+        self.assertEqual(to_list(intersection(small, ul)), [size - 1, 0])
+        self.assertEqual(length(concat(ul, ul)), 2 * size)
+        self.assertEqual(length(concat(ul, empty())), size)
+        chained = concat_nodes(ul.head_node, small.head_node)
+        self.assertEqual(
+            length(ImmutableUnrolledLinkedList[int](chained)), size + 3)
+
+        # Indexed access, reverse iteration and the lazy pipeline
+        self.assertEqual(nth(ul, size - 1), size - 1)
+        self.assertEqual(ul[-size], 0)
+        self.assertEqual(next(reverse_iterator(ul)), size - 1)
+        self.assertEqual(lazy(ul).filter(lambda x: x % 2 == 1).take(2)
+                         .to_list(), [1, 3])
+        self.assertEqual(lazy(ul).map(lambda x: x + 1).materialize(),
+                         map_list(ul, lambda x: x + 1))
+
+        # Streaming in and out
+        streamed = from_iterable(x for x in range(size))
+        self.assertEqual(streamed, ul)
+        self.assertEqual(hash(streamed), hash(ul))
+        self.assertNotEqual(hash(removed), hash(ul))
+        self.assertEqual(sum(len(chunk) for chunk in iter_chunks(ul)), size)
+
+        # Serialization and pickling walk the nodes in a loop
+        self.assertEqual(loads(dumps(ul)), ul)
+        self.assertEqual(pickle.loads(pickle.dumps(ul)), ul)
+        numeric = from_list(values, 256, dtype='i8')
+        self.assertEqual(loads(dumps(numeric)), numeric)
+
+        # Process-pool versions, with module-level callbacks
+        self.assertEqual(parallel_map(ul, operator.neg, 2),
+                         map_list(ul, operator.neg))
+        self.assertEqual(length(parallel_filter(ul, bool, 2)), size - 1)
+        self.assertEqual(parallel_reduce(ul, operator.add, 0, 2),
+                         size * (size - 1) // 2)
+
+        # Thread-pool and asyncio maps
+        self.assertEqual(threaded_map_list(ul, operator.neg, 4),
+                         map_list(ul, operator.neg))
+
+        async def negate(x: int) -> int:
+            return -x
+
+        self.assertEqual(asyncio.run(amap_list(ul, negate, 16)),
+                         map_list(ul, operator.neg))
+
+        # Bulk prepend and repacking
+        prepended = cons_many(values, ul)
+        self.assertEqual(length(prepended), 2 * size)
+        self.assertIs(repack(ul), ul)
+        fragmented = concat(small, ul)
+        self.assertEqual(repack(fragmented), fragmented)
+        self.assertEqual(node_fill_stats(repack(ul, 8))["elements"], size)
+
+        # __eq__ and __str__ walk the whole chain
+        self.assertEqual(ul, from_list(values))
+        self.assertNotEqual(ul, removed)
+        self.assertTrue(str(ul).endswith(f"{size - 1}]"))
+        head = ul.head_node
+        assert head is not None
+        self.assertEqual(head, Node[int](head.elements, head.next_node))
+
+        # Interning walks the whole chain in a loop, a second equal list
+        # then shares every node
+        self.addCleanup(disable_interning)
+        interned = intern_list(ul)
+        self.assertIs(intern_list(from_list(values)).head_node,
+                      interned.head_node)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,15 +1,57 @@
-from ImmutableUnrollLinkedList import (ImmutableUnrolledLinkedList, cons,
-                                       length, concat, reduce, remove, reverse,
+from ImmutableUnrollLinkedList import (ImmutableUnrolledLinkedList, Node,
+                                       cons, length, concat, reduce, remove,
+                                       reverse,
                                        map_list, member, to_list, filter, find,
-                                       from_list, empty, intersection)
+                                       from_list, empty, intersection, nth,
+                                       reverse_iterator, lazy,
+                                       from_iterable, iter_chunks, cons_many,
+                                       repack, node_fill_stats,
+                                       autotune_node_size,
+                                       get_default_node_size,
+                                       set_default_node_size, parallel_map,
+                                       parallel_filter, parallel_reduce,
+                                       threaded_map_list, amap_list, transient,
+                                       remove_all, remove_where,
+                                       remove_first_n, dump, load, dumps,
+                                       loads, set_at, insert_at, delete_at,
+                                       enable_interning, disable_interning,
+                                       intern_list, intern_stats,
+                                       reset_intern_stats)
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from hypothesis import given
 import hypothesis.strategies as st
+import asyncio
+import copy
+import functools
+import importlib.util
+import io
+import math
+import operator
+import pickle
+import threading
+import time
 import unittest
+import unittest.mock
+import ImmutableUnrollLinkedList
+from fractions import Fraction
 from typing import List, Any, Optional, TypeVar
 
 T = TypeVar('T')
 
 
+def _last_nodes(unrolled_list: ImmutableUnrolledLinkedList[T],
+                count: int) -> List[Node[T]]:
+    # The last count nodes of a list
+    nodes: List[Node[T]] = []
+    node = unrolled_list.head_node
+    while node is not None:
+        nodes.append(node)
+        node = node.next_node
+    return nodes[-count:]
+
+
 class TestImmutableUnrollLinkedList(unittest.TestCase):
 
     @given(a=st.lists(st.integers() | st.none()),
@@ -54,6 +96,62 @@ class TestImmutableUnrollLinkedList(unittest.TestCase):
         self.assertEqual(str(remove(l1, None)), "[1]")
         self.assertEqual(str(remove(l1, 1)), "[None]")
 
+    def test_remove_many(self) -> None:
+        test_list = from_list(list(range(20)), node_size=4)
+        removed = remove_all(test_list, [1, 2, 5, 6, 100])
+        self.assertEqual(to_list(removed),
+                         [x for x in range(20) if x not in (1, 2, 5, 6)])
+        self.assertEqual(len(removed), 16)
+        # Underfull neighbours are merged, the untouched suffix is shared
+        self.assertEqual(str(removed), "[0, 3, 4, 7], [8, 9, 10, 11], "
+                         "[12, 13, 14, 15], [16, 17, 18, 19]")
+        self.assertEqual(_last_nodes(removed, 3), _last_nodes(test_list, 3))
+        for new_node, old_node in zip(_last_nodes(removed, 3),
+                                      _last_nodes(test_list, 3)):
+            self.assertIs(new_node, old_node)
+        self.assertIs(remove_all(test_list, [100]), test_list)
+        self.assertIs(remove_all(test_list, []), test_list)
+        self.assertEqual(to_list(remove_all(test_list, range(20))), [])
+        self.assertEqual(to_list(remove_all(from_list([[1], [2], [1]]),
+                                            [[1]])), [[2]])
+        self.assertEqual(to_list(remove_where(test_list,
+                                              lambda x: x % 3 == 0)),
+                         [x for x in range(20) if x % 3 != 0])
+        self.assertEqual(
+            to_list(remove_first_n(from_list([1, 2, 1, 3, 1, 4, 1], 2),
+                                   1, 3)), [2, 3, 4, 1])
+        self.assertEqual(to_list(remove_first_n(test_list, 5, 10)),
+                         to_list(remove(test_list, 5)))
+        self.assertIs(remove_first_n(test_list, 5, 0), test_list)
+        with self.assertRaises(ValueError):
+            remove_first_n(test_list, 5, -1)
+        numeric = remove_where(from_list(list(range(10)), 4, dtype='f8'),
+                               lambda x: x > 6)
+        self.assertEqual(numeric.dtype, 'f8')
+        self.assertEqual(to_list(numeric), list(range(7)))
+
+    @given(st.lists(st.integers(0, 9)), st.lists(st.integers(0, 9)),
+           st.integers(min_value=0, max_value=5),
+           st.sampled_from([1, 2, 3, 4, 64]))
+    def test_remove_many_matches_naive(self, values: List[int],
+                                       removed: List[int], n: int,
+                                       node_size: int) -> None:
+        test_list = from_list(values, node_size)
+        result = remove_all(test_list, removed)
+        self.assertEqual(to_list(result),
+                         [x for x in values if x not in removed])
+        self.assertEqual(len(result), len(to_list(result)))
+        self.assertEqual(to_list(remove_where(test_list,
+                                              lambda x: x % 2 == 0)),
+                         [x for x in values if x % 2 != 0])
+        expected = list(values)
+        for _ in range(n):
+            if 3 in expected:
+                expected.remove(3)
+        self.assertEqual(to_list(remove_first_n(test_list, 3, n)), expected)
+        for node in iter_chunks(result):
+            self.assertLessEqual(len(node), node_size)
+
     def test_length(self) -> None:
         empty_list: ImmutableUnrolledLinkedList[
             Optional[int]] = ImmutableUnrolledLinkedList[Optional[int]]()
@@ -89,6 +187,519 @@ class TestImmutableUnrollLinkedList(unittest.TestCase):
         for e in test_data:
             self.assertEqual(to_list(from_list(e)), e)
 
+    def test_from_iterable(self) -> None:
+        generated = from_iterable((x * x for x in range(10)), node_size=3)
+        self.assertEqual(generated, from_list([x * x for x in range(10)], 3))
+        self.assertEqual(str(generated), str(from_list(
+            [x * x for x in range(10)], 3)))
+        self.assertEqual(len(generated), 10)
+        self.assertEqual(from_iterable(iter([])), empty())
+
+        reader = io.StringIO("a\nb\nc\n")
+        self.assertEqual(to_list(from_iterable(reader)), ["a\n", "b\n", "c\n"])
+
+        numeric: ImmutableUnrolledLinkedList[int] = from_iterable(
+            range(6), dtype='i8')
+        self.assertEqual(numeric.dtype, 'i8')
+        self.assertEqual(to_list(numeric), list(range(6)))
+
+    def test_iter_chunks(self) -> None:
+        test_list: ImmutableUnrolledLinkedList[int] = from_list(
+            [1, 2, 3, 4, 5], node_size=2)
+        chunks = list(iter_chunks(test_list))
+        self.assertEqual(chunks, [(1, 2), (3, 4), (5, )])
+        # The node tuples themselves, no copies
+        assert test_list.head_node is not None
+        self.assertIs(chunks[0], test_list.head_node.elements)
+        self.assertEqual(list(iter_chunks(empty())), [])
+        self.assertEqual(from_iterable(
+            (x for chunk in iter_chunks(test_list) for x in chunk), 2),
+            test_list)
+
+    def test_cons_many(self) -> None:
+        test_list: ImmutableUnrolledLinkedList[int] = from_list(
+            [5, 6, 7, 8, 9], node_size=2)
+        prepended = cons_many([0, 1, 2, 3, 4], test_list)
+        self.assertEqual(to_list(prepended), list(range(10)))
+        self.assertEqual(len(prepended), 10)
+        # Packed batch, remainder in the head node, list shared as is
+        self.assertEqual(str(prepended),
+                         "[0], [1, 2], [3, 4], [5, 6], [7, 8], [9]")
+        assert test_list.head_node is not None
+        node = prepended.head_node
+        for _ in range(3):
+            assert node is not None
+            node = node.next_node
+        self.assertIs(node, test_list.head_node)
+        # A partly filled head node is merged into the batch
+        self.assertEqual(str(cons_many([1, 2], from_list([3], 2))),
+                         "[1], [2, 3]")
+        self.assertIs(cons_many([], test_list), test_list)
+        self.assertEqual(to_list(cons_many(iter([1, 2]))), [1, 2])
+        numeric = cons_many([1, 2], from_list([3, 4], 4, dtype='i8'))
+        self.assertEqual(numeric.dtype, 'i8')
+        self.assertEqual(to_list(numeric), [1, 2, 3, 4])
+
+    def test_transient(self) -> None:
+        source: ImmutableUnrolledLinkedList[int] = from_list(
+            list(range(12)), node_size=4)
+        with transient(source) as edits:
+            edits.cons(-1)
+            edits.remove(5)
+            edits.extend([12, 13])
+            edits.append(14)
+            edits.remove(100)
+            self.assertEqual(len(edits), 15)
+        frozen = edits.freeze()
+        self.assertIs(edits.freeze(), frozen)
+        self.assertEqual(to_list(frozen),
+                         [-1] + [x for x in range(15) if x != 5])
+        self.assertEqual(str(frozen), "[-1], [0, 1, 2, 3], [4, 6, 7], "
+                         "[8, 9, 10, 11], [12, 13, 14]")
+        self.assertEqual(len(frozen), 15)
+        self.assertEqual(to_list(source), list(range(12)))
+        with self.assertRaises(RuntimeError):
+            edits.append(15)
+        # Nodes in front of the first edit are not copied, untouched nodes
+        # behind the last edit are shared
+        with transient(source) as edits:
+            edits.remove(5)
+        frozen = edits.freeze()
+        self.assertIs(_last_nodes(frozen, 1)[0],
+                      _last_nodes(source, 1)[0])
+        head = frozen.head_node
+        assert head is not None
+        self.assertIsInstance(head.elements, tuple)
+        self.assertEqual(hash(frozen), hash(remove(source, 5)))
+        # Emptied nodes are unlinked, an unedited transient returns the
+        # source as is
+        with transient(from_list([1, 2, 3], 2)) as edits:
+            edits.remove(3)
+            edits.remove(1)
+            edits.remove(2)
+        self.assertEqual(to_list(edits.freeze()), [])
+        self.assertIsNone(edits.freeze().head_node)
+        with transient(source) as edits:
+            edits.remove(100)
+        self.assertIs(edits.freeze(), source)
+        numeric = transient(from_list([1, 2, 3], 2, dtype='i8'))
+        numeric.extend([4, 5])
+        numeric.cons(0)
+        self.assertEqual(numeric.freeze().dtype, 'i8')
+        self.assertEqual(to_list(numeric.freeze()), [0, 1, 2, 3, 4, 5])
+
+    @given(st.lists(st.integers(0, 9)),
+           st.lists(st.tuples(st.sampled_from(['cons', 'append', 'remove']),
+                              st.integers(0, 9))),
+           st.integers(min_value=1, max_value=4))
+    def test_transient_matches_persistent(self, values: List[int],
+                                          edits: List[Any],
+                                          node_size: int) -> None:
+        source = from_list(values, node_size)
+        expected = list(values)
+        builder = transient(source)
+        for operation, value in edits:
+            getattr(builder, operation)(value)
+            if operation == 'cons':
+                expected.insert(0, value)
+            elif operation == 'append':
+                expected.append(value)
+            elif value in expected:
+                expected.remove(value)
+        frozen = builder.freeze()
+        self.assertEqual(to_list(frozen), expected)
+        self.assertEqual(len(frozen), len(expected))
+        self.assertEqual(to_list(source), values)
+        for node in iter_chunks(frozen):
+            self.assertLessEqual(len(node), node_size)
+
+    def test_repack(self) -> None:
+        # Concatenating short lists leaves partly filled nodes behind
+        fragmented: ImmutableUnrolledLinkedList[int] = empty(4)
+        for start in range(1, 19, 3):
+            fragmented = concat(fragmented,
+                                from_list([start, start + 1, start + 2], 4))
+        fragmented = concat(fragmented, from_list(list(range(19, 28)), 4))
+        stats = node_fill_stats(fragmented)
+        self.assertEqual(stats["nodes"], 9)
+        self.assertEqual(stats["elements"], 27)
+        self.assertEqual(stats["full_nodes"], 2)
+        self.assertEqual(stats["fill_ratio"], 27 / 36)
+
+        packed = repack(fragmented)
+        self.assertEqual(packed, fragmented)
+        self.assertEqual(len(packed), 27)
+        self.assertEqual(str(packed), "[1, 2], [3, 4, 5, 6], [7, 8, 9, 10], "
+                         "[11, 12, 13, 14], [15, 16, 17, 18], "
+                         "[19, 20, 21, 22], [23, 24, 25, 26], [27]")
+        # The packed suffix of from_list nodes is shared
+        shared = packed.head_node
+        for _ in range(5):
+            assert shared is not None
+            shared = shared.next_node
+        self.assertIs(shared, _last_nodes(fragmented, 3)[0])
+        # Repacking a packed list is free, a new node size rebuilds it
+        self.assertIs(repack(packed), packed)
+        resized = repack(packed, 8)
+        self.assertEqual(resized.node_size, 8)
+        self.assertEqual(to_list(resized), list(range(1, 28)))
+        self.assertEqual(node_fill_stats(resized)["nodes"], 5)
+        self.assertEqual(node_fill_stats(empty())["fill_ratio"], 1.0)
+
+    @given(st.lists(st.lists(st.integers(), max_size=5), max_size=6),
+           st.integers(min_value=1, max_value=5))
+    def test_repack_packs_nodes(self, batches: List[List[int]],
+                                node_size: int) -> None:
+        test_list: ImmutableUnrolledLinkedList[int] = empty(node_size)
+        values: List[int] = []
+        for batch in batches:
+            test_list = concat(from_list(batch, node_size),
+                               cons(len(batch), test_list))
+            values = batch + [len(batch)] + values
+        packed = repack(test_list)
+        self.assertEqual(to_list(packed), values)
+        stats = node_fill_stats(packed)
+        # Only the head and the last node may be partly filled
+        self.assertGreaterEqual(stats["full_nodes"], stats["nodes"] - 2)
+        self.assertIs(repack(packed), packed)
+        if values:  # The last node is always shared
+            self.assertIs(_last_nodes(packed, 1)[0],
+                          _last_nodes(test_list, 1)[0])
+
+    def test_default_node_size(self) -> None:
+        self.assertEqual(get_default_node_size(), 4)
+        self.addCleanup(set_default_node_size, 4)
+        set_default_node_size(16)
+        self.assertEqual(from_list([1, 2, 3]).node_size, 16)
+        self.assertEqual(from_iterable(iter([1])).node_size, 16)
+        self.assertEqual(empty().node_size, 16)
+        self.assertEqual(cons(1).node_size, 16)
+        self.assertEqual(ImmutableUnrolledLinkedList[int]().node_size, 16)
+        # An explicit node_size still wins
+        self.assertEqual(from_list([1, 2, 3], 2).node_size, 2)
+        with self.assertRaises(ValueError):
+            set_default_node_size(0)
+
+    def test_node_size_auto(self) -> None:
+        self.assertEqual(from_list([1, 2], 'auto').node_size, 4)
+        self.assertEqual(from_list(list(range(1000)), 'auto').node_size, 64)
+        self.assertEqual(
+            from_list([str(x) for x in range(10 ** 6)], 'auto').node_size,
+            64)
+        self.assertEqual(
+            from_list(list(range(10 ** 6)), 'auto', dtype='i8').node_size,
+            512)
+        with self.assertRaises(ValueError):
+            from_list([1], 'big')
+
+    def test_autotune_node_size(self) -> None:
+        self.addCleanup(set_default_node_size, 4)
+        sample = list(range(200))
+        tuned = autotune_node_size(sample, "read", candidates=(2, 8, 32))
+        self.assertIn(tuned, (2, 8, 32))
+        self.assertEqual(get_default_node_size(), 4)
+        tuned = autotune_node_size(sample, {"cons": 1, "iterate": 2},
+                                   candidates=(2, 8), set_default=True)
+        self.assertEqual(get_default_node_size(), tuned)
+        with self.assertRaises(ValueError):
+            autotune_node_size([], "read")
+        with self.assertRaises(ValueError):
+            autotune_node_size(sample, {"sort": 1})
+        with self.assertRaises(ValueError):
+            autotune_node_size(sample, "writes")
+
+    def test_parallel(self) -> None:
+        values = list(range(-50, 50))
+        test_list: ImmutableUnrolledLinkedList[int] = from_list(values, 3)
+        # Module-level functions, so they can be sent to worker processes
+        mapped = parallel_map(test_list, operator.neg, max_workers=2,
+                              batch_size=10)
+        self.assertEqual(to_list(mapped), [-x for x in values])
+        self.assertEqual(mapped.node_size, 3)
+        self.assertEqual(str(mapped), str(from_list([-x for x in values], 3)))
+        self.assertEqual(
+            to_list(parallel_filter(test_list, bool, max_workers=2,
+                                    batch_size=7)),
+            [x for x in values if x])
+        self.assertEqual(parallel_reduce(test_list, operator.add, 10,
+                                         max_workers=2, batch_size=16), -40)
+        self.assertEqual(parallel_reduce(test_list, max, None,
+                                         max_workers=2), 49)
+        # Any executor, and the in-process path for a single batch
+        with ThreadPoolExecutor(2) as executor:
+            self.assertEqual(
+                to_list(parallel_map(test_list, lambda x: x * 2,
+                                     batch_size=5, executor=executor)),
+                [x * 2 for x in values])
+        numeric = parallel_filter(from_list(values, 4, dtype='i8'),
+                                  functools.partial(operator.lt, 45))
+        self.assertEqual(numeric.dtype, 'i8')
+        self.assertEqual(to_list(numeric), [46, 47, 48, 49])
+        self.assertEqual(parallel_map(empty(), operator.neg), empty())
+        self.assertIsNone(parallel_reduce(empty(), operator.add, None))
+        with self.assertRaises(ValueError):
+            parallel_map(test_list, operator.neg, batch_size=0)
+
+    def test_threaded_map_list(self) -> None:
+        test_list: ImmutableUnrolledLinkedList[int] = from_list(
+            list(range(20)), 3)
+        lock = threading.Lock()
+        running = [0, 0]  # Calls running now, most calls at once
+
+        def lookup(x: int) -> int:
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.001 * (x % 3))  # Out-of-order completion
+            with lock:
+                running[0] -= 1
+            return x * 10
+
+        mapped = threaded_map_list(test_list, lookup, max_workers=4)
+        self.assertEqual(to_list(mapped), [x * 10 for x in range(20)])
+        self.assertEqual(str(mapped),
+                         str(from_list([x * 10 for x in range(20)], 3)))
+        self.assertLessEqual(running[1], 4)
+
+        def fails_on_seven(x: int) -> int:
+            if x == 7:
+                raise KeyError(x)
+            return x
+
+        with self.assertRaises(KeyError):
+            threaded_map_list(test_list, fails_on_seven, 2)
+        captured = to_list(threaded_map_list(test_list, fails_on_seven, 2,
+                                             on_error="capture"))
+        self.assertIsInstance(captured[7], KeyError)
+        self.assertEqual(captured[:7], list(range(7)))
+        with self.assertRaises(ValueError):
+            threaded_map_list(test_list, fails_on_seven, on_error="ignore")
+
+    def test_amap_list(self) -> None:
+        test_list: ImmutableUnrolledLinkedList[int] = from_list(
+            list(range(20)), 3)
+        running = [0, 0]  # Calls running now, most calls at once
+
+        async def lookup(x: int) -> int:
+            running[0] += 1
+            running[1] = max(running)
+            await asyncio.sleep(0.001 * (x % 3))
+            running[0] -= 1
+            return x * 10
+
+        mapped = asyncio.run(amap_list(test_list, lookup, concurrency=5))
+        self.assertEqual(to_list(mapped), [x * 10 for x in range(20)])
+        self.assertEqual(length(mapped), 20)
+        self.assertEqual(running[1], 5)
+
+        async def fails_on_seven(x: int) -> int:
+            await asyncio.sleep(0)
+            if x == 7:
+                raise KeyError(x)
+            return x
+
+        with self.assertRaises(KeyError):
+            asyncio.run(amap_list(test_list, fails_on_seven))
+        captured = to_list(asyncio.run(
+            amap_list(test_list, fails_on_seven, on_error="capture")))
+        self.assertIsInstance(captured[7], KeyError)
+        self.assertEqual(captured[8:], list(range(8, 20)))
+        self.assertEqual(asyncio.run(amap_list(empty(), lookup)), empty())
+        with self.assertRaises(ValueError):
+            asyncio.run(amap_list(test_list, lookup, concurrency=0))
+
+    def test_node_summaries(self) -> None:
+        values = list(range(0, 1000, 2))
+        test_list: ImmutableUnrolledLinkedList[Any] = from_list(values, 64)
+        head = test_list.head_node
+        assert head is not None
+        # Built lazily: scans are only counted at first
+        for _ in range(31):
+            self.assertFalse(member(test_list, 5))
+        self.assertNotIsInstance(head._summary, tuple)
+        self.assertFalse(member(test_list, 5))
+        self.assertIsInstance(head._summary, tuple)
+
+        # Equal values of other types, nan and unhashable probes
+        self.assertTrue(member(test_list, 998))
+        self.assertTrue(member(test_list, 500.0))
+        self.assertFalse(member(test_list, 1001))
+        self.assertFalse(member(test_list, "a"))
+        self.assertFalse(member(test_list, [2]))
+        self.assertFalse(member(test_list, float("nan")))
+        self.assertEqual(to_list(remove(test_list, 130)),
+                         [x for x in values if x != 130])
+        self.assertIs(remove(test_list, 131), test_list)
+        self.assertEqual(find(test_list, functools.partial(operator.eq, 64)),
+                         (True, 64))
+        self.assertEqual(find(test_list, functools.partial(operator.eq, 65)),
+                         (False, None))
+        self.assertEqual(
+            to_list(intersection(test_list, from_list([-1, 4, 990]))),
+            [4, 990])
+        # Shared nodes keep their summaries in new versions
+        shared = remove(test_list, 0).head_node
+        assert shared is not None and head.next_node is not None
+        self.assertIs(shared.next_node, head.next_node)
+        self.assertIsInstance(head.next_node._summary, tuple)
+
+    @given(st.lists(st.one_of(st.integers(-50, 50), st.floats(-50, 50),
+                              st.just(math.nan), st.text(max_size=1),
+                              st.lists(st.integers(), max_size=1)),
+                    max_size=300),
+           st.one_of(st.integers(-50, 50), st.floats(-50, 50),
+                     st.just(math.nan), st.text(max_size=1)))
+    def test_node_summaries_match_scan(self, values: List[Any],
+                                       probe: Any) -> None:
+        with unittest.mock.patch.object(ImmutableUnrollLinkedList,
+                                        "_SUMMARY_AFTER_SCANS", 1):
+            test_list: ImmutableUnrolledLinkedList[Any] = from_list(values,
+                                                                    64)
+            self.assertEqual(member(test_list, probe), probe in values)
+            expected = list(values)
+            if probe in expected:
+                expected.remove(probe)
+            self.assertEqual(to_list(remove(test_list, probe)), expected)
+            self.assertEqual(
+                find(test_list, functools.partial(operator.eq, probe))[0],
+                any(probe == value for value in values))
+
+    def test_node_summaries_with_nan(self) -> None:
+        # A NaN in a node must not give it (nan, nan) bounds that rule
+        # every value out
+        values = [math.nan] + [float(i) for i in range(1, 200)]
+        for dtype in (None, 'f8'):
+            test_list: ImmutableUnrolledLinkedList[float] = from_list(
+                values, 64, dtype)
+            for _ in range(40):  # Past _SUMMARY_AFTER_SCANS
+                self.assertTrue(member(test_list, 5.0))
+            self.assertEqual(length(remove(test_list, 5.0)), len(values) - 1)
+            self.assertEqual(
+                find(test_list, functools.partial(operator.eq, 5.0)),
+                (True, 5.0))
+            self.assertEqual(length(remove_all(test_list, [5.0, 6.0])),
+                             len(values) - 2)
+
+    def test_metrics(self) -> None:
+        module = ImmutableUnrollLinkedList
+        plain_cons = module.cons
+        module.reset_metrics()
+        module.enable_metrics(trace_memory=True)
+        self.addCleanup(module.reset_metrics)
+        self.addCleanup(module.disable_metrics)
+        self.assertIsNot(module.cons, plain_cons)
+        test_list = module.from_list(list(range(16)), 4)
+        # remove copies the two nodes in front of the edited one and
+        # shares the last one
+        module.remove(test_list, 9)
+        module.cons(-1, test_list)
+        module.cons(-2, test_list)
+        self.assertTrue(module.member(test_list, 15))
+        collected = module.metrics()
+        self.assertEqual(collected["from_list"]["nodes_allocated"], 4)
+        self.assertEqual(collected["from_list"]["elements_copied"], 16)
+        self.assertEqual(collected["remove"]["nodes_copied"], 2)
+        self.assertEqual(collected["remove"]["nodes_allocated"], 3)
+        self.assertEqual(collected["remove"]["elements_copied"], 3)
+        self.assertEqual(collected["remove"]["nodes_reused"], 1)
+        self.assertEqual(collected["remove"]["nodes_traversed"], 5)
+        self.assertEqual(collected["cons"]["calls"], 2)
+        self.assertEqual(collected["cons"]["nodes_reused"], 8)
+        self.assertEqual(collected["member"]["max_traversal"], 4)
+        self.assertGreater(collected["from_list"]["seconds"], 0)
+        self.assertGreater(collected["from_list"]["memory_bytes"], 0)
+        # Nested public calls count towards the outer call only
+        # (cons_many starts from empty())
+        module.cons_many([1, 2])
+        self.assertNotIn("empty", module.metrics())
+        text = module.metrics_prometheus()
+        self.assertIn("# TYPE iull_calls_total counter\n", text)
+        self.assertIn('iull_calls_total{function="cons"} 2\n', text)
+        self.assertIn('iull_nodes_copied_total{function="remove"} 2\n', text)
+        module.disable_metrics()
+        self.assertIs(module.cons, plain_cons)
+        module.cons(-3, test_list)
+        self.assertEqual(module.metrics()["cons"]["calls"], 2)
+        module.reset_metrics()
+        self.assertEqual(module.metrics(), {})
+
+    def test_interning(self) -> None:
+        enable_interning(max_nodes=100)
+        self.addCleanup(disable_interning)
+        reset_intern_stats()
+        values = list(range(12))
+        first, second = from_list(values, 4), from_list(values, 4)
+        # Equal lists in the same layout share every node
+        self.assertIs(first.head_node, second.head_node)
+        self.assertEqual(intern_stats()["hits"], 3)
+        self.assertEqual(intern_stats()["misses"], 3)
+        self.assertEqual(intern_stats()["hit_rate"], 0.5)
+        window = from_list([-4, -3, -2, -1] + values[4:], 4)
+        head = window.head_node
+        assert head is not None and first.head_node is not None
+        self.assertIs(head.next_node, first.head_node.next_node)
+        # cons only looks up its new head node
+        self.assertIs(cons(-1, first).head_node, cons(-1, first).head_node)
+        self.assertEqual(intern_stats()["misses"], 5)
+        # Equal elements of other types or signs are not shared
+        ints, floats = from_list([0, 1], 4), from_list([0.0, 1.0], 4)
+        self.assertIsNot(ints.head_node, floats.head_node)
+        self.assertEqual([type(x) for x in floats], [float, float])
+        self.assertEqual(to_list(from_list([-0.0], 4))[0].hex(), "-0x0.0p+0")
+        # Only exact immutable scalars (and tuples of them) are pooled, other
+        # equal values are kept as given
+        first_decimal = from_list([Decimal('1.0'), 2], 4)
+        self.assertEqual(str(to_list(from_list([Decimal('1.00'), 2], 4))[0]),
+                         "1.00")
+        first_tuple = from_list([(1, ), (2, )], 4)
+        self.assertIs(type(to_list(from_list([(1.0, ), (2, )], 4))[0][0]),
+                      float)
+        nested = from_list([(1, ("a", None)), 2], 4)
+        self.assertIs(from_list([(1, ("a", None)), 2], 4).head_node,
+                      nested.head_node)
+        del first_decimal, first_tuple, nested
+        # Unhashable elements and numeric lists are left unpooled
+        self.assertEqual(to_list(from_list([[1], [2]], 4)), [[1], [2]])
+        self.assertEqual(to_list(from_list([1, 2], 4, dtype='i8')), [1, 2])
+        # Nodes leave the pool with their last list
+        self.assertEqual(intern_stats()["nodes"], 5)
+        del first, second, window, head, ints, floats
+        self.assertEqual(intern_stats()["nodes"], 0)
+        # Past max_nodes the least recently hit nodes are evicted
+        enable_interning(max_nodes=2)
+        kept = from_list(values, 4)
+        self.assertEqual(to_list(kept), values)
+        self.assertEqual(intern_stats()["nodes"], 2)
+        self.assertGreater(intern_stats()["evictions"], 0)
+
+    def test_interning_stops_at_unpoolable_nodes(self) -> None:
+        numbers = from_list(list(range(4000)), 4, dtype='i8')
+        nested = from_list([[x] for x in range(4000)], 4)
+        enable_interning()
+        self.addCleanup(disable_interning)
+        module = ImmutableUnrollLinkedList
+        with unittest.mock.patch.object(
+                module, "_internable", wraps=module._internable) as checked:
+            # A new typed head is never looked at past itself
+            self.assertEqual(nth(cons(-1, numbers), 0), -1)
+            self.assertEqual(checked.call_count, 0)
+            # The walk ends at the first node holding a list
+            pooled = cons("a", cons("b", cons("c", cons("d", nested))))
+            self.assertEqual(to_list(pooled)[:5], ["a", "b", "c", "d", [0]])
+            self.assertLessEqual(checked.call_count, 8)
+
+    def test_intern_list(self) -> None:
+        self.addCleanup(disable_interning)
+        first, second = from_list(list(range(10)), 3), \
+            from_list(list(range(10)), 3)
+        self.assertIsNot(first.head_node, second.head_node)
+        interned = intern_list(first)
+        self.assertIs(interned.head_node, first.head_node)
+        self.assertIs(intern_list(second).head_node, interned.head_node)
+        self.assertIs(intern_list(interned), interned)
+        self.assertEqual(intern_list(second), second)
+        self.assertIs(intern_list(empty()).head_node, None)
+
     def test_reverse(self) -> None:
         empty_list: ImmutableUnrolledLinkedList[
             Optional[int]] = ImmutableUnrolledLinkedList[Optional[int]]()
@@ -101,6 +712,26 @@ class TestImmutableUnrollLinkedList(unittest.TestCase):
         self.assertEqual(reverse(l1), l2)
         self.assertEqual(reverse(l2), l1)
 
+    @given(st.lists(st.integers()), st.integers(min_value=1, max_value=8))
+    def test_reverse_packed(self, values: List[int], node_size: int) -> None:
+        test_list: ImmutableUnrolledLinkedList[int] = from_list(
+            values, node_size)
+        reversed_list = reverse(test_list)
+        self.assertEqual(to_list(reversed_list), values[::-1])
+        self.assertEqual(len(reversed_list), len(values))
+        # Same packed node layout as building the reversed list directly
+        self.assertEqual(str(reversed_list),
+                         str(from_list(values[::-1], node_size)))
+
+    def test_reverse_iterator(self) -> None:
+        test_list: ImmutableUnrolledLinkedList[int] = from_list(
+            [1, 2, 3, 4, 5])
+        self.assertEqual(list(reverse_iterator(test_list)), [5, 4, 3, 2, 1])
+        self.assertEqual(list(reversed(test_list)), [5, 4, 3, 2, 1])
+        self.assertEqual(list(reversed(cons(0, test_list))),
+                         [5, 4, 3, 2, 1, 0])
+        self.assertEqual(list(reversed(empty())), [])
+
     def test_concat(self) -> None:
         empty_list: ImmutableUnrolledLinkedList[
             Optional[int]] = ImmutableUnrolledLinkedList[Optional[int]]()
@@ -114,6 +745,276 @@ class TestImmutableUnrollLinkedList(unittest.TestCase):
         self.assertEqual(concat(empty_list, l1), l1)
         self.assertEqual(to_list(concat(l1, l2)), [None, 1, 1, None])
 
+    def test_concat_shares_list2(self) -> None:
+        list1: ImmutableUnrolledLinkedList[int] = from_list([1, 2, 3, 4, 5])
+        list2: ImmutableUnrolledLinkedList[int] = from_list(
+            [6, 7, 8, 9, 10, 11])
+        joined = concat(list1, list2)
+        self.assertEqual(to_list(joined), list(range(1, 12)))
+        self.assertEqual(len(joined), 11)
+        self.assertEqual(to_list(list1), [1, 2, 3, 4, 5])
+
+        # [5] and [6, 7, 8, 9] do not fit one node, list2 is linked as is
+        nodes = []
+        node = joined.head_node
+        while node is not None:
+            nodes.append(node)
+            node = node.next_node
+        self.assertIs(nodes[2], list2.head_node)
+
+        # [5] and [6] fit one node: the boundary is repacked and the
+        # rest of list3 is still shared
+        list3 = cons(6, from_list([7, 8, 9, 10]))
+        repacked = concat(list1, list3)
+        self.assertEqual(to_list(repacked), list(range(1, 11)))
+        assert repacked.head_node is not None
+        assert list3.head_node is not None
+        boundary = repacked.head_node.next_node
+        assert boundary is not None
+        self.assertEqual(boundary.elements, (5, 6))
+        self.assertIs(boundary.next_node, list3.head_node.next_node)
+
+        # Node sizes of both lists bound the repacked node
+        small_nodes: ImmutableUnrolledLinkedList[int] = from_list([6, 7], 1)
+        boundary = concat(list1, small_nodes).head_node
+        assert boundary is not None and boundary.next_node is not None
+        self.assertIs(boundary.next_node.next_node, small_nodes.head_node)
+
+    def test_dump_load(self) -> None:
+        fragmented: ImmutableUnrolledLinkedList[Any] = concat(
+            from_list([1, 2, 3], 4), from_list([4, 5], 4))
+        fragmented = concat(fragmented, from_list(["six", None], 4))
+        buffer = io.BytesIO()
+        dump(fragmented, buffer)
+        buffer.seek(0)
+        loaded = load(buffer)
+        self.assertEqual(loaded, fragmented)
+        self.assertEqual(str(loaded), str(fragmented))  # Same node layout
+        self.assertEqual(loaded.node_size, 4)
+        self.assertEqual(len(loaded), 7)
+        # Objects marshal cannot handle go through pickle
+        fractions = from_list([Fraction(1, 3), (Fraction(1, 2), [1])], 1)
+        self.assertEqual(to_list(loads(dumps(fractions))),
+                         to_list(fractions))
+        self.assertEqual(loads(dumps(empty(8))).node_size, 8)
+        self.assertIsNone(loads(dumps(empty(8))).head_node)
+        # Numeric nodes are read-only views into the loaded buffer
+        numeric = from_list([1.5, 2.5, 3.5], 2, dtype='f8')
+        data = dumps(numeric)
+        loaded = loads(data)
+        self.assertEqual(loaded.dtype, 'f8')
+        self.assertEqual(to_list(loaded), [1.5, 2.5, 3.5])
+        head = loaded.head_node
+        assert head is not None
+        view: Any = head.elements
+        self.assertIs(view.obj, data)
+        self.assertTrue(view.readonly)
+        mixed: ImmutableUnrolledLinkedList[Any] = concat(
+            from_list([1, 2], 2, dtype='i8'), from_list(["a"]))
+        self.assertEqual(to_list(loads(dumps(mixed))), [1, 2, "a"])
+        with self.assertRaises(ValueError):
+            loads(b"not a dump")
+        with self.assertRaises(ValueError):
+            loads(data[:-12])
+
+    @given(st.lists(st.one_of(st.integers(), st.text(), st.none())),
+           st.integers(min_value=1, max_value=5))
+    def test_dump_load_round_trip(self, values: List[Any],
+                                  node_size: int) -> None:
+        test_list = from_list(values, node_size)
+        loaded = loads(dumps(test_list))
+        self.assertEqual(to_list(loaded), values)
+        self.assertEqual(str(loaded), str(test_list))
+        self.assertEqual(loaded.node_size, node_size)
+
+    def test_dump_keeps_element_types(self) -> None:
+        # marshal reads buffers back as bytes and bytearray == bytes, so
+        # the element types are compared, not only the elements
+        values: List[Any] = [
+            bytearray(b'x'), 1, array('b', [1]), b'y', 2.5, 1j, True, None,
+            (1, (bytearray(b'z'), )), frozenset({1, "a"}), "s"]
+        for node_size in (1, 3, len(values)):
+            test_list = from_list(values, node_size)
+            for restored in (loads(dumps(test_list)),
+                             pickle.loads(pickle.dumps(test_list)),
+                             copy.deepcopy(test_list)):
+                restored_values = to_list(restored)
+                self.assertEqual(restored_values, values)
+                self.assertEqual([type(value) for value in restored_values],
+                                 [type(value) for value in values])
+                self.assertIs(type(restored_values[8][1][0]), bytearray)
+        # Objects shared within one chunk stay shared
+        shared = [1]
+        restored = pickle.loads(pickle.dumps(from_list([shared, shared], 1)))
+        first, second = to_list(restored)
+        self.assertIs(first, second)
+
+    def test_pickle(self) -> None:
+        # Long node chains pickle without recursing through the nodes
+        long_list = from_list(list(range(50000)), node_size=1)
+        self.assertEqual(pickle.loads(pickle.dumps(long_list)), long_list)
+        head = long_list.head_node
+        assert head is not None
+        self.assertEqual(pickle.loads(pickle.dumps(head)), head)
+        numeric = from_list(list(range(10)), 4, dtype='i8')
+        restored = pickle.loads(pickle.dumps(numeric))
+        self.assertEqual(restored.dtype, 'i8')
+        self.assertEqual(to_list(restored), list(range(10)))
+        self.assertEqual(to_list(parallel_map(
+            from_list([long_list, numeric], 1), length, max_workers=2,
+            batch_size=1)), [50000, 10])
+
+    def test_slots(self) -> None:
+        test_list: ImmutableUnrolledLinkedList[int] = from_list([1, 2, 3])
+        for obj in (test_list, test_list.head_node, iter(test_list)):
+            self.assertFalse(hasattr(obj, "__dict__"))
+        # The public generic constructors still work on slotted classes
+        node = Node[int]([1, 2])
+        self.assertEqual(node.elements, (1, 2))
+        self.assertEqual(to_list(ImmutableUnrolledLinkedList[int](node, 2)),
+                         [1, 2])
+        with self.assertRaises(ValueError):
+            from_list([1], 0)
+
+    def test_numeric_mode(self) -> None:
+        ints: ImmutableUnrolledLinkedList[int] = from_list(
+            [1, 2, 3, 4, 5], dtype='i8')
+        self.assertEqual(ints.dtype, 'i8')
+        self.assertEqual(to_list(ints), [1, 2, 3, 4, 5])
+        self.assertEqual([e for e in ints], [1, 2, 3, 4, 5])
+        self.assertEqual(ints, from_list([1, 2, 3, 4, 5]))
+        self.assertEqual(str(ints), "[1, 2, 3, 4], [5]")
+        self.assertEqual(ints[-1], 5)
+        assert ints.head_node is not None
+        with self.assertRaises(TypeError):
+            ints.head_node.elements[0] = 0  # type: ignore[index]
+
+        # Every operation keeps the typed storage
+        self.assertEqual(to_list(cons(0, ints)), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(cons(0, ints).dtype, 'i8')
+        self.assertEqual(to_list(remove(ints, 3)), [1, 2, 4, 5])
+        self.assertEqual(to_list(reverse(ints)), [5, 4, 3, 2, 1])
+        self.assertEqual(reverse(ints).dtype, 'i8')
+        self.assertTrue(member(ints, 4))
+        self.assertEqual(to_list(concat(ints, ints)), [1, 2, 3, 4, 5] * 2)
+        self.assertEqual(concat(ints, from_list([6])).dtype, None)
+        self.assertEqual(to_list(concat(from_list([0], dtype='i8'), ints)),
+                         [0, 1, 2, 3, 4, 5])
+        self.assertEqual(to_list(intersection(ints, from_list([2, 5]))),
+                         [2, 5])
+        self.assertEqual(to_list(cons(1, empty(dtype='i8'))), [1])
+
+        # filter, map_list and reduce give the same results as object lists
+        evens = filter(ints, lambda x: x % 2 == 0)
+        self.assertEqual(to_list(evens), [2, 4])
+        self.assertEqual(evens.dtype, 'i8')
+        self.assertEqual(to_list(map_list(ints, lambda x: x * 2)),
+                         [2, 4, 6, 8, 10])
+        self.assertEqual(to_list(map_list(ints, str)),
+                         ["1", "2", "3", "4", "5"])
+        self.assertEqual(reduce(ints, operator.add, 0), 15)
+        self.assertEqual(reduce(ints, operator.mul, None), 120)
+        self.assertEqual(reduce(ints, max, None), 5)
+        self.assertEqual(reduce(ints, lambda acc, x: acc - x, 0), -15)
+
+        floats: ImmutableUnrolledLinkedList[float] = from_list(
+            [0.5, 1.5], dtype='f8')
+        self.assertEqual(reduce(floats, operator.add, 0.0), 2.0)
+        self.assertEqual(to_list(map_list(floats, lambda x: x * 2)),
+                         [1.0, 3.0])
+
+        with self.assertRaises(TypeError):
+            from_list([1.5], dtype='i8')
+        with self.assertRaises(ValueError):
+            from_list([1], dtype='i4')
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"),
+                         "numpy is not installed")
+    def test_numeric_mode_vectorized(self) -> None:
+        calls: List[int] = []
+
+        def double(x: Any) -> Any:
+            calls.append(1)
+            return x * 2
+
+        numpy = importlib.import_module("numpy")
+        values = list(range(200))
+        ints: ImmutableUnrolledLinkedList[int] = from_list(
+            values, node_size=64, dtype='i8')
+        doubled = map_list(ints, double, vectorized=True)
+        self.assertEqual(to_list(doubled), [x * 2 for x in values])
+        self.assertEqual(doubled.dtype, 'i8')
+        self.assertEqual(len(calls), 4)  # Once per node
+
+        halves = map_list(ints, lambda x: x / 2, vectorized=True)
+        self.assertEqual(halves.dtype, 'f8')
+        self.assertEqual(to_list(halves), [x / 2 for x in values])
+        # Boolean results stay bool, they are not packed as int64
+        flags = map_list(ints, lambda x: x > 100, vectorized=True)
+        self.assertIsNone(flags.dtype)
+        self.assertEqual(to_list(flags), [x > 100 for x in values])
+        self.assertIs(to_list(flags)[0], False)
+        # One-argument ufuncs are array-aware without asking
+        self.assertEqual(to_list(map_list(ints, numpy.negative)),
+                         [-x for x in values])
+        with self.assertRaises(ValueError):
+            map_list(ints, lambda x: 0, vectorized=True)
+
+        self.assertEqual(to_list(filter(ints, lambda x: x % 3 == 0,
+                                        vectorized=True)),
+                         [x for x in values if x % 3 == 0])
+        with self.assertRaises(ValueError):  # Not a boolean mask
+            filter(ints, double, vectorized=True)
+        self.assertEqual(reduce(ints, numpy.add, 0), sum(values))
+
+        # Without opting in func sees every element once, as Python values,
+        # whatever the node_size
+        calls.clear()
+        self.assertEqual(to_list(map_list(ints, double)),
+                         [x * 2 for x in values])
+        self.assertEqual(len(calls), len(values))
+        for node_size in (4, 64, 256):
+            numbers: ImmutableUnrolledLinkedList[int] = from_list(
+                [2 ** 40, 3], node_size, dtype='i8')
+            self.assertEqual(to_list(map_list(numbers, lambda x: x * x)),
+                             [2 ** 80, 9])
+            self.assertEqual(to_list(map_list(numbers, lambda x: x > 5)),
+                             [True, False])
+
+    def test_eq_ignores_node_layout(self) -> None:
+        self.assertEqual(cons(0, from_list([1, 2, 3, 4])),
+                         from_list([0, 1, 2, 3, 4]))
+        self.assertNotEqual(from_list([1, 2, 3], 2), from_list([1, 2, 3], 3))
+        self.assertNotEqual(from_list([1, 2, 3]), from_list([1, 2, 4]))
+        self.assertNotEqual(from_list([1, 2, 3]), from_list([1, 2]))
+
+    def test_hash(self) -> None:
+        base = from_list(list(range(20)))
+        # Equal lists hash equal whatever their layout or storage
+        self.assertEqual(hash(cons(0, from_list([1, 2, 3, 4]))),
+                         hash(from_list([0, 1, 2, 3, 4])))
+        self.assertEqual(hash(from_list([1, 2, 3], dtype='i8')),
+                         hash(from_list([1, 2, 3])))
+        self.assertEqual(hash(empty()), hash(ImmutableUnrolledLinkedList()))
+        counts = {base: 1, from_list([1]): 2}
+        self.assertEqual(counts[from_list(list(range(20)))], 1)
+        # A new version reuses the cached hashes of the shared tail
+        head = base.head_node
+        assert head is not None
+        tail = head.next_node
+        assert tail is not None
+        version = cons(-1, base)
+        self.assertNotEqual(hash(version), hash(base))
+        self.assertEqual(version, cons(-1, from_list(list(range(20)))))
+        self.assertNotEqual(version, cons(-2, base))
+        self.assertEqual(hash(tail), hash(Node[int]([4, 5, 6, 7],
+                                                    tail.next_node)))
+        # Unhashable elements: hashing fails, equality still works
+        wrapped = from_list([[1], [2]])
+        with self.assertRaises(TypeError):
+            hash(wrapped)
+        self.assertEqual(wrapped, from_list([[1], [2]]))
+
     def test_iter(self) -> None:
         x: List[int] = [1, 2, 3]
         lst: ImmutableUnrolledLinkedList[int] = from_list(x, node_size=2)
@@ -146,6 +1047,55 @@ class TestImmutableUnrollLinkedList(unittest.TestCase):
             int] = ImmutableUnrolledLinkedList[int]()
         self.assertEqual(to_list(map_list(empty_list, lambda x: x + 1)), [])
 
+    def test_lazy(self) -> None:
+        test_list: ImmutableUnrolledLinkedList[int] = from_list(
+            list(range(10)), node_size=3)
+        pipeline = lazy(test_list).filter(lambda x: x % 2 == 0).map(
+            lambda x: x * 10)
+        self.assertEqual(pipeline.to_list(), [0, 20, 40, 60, 80])
+        self.assertEqual(pipeline.reduce(lambda acc, x: acc + x, 0), 200)
+        self.assertEqual(pipeline.find(lambda x: x > 30), (True, 40))
+        self.assertEqual(pipeline.find(lambda x: x > 100), (False, None))
+        self.assertEqual(list(pipeline.take(2)), [0, 20])
+        self.assertEqual(pipeline.take(0).to_list(), [])
+
+        materialized = pipeline.materialize()
+        self.assertEqual(materialized, from_list([0, 20, 40, 60, 80], 3))
+        self.assertEqual(str(materialized), "[0, 20, 40], [60, 80]")
+        self.assertEqual(len(materialized), 5)
+        self.assertEqual(lazy(empty()).map(abs).to_list(), [])
+        with self.assertRaises(ValueError):
+            lazy(test_list).take(-1)
+
+    def test_lazy_short_circuit(self) -> None:
+        seen: List[int] = []
+
+        def record(x: int) -> int:
+            seen.append(x)
+            return x
+
+        test_list: ImmutableUnrolledLinkedList[int] = from_list(
+            list(range(100)), node_size=4)
+        self.assertEqual(lazy(test_list).map(record).take(5).to_list(),
+                         [0, 1, 2, 3, 4])
+        # Batches of one node, then two: nothing after them is touched
+        self.assertEqual(seen, list(range(12)))
+
+        seen.clear()
+        self.assertEqual(lazy(test_list).map(record).find(lambda x: x == 1),
+                         (True, 1))
+        self.assertEqual(seen, [0, 1, 2, 3])
+
+    @given(st.lists(st.integers()), st.integers(min_value=0, max_value=20))
+    def test_lazy_matches_eager(self, values: List[int], count: int) -> None:
+        test_list: ImmutableUnrolledLinkedList[int] = from_list(values)
+        eager = map_list(filter(test_list, lambda x: x > 0), lambda x: -x)
+        view = lazy(test_list).filter(lambda x: x > 0).map(lambda x: -x)
+        self.assertEqual(view.materialize(), eager)
+        self.assertEqual(view.take(count).to_list(), to_list(eager)[:count])
+        self.assertEqual(view.reduce(lambda acc, x: acc + x, 0),
+                         reduce(eager, lambda acc, x: acc + x, 0))
+
     def test_reduce(self) -> None:
         test_list: ImmutableUnrolledLinkedList[int] = from_list([1, 2, 3, 4])
         self.assertEqual(reduce(test_list, lambda acc, x: acc + x, 0), 10)
@@ -193,6 +1143,176 @@ class TestImmutableUnrollLinkedList(unittest.TestCase):
         self.assertEqual(to_list(intersection(list1, empty_list)), [])
         self.assertEqual(to_list(intersection(empty_list, empty_list)), [])
 
+    def test_intersection_duplicates(self) -> None:
+        list1: ImmutableUnrolledLinkedList[int] = from_list([3, 1, 3, 2, 3])
+        list2: ImmutableUnrolledLinkedList[int] = from_list([3, 2, 3])
+        self.assertEqual(to_list(intersection(list1, list2)), [3, 3, 2, 3])
+        self.assertEqual(to_list(intersection(list1, list2, multiset=True)),
+                         [3, 3, 2])
+
+    def test_intersection_unhashable(self) -> None:
+        # Orderable but unhashable elements go through the sorted path
+        list1: ImmutableUnrolledLinkedList[List[int]] = from_list(
+            [[1], [2], [1], [3]])
+        list2: ImmutableUnrolledLinkedList[List[int]] = from_list([[1], [3]])
+        self.assertEqual(to_list(intersection(list1, list2)),
+                         [[1], [1], [3]])
+        self.assertEqual(to_list(intersection(list1, list2, multiset=True)),
+                         [[1], [3]])
+
+        # Neither hashable nor orderable falls back to a linear scan
+        list3: ImmutableUnrolledLinkedList[Any] = from_list(
+            [{"a": 1}, {"b": 2}, {"a": 1}])
+        list4: ImmutableUnrolledLinkedList[Any] = from_list([{"a": 1}])
+        self.assertEqual(to_list(intersection(list3, list4)),
+                         [{"a": 1}, {"a": 1}])
+        self.assertEqual(to_list(intersection(list3, list4, multiset=True)),
+                         [{"a": 1}])
+
+        # Unhashable probes against hashable values
+        list5: ImmutableUnrolledLinkedList[Any] = from_list([[1], 1, (1,)])
+        list6: ImmutableUnrolledLinkedList[Any] = from_list([1, (1,)])
+        self.assertEqual(to_list(intersection(list5, list6)), [1, (1,)])
+
+    @given(a=st.lists(st.integers(min_value=0, max_value=5)),
+           b=st.lists(st.integers(min_value=0, max_value=5)))
+    def test_intersection_matches_naive(self, a: List[int],
+                                        b: List[int]) -> None:
+        ul_a: ImmutableUnrolledLinkedList[int] = from_list(a)
+        ul_b: ImmutableUnrolledLinkedList[int] = from_list(b)
+        self.assertEqual(to_list(intersection(ul_a, ul_b)),
+                         [x for x in a if x in b])
+
+        remaining = list(b)
+        expected: List[int] = []
+        for x in a:
+            if x in remaining:
+                remaining.remove(x)
+                expected.append(x)
+        self.assertEqual(to_list(intersection(ul_a, ul_b, multiset=True)),
+                         expected)
+        # The sorted path gives the same answer as the hashed one
+        wrapped_b: ImmutableUnrolledLinkedList[List[int]] = from_list(
+            [[x] for x in b])
+        self.assertEqual(
+            to_list(intersection(from_list([[x] for x in a]), wrapped_b,
+                                 multiset=True)),
+            [[x] for x in expected])
+
+    def test_nth(self) -> None:
+        values: List[int] = list(range(10))
+        test_list: ImmutableUnrolledLinkedList[int] = from_list(values, 3)
+        for i in range(-10, 10):
+            self.assertEqual(nth(test_list, i), values[i])
+            self.assertEqual(test_list[i], values[i])
+        with self.assertRaises(IndexError):
+            nth(test_list, 10)
+        with self.assertRaises(IndexError):
+            test_list[-11]
+        with self.assertRaises(IndexError):
+            nth(empty(), 0)
+
+        prepended = cons(-1, test_list)
+        self.assertEqual(prepended[0], -1)
+        self.assertEqual(prepended[-1], 9)
+        self.assertEqual(remove(prepended, 3)[4], 4)
+
+    def test_positional_updates(self) -> None:
+        test_list = from_list(list(range(10)), node_size=3)
+        updated = set_at(test_list, 4, 40)
+        self.assertEqual(str(updated), "[0, 1, 2], [3, 40, 5], [6, 7, 8], [9]")
+        self.assertEqual(to_list(test_list), list(range(10)))
+        # The nodes after the edited one are shared
+        self.assertIs(_last_nodes(updated, 2)[0], _last_nodes(test_list, 2)[0])
+        self.assertEqual(to_list(set_at(test_list, -1, 90))[-1], 90)
+        # A full node is split in two
+        inserted = insert_at(test_list, 4, 35)
+        self.assertEqual(str(inserted),
+                         "[0, 1, 2], [3, 35], [4, 5], [6, 7, 8], [9]")
+        self.assertEqual(len(inserted), 11)
+        self.assertEqual(to_list(insert_at(test_list, 10, 10)),
+                         list(range(11)))
+        self.assertEqual(to_list(insert_at(test_list, -1, 85))[-2:], [85, 9])
+        self.assertEqual(to_list(insert_at(empty(2), 0, 1)), [1])
+        # An emptied node is dropped, an underfull one merged with the next
+        self.assertEqual(str(delete_at(test_list, 9)),
+                         "[0, 1, 2], [3, 4, 5], [6, 7, 8]")
+        shrunk = delete_at(from_list(list(range(6)), 4), 1)
+        self.assertEqual(str(shrunk), "[0, 2, 3], [4, 5]")
+        self.assertEqual(str(delete_at(shrunk, 1)), "[0, 3, 4, 5]")
+        self.assertEqual(len(delete_at(test_list, 0)), 9)
+        for invalid in (10, -11):
+            with self.assertRaises(IndexError):
+                set_at(test_list, invalid, 0)
+            with self.assertRaises(IndexError):
+                delete_at(test_list, invalid)
+        with self.assertRaises(IndexError):
+            insert_at(test_list, 11, 0)
+        numeric = set_at(from_list([1, 2, 3], 2, dtype='i8'), 2, 30)
+        self.assertEqual(numeric.dtype, 'i8')
+        self.assertEqual(to_list(delete_at(insert_at(numeric, 1, 5), 0)),
+                         [5, 2, 30])
+
+    @given(st.lists(st.integers()), st.integers(min_value=1, max_value=4),
+           st.lists(st.tuples(st.sampled_from(['set', 'insert', 'delete']),
+                              st.integers(-12, 12)), max_size=8),
+           st.booleans())
+    def test_positional_updates_match_list(self, values: List[int],
+                                           node_size: int, edits: List[Any],
+                                           indexed: bool) -> None:
+        test_list = from_list(values, node_size)
+        expected = list(values)
+        for operation, index in edits:
+            if indexed and len(expected):
+                nth(test_list, 0)  # Builds the skip index
+            in_range = -len(expected) <= index < len(expected)
+            if operation == 'insert':
+                if -len(expected) <= index <= len(expected):
+                    test_list = insert_at(test_list, index, index)
+                    expected.insert(index, index)
+                continue
+            if not in_range:
+                with self.assertRaises(IndexError):
+                    delete_at(test_list, index)
+                continue
+            if operation == 'set':
+                test_list = set_at(test_list, index, -index)
+                expected[index] = -index
+            else:
+                test_list = delete_at(test_list, index)
+                del expected[index]
+        self.assertEqual(to_list(test_list), expected)
+        self.assertEqual(len(test_list), len(expected))
+        for node in iter_chunks(test_list):
+            self.assertLessEqual(len(node), node_size)
+
+    def test_len(self) -> None:
+        empty_list: ImmutableUnrolledLinkedList[
+            int] = ImmutableUnrolledLinkedList[int]()
+        self.assertEqual(len(empty_list), 0)
+
+        test_list: ImmutableUnrolledLinkedList[int] = from_list([1, 2, 3])
+        self.assertEqual(len(test_list), 3)
+        self.assertEqual(len(cons(0, test_list)), 4)
+        self.assertEqual(len(remove(test_list, 2)), 2)
+        self.assertEqual(len(remove(test_list, 5)), 3)
+        self.assertEqual(len(reverse(test_list)), 3)
+
+        # A list built straight from nodes counts them once, on demand
+        head = from_list([1, 2, 3, 4, 5], 2).head_node
+        from_nodes: ImmutableUnrolledLinkedList[
+            int] = ImmutableUnrolledLinkedList[int](head, 2)
+        self.assertEqual(length(from_nodes), 5)
+        self.assertEqual(len(cons(0, from_nodes)), 6)
+
+    @given(st.lists(st.integers()), st.integers(min_value=1, max_value=8))
+    def test_nth_matches_list(self, values: List[int],
+                              node_size: int) -> None:
+        test_list: ImmutableUnrolledLinkedList[int] = from_list(
+            values, node_size)
+        self.assertEqual(len(test_list), len(values))
+        self.assertEqual([test_list[i] for i in range(len(values))], values)
+
 
 def test_IULL_api() -> None:
     empty_list: ImmutableUnrolledLinkedList[
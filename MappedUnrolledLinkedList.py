@@ -0,0 +1,456 @@
+from ImmutableUnrollLinkedList import (ImmutableUnrolledLinkedList, Node,
+                                       concat, cons, empty, from_list,
+                                       iter_chunks, length, remove,
+                                       _check_dtype, _marshallable,
+                                       _node_reducer, _node_size_or_default,
+                                       _new_node, _pack, _TYPECODES)
+import marshal
+import mmap
+import pickle
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from itertools import islice
+from typing import (Any, Callable, Dict, Generic, Iterable, Iterator, List,
+                    Optional, Sequence, Tuple, TypeVar, Union, cast)
+
+T = TypeVar('T')
+
+# File layout, all integers little-endian: a header (magic, version, dtype
+# index, node_size, record payload bytes, node count, element count) and
+# then one fixed-size record per node. A record is a record header
+# (element count, storage kind) and payload bytes, so record i starts at
+# _MAPPED_HEADER.size + i * record size. Every node is full except the
+# last one, which places element k in record k // node_size
+_MAPPED_MAGIC = b'IULM'
+_MAPPED_VERSION = 1
+_MAPPED_HEADER = struct.Struct('<4sBBxxIQQQ')
+_RECORD_HEADER = struct.Struct('<IBxxx')
+_RECORD_RAW, _RECORD_MARSHAL, _RECORD_PICKLE = range(3)
+_MAPPED_DTYPES: Tuple[Optional[str], ...] = (None, 'i8', 'f8')
+# Default payload bytes per element of object records, see write_mapped
+_OBJECT_RECORD_BYTES = 32
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+class _MappedFile:
+    # A memory-mapped node file shared by every list version reading it,
+    # with an LRU cache of the nodes decoded so far. Numeric nodes are
+    # read-only views into the map; object nodes are unmarshalled tuples
+    __slots__ = ('path', 'node_size', 'dtype', 'nodes', 'count',
+                 '_record_size', '_mapped', '_view', '_cache',
+                 '_cache_nodes', '_hits', '_misses')
+
+    def __init__(self, path: str, cache_nodes: int):
+        with open(path, 'rb') as fp:
+            self._mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        # None once closed
+        self._view: Optional[memoryview] = memoryview(self._mapped)
+        self._cache: 'OrderedDict[int, Node[Any]]' = OrderedDict()
+        try:
+            magic, version, dtype_index, node_size, payload_bytes, nodes, \
+                count = _MAPPED_HEADER.unpack_from(self._view, 0)
+        except struct.error:
+            self.close()
+            raise ValueError(f"{path} is not a mapped unrolled list file")
+        if magic != _MAPPED_MAGIC or version != _MAPPED_VERSION or \
+                dtype_index >= len(_MAPPED_DTYPES):
+            self.close()
+            raise ValueError(f"{path} is not a mapped unrolled list file")
+        self.path = path
+        self.node_size: int = node_size
+        self.dtype: Optional[str] = _MAPPED_DTYPES[dtype_index]
+        self.nodes: int = nodes
+        self.count: int = count
+        self._record_size = _RECORD_HEADER.size + payload_bytes
+        if len(self._view) < _MAPPED_HEADER.size + nodes * self._record_size:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+        self._cache_nodes = cache_nodes
+        self._hits = self._misses = 0
+
+    def node(self, index: int) -> 'Node[Any]':
+        # The node of record index, decoded on first use and kept in the
+        # cache until it is the least recently used one and space is needed
+        if self._view is None:
+            raise ValueError(f"{self.path} is closed")
+        cache = self._cache
+        node = cache.get(index)
+        if node is not None:
+            self._hits += 1
+            cache.move_to_end(index)
+            return node
+        self._misses += 1
+        node = _new_node(self._decode(index), None)
+        cache[index] = node
+        if len(cache) > self._cache_nodes:
+            cache.popitem(last=False)
+        return node
+
+    def _decode(self, index: int) -> Sequence[Any]:
+        view = cast(memoryview, self._view)
+        offset = _MAPPED_HEADER.size + index * self._record_size
+        size, kind = _RECORD_HEADER.unpack_from(view, offset)
+        offset += _RECORD_HEADER.size
+        if kind == _RECORD_RAW:
+            dtype = cast(str, self.dtype)
+            payload: Any = view[offset:offset + 8 * size]
+            if _BIG_ENDIAN:
+                values = array(_TYPECODES[dtype])
+                values.frombytes(payload)
+                values.byteswap()
+                return _pack(values, dtype)
+            return cast(Sequence[Any], payload.cast(_TYPECODES[dtype]))
+        payload = view[offset:offset + size]
+        if kind == _RECORD_MARSHAL:
+            return cast(Sequence[Any], marshal.loads(payload))
+        return cast(Sequence[Any], pickle.loads(payload))
+
+    def elements_before(self, index: int) -> int:
+        # Number of elements in the records in front of record index
+        return min(index * self.node_size, self.count)
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self._hits, "misses": self._misses,
+                "cached": len(self._cache), "capacity": self._cache_nodes}
+
+    @property
+    def closed(self) -> bool:
+        return self._view is None
+
+    def close(self) -> None:
+        # Drops the decoded nodes and unmaps the file. Numeric nodes are
+        # views into the map, so it stays mapped (BufferError) while one
+        # is still referenced elsewhere; calling close() again retries
+        self._cache.clear()
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        try:
+            self._mapped.close()
+        except BufferError:
+            raise BufferError(f"{self.path} stays mapped while numeric "
+                              "nodes read from it are referenced")
+
+
+# A list version is a tuple of segments: in-memory lists holding the nodes
+# created by cons/remove, and mapped ranges (file, first record, end
+# record) that are only read
+_Range = Tuple[_MappedFile, int, int]
+_Segment = Union[ImmutableUnrolledLinkedList[Any], _Range]
+
+
+def write_mapped(values: Iterable[T], path: str,
+                 node_size: Optional[int] = None, dtype: Optional[str] = None,
+                 record_bytes: Optional[int] = None) -> None:
+    # Writes values to path as a node file for MappedUnrolledLinkedList,
+    # one node-sized chunk at a time, so values may be a generator over a
+    # dataset larger than RAM. dtype 'i8'/'f8' stores raw int64/float64
+    # records; dtype None (the default) stores each node with marshal
+    # (pickle unless it is _marshallable) in records of record_bytes
+    # payload bytes (default 32 per element), and a node that does not
+    # fit raises ValueError
+    node_size = _node_size_or_default(node_size)
+    _check_dtype(dtype)
+    if dtype is not None:
+        payload_bytes = 8 * node_size
+    elif record_bytes is None:
+        payload_bytes = _OBJECT_RECORD_BYTES * node_size
+    elif not isinstance(record_bytes, int) or record_bytes <= 0:
+        raise ValueError("record_bytes must be a positive integer")
+    else:
+        payload_bytes = record_bytes
+
+    iterator = iter(values)
+    nodes = count = 0
+    with open(path, 'wb') as fp:
+        fp.write(bytes(_MAPPED_HEADER.size))  # Written once counts are known
+        while True:
+            chunk: List[Any] = list(islice(iterator, node_size))
+            if not chunk:
+                break
+            if dtype is not None:
+                packed = array(_TYPECODES[dtype], chunk)
+                if _BIG_ENDIAN:
+                    packed.byteswap()
+                payload, kind = packed.tobytes(), _RECORD_RAW
+            else:
+                if _marshallable(chunk):
+                    payload, kind = marshal.dumps(tuple(chunk)), \
+                        _RECORD_MARSHAL
+                else:
+                    payload, kind = pickle.dumps(
+                        tuple(chunk), pickle.HIGHEST_PROTOCOL), _RECORD_PICKLE
+                if len(payload) > payload_bytes:
+                    raise ValueError(
+                        f"node {nodes} needs {len(payload)} bytes, more than "
+                        f"record_bytes={payload_bytes}")
+            size = len(chunk) if kind == _RECORD_RAW else len(payload)
+            fp.write(_RECORD_HEADER.pack(size, kind))
+            fp.write(payload)
+            fp.write(bytes(payload_bytes - len(payload)))
+            nodes += 1
+            count += len(chunk)
+        fp.seek(0)
+        fp.write(_MAPPED_HEADER.pack(
+            _MAPPED_MAGIC, _MAPPED_VERSION, _MAPPED_DTYPES.index(dtype),
+            node_size, payload_bytes, nodes, count))
+
+
+class MappedUnrolledLinkedList(Generic[T]):
+    # Immutable unrolled list over a node file written by write_mapped().
+    # Nodes stay on disk and are decoded only when first touched (by
+    # iteration, find, member, reduce or nth), through a bounded LRU cache
+    # of cache_nodes nodes shared by every version of the file. New
+    # versions from cons, remove and concat keep only the nodes they
+    # create in memory; the mapped records in front of and behind them
+    # are shared as ranges, never read or copied. close() (or leaving a
+    # with block) unmaps the files of a version and of every version
+    # sharing them
+    __slots__ = ('_segments', '_node_size', '_dtype', '_length')
+
+    def __init__(self, path: str, cache_nodes: int = 1024):
+        if not isinstance(cache_nodes, int) or cache_nodes <= 0:
+            raise ValueError("cache_nodes must be a positive integer")
+        mapped_file = _MappedFile(path, cache_nodes)
+        self._segments: Tuple[_Segment, ...] = (
+            ((mapped_file, 0, mapped_file.nodes), )
+            if mapped_file.nodes else ())
+        self._node_size = mapped_file.node_size
+        self._dtype = mapped_file.dtype
+        # Cached element count, None until the first length() call
+        self._length: Optional[int] = mapped_file.count
+
+    @property
+    def node_size(self) -> int:
+        return self._node_size
+
+    @property
+    def dtype(self) -> Optional[str]:
+        # Returns 'i8' or 'f8' for numeric files, None for object files
+        return self._dtype
+
+    def cache_info(self) -> Dict[str, int]:
+        # Node cache statistics of the mapped files of this version: hits,
+        # misses, nodes cached and capacity, summed over the files
+        info = {"hits": 0, "misses": 0, "cached": 0, "capacity": 0}
+        for mapped_file in self._mapped_files():
+            for key, value in mapped_file.cache_info().items():
+                info[key] += value
+        return info
+
+    def _mapped_files(self) -> List[_MappedFile]:
+        return list({id(segment[0]): segment[0]
+                     for segment in self._segments
+                     if isinstance(segment, tuple)}.values())
+
+    @property
+    def closed(self) -> bool:
+        # True once a mapped file of this version was closed
+        return any(mapped_file.closed for mapped_file in self._mapped_files())
+
+    def close(self) -> None:
+        # Unmaps the files of this version right away instead of at garbage
+        # collection. Versions sharing them can no longer read mapped
+        # nodes (ValueError); length() and the in-memory nodes still work.
+        # BufferError while numeric nodes read from a file are referenced
+        for mapped_file in self._mapped_files():
+            mapped_file.close()
+
+    def __enter__(self) -> 'MappedUnrolledLinkedList[T]':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return ", ".join("[" + ", ".join(map(str, elements)) + "]"
+                         for elements in self.iter_chunks()) or "[]"
+
+    def __iter__(self) -> Iterator[T]:
+        for elements in self.iter_chunks():
+            yield from elements
+
+    def __len__(self) -> int:
+        return self.length()
+
+    def __getitem__(self, index: int) -> T:
+        if not isinstance(index, int):
+            raise TypeError("list indices must be integers")
+        return self.nth(index)
+
+    def iter_chunks(self) -> Iterator[Sequence[T]]:
+        # Yields the elements of every node, front to back; mapped nodes
+        # are decoded through the cache as they are reached
+        for segment in self._segments:
+            if isinstance(segment, tuple):
+                mapped_file, start, stop = segment
+                for index in range(start, stop):
+                    yield mapped_file.node(index)._elements
+            else:
+                yield from iter_chunks(segment)
+
+    def length(self) -> int:
+        # Number of elements, computed from the record layout without
+        # decoding any node and cached on the version
+        if self._length is None:
+            self._length = sum(_segment_length(segment)
+                               for segment in self._segments)
+        return self._length
+
+    def nth(self, index: int) -> T:
+        # Element at index, negative indices count from the end. Mapped
+        # ranges are skipped by their length, so only one node is decoded
+        count = self.length()
+        if index < 0:
+            index += count
+        if index < 0 or index >= count:
+            raise IndexError("MappedUnrolledLinkedList index out of range")
+        for segment in self._segments:
+            size = _segment_length(segment)
+            if index >= size:
+                index -= size
+                continue
+            if not isinstance(segment, tuple):
+                return cast(T, segment[index])
+            mapped_file, start, _ = segment
+            position = mapped_file.elements_before(start) + index
+            node = mapped_file.node(position // mapped_file.node_size)
+            return cast(T, node._elements[position % mapped_file.node_size])
+        raise IndexError("MappedUnrolledLinkedList index out of range")
+
+    def member(self, element: T) -> bool:
+        return any(element in elements for elements in self.iter_chunks())
+
+    def find(self, predicate: Callable[[T], bool]
+             ) -> Tuple[bool, Optional[T]]:
+        # Same semantics as find() on a list, stops at the first match
+        for elements in self.iter_chunks():
+            for value in elements:
+                if predicate(value):
+                    return True, value
+        return False, None
+
+    def reduce(self, func: Callable[[T, T], T],
+               initial_value: Optional[T]) -> Optional[T]:
+        # Same semantics as reduce() on a list; numeric nodes are folded in
+        # one call for the operations reduce() recognizes
+        state = initial_value
+        node_reducer = _node_reducer(func)
+        for elements in self.iter_chunks():
+            if node_reducer is not None and \
+                    isinstance(elements, memoryview) and elements:
+                value = node_reducer(elements)
+                state = value if state is None else func(state, value)
+                continue
+            for value in elements:
+                state = value if state is None else func(state, value)
+        return state
+
+    def to_list(self) -> List[T]:
+        res: List[T] = []
+        for elements in self.iter_chunks():
+            res.extend(elements)
+        return res
+
+    def cons(self, head_value: T) -> 'MappedUnrolledLinkedList[T]':
+        # New version with head_value in front. It goes into an in-memory
+        # head segment, the mapped records are shared
+        segments = self._segments
+        if segments and not isinstance(segments[0], tuple):
+            head = cons(head_value, segments[0])
+        else:
+            head = cons(head_value, empty(self._node_size, self._dtype))
+            segments = (head, ) + segments
+        return self._derived((head, ) + segments[1:],
+                             self._length_after(1))
+
+    def remove(self, element: T) -> 'MappedUnrolledLinkedList[T]':
+        # New version without the first occurrence of element. A mapped
+        # range is split around the node holding it: only that node is
+        # copied into memory, the records on both sides stay shared
+        for position, segment in enumerate(self._segments):
+            if not isinstance(segment, tuple):
+                removed = remove(segment, element)
+                if removed is segment:
+                    continue
+                replacement: Tuple[_Segment, ...] = \
+                    (removed, ) if length(removed) else ()
+            else:
+                mapped_file, start, stop = segment
+                for index in range(start, stop):
+                    elements = mapped_file.node(index)._elements
+                    if element in elements:
+                        break
+                else:
+                    continue
+                values = list(elements)
+                del values[values.index(element)]
+                pieces: List[_Segment] = []
+                if index > start:
+                    pieces.append((mapped_file, start, index))
+                if values:
+                    pieces.append(from_list(values, self._node_size,
+                                            self._dtype))
+                if index + 1 < stop:
+                    pieces.append((mapped_file, index + 1, stop))
+                replacement = tuple(pieces)
+            return self._derived(
+                _joined(self._segments[:position] + replacement +
+                        self._segments[position + 1:]),
+                self._length_after(-1))
+        return self  # Element not found, reuse this version
+
+    def concat(self, other: Union['MappedUnrolledLinkedList[T]',
+                                  ImmutableUnrolledLinkedList[T]]
+               ) -> 'MappedUnrolledLinkedList[T]':
+        # New version with the elements of other (a mapped or in-memory
+        # list) behind these. Both sides are shared, only two in-memory
+        # segments meeting at the boundary are concatenated
+        if isinstance(other, MappedUnrolledLinkedList):
+            other_segments = other._segments
+            other_length = other._length
+        else:
+            other_segments = (other, ) if other._head_node is not None \
+                else ()
+            other_length = other._length
+        count = None
+        if self._length is not None and other_length is not None:
+            count = self._length + other_length
+        return self._derived(_joined(self._segments + other_segments), count)
+
+    def _length_after(self, delta: int) -> Optional[int]:
+        return None if self._length is None else self._length + delta
+
+    def _derived(self, segments: Tuple[_Segment, ...],
+                 count: Optional[int]) -> 'MappedUnrolledLinkedList[T]':
+        # A new version over segments, sharing this version's settings
+        mapped_list: MappedUnrolledLinkedList[T] = object.__new__(
+            MappedUnrolledLinkedList)
+        mapped_list._segments = segments
+        mapped_list._node_size = self._node_size
+        mapped_list._dtype = self._dtype
+        mapped_list._length = count
+        return mapped_list
+
+
+def _segment_length(segment: _Segment) -> int:
+    if isinstance(segment, tuple):
+        mapped_file, start, stop = segment
+        return mapped_file.elements_before(stop) - \
+            mapped_file.elements_before(start)
+    return length(segment)
+
+
+def _joined(segments: Tuple[_Segment, ...]) -> Tuple[_Segment, ...]:
+    # Concatenates neighbouring in-memory segments, so their number only
+    # grows with the number of mapped ranges
+    res: List[_Segment] = []
+    for segment in segments:
+        if res and not isinstance(segment, tuple) and \
+                not isinstance(res[-1], tuple):
+            res[-1] = concat(res[-1], segment)
+        else:
+            res.append(segment)
+    return tuple(res)
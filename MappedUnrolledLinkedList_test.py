@@ -0,0 +1,189 @@
+from MappedUnrolledLinkedList import MappedUnrolledLinkedList, write_mapped
+from ImmutableUnrollLinkedList import from_list, to_list
+from array import array
+from fractions import Fraction
+from hypothesis import given, settings
+import hypothesis.strategies as st
+import operator
+import os
+import tempfile
+import unittest
+from typing import Any, List
+
+
+class TestMappedUnrolledLinkedList(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory.name, name)
+
+    def _mapped(self, values: List[Any], node_size: int,
+                dtype: Any = 'i8',
+                cache_nodes: int = 1024) -> MappedUnrolledLinkedList[Any]:
+        path = self._path(f"list{len(os.listdir(self._directory.name))}")
+        write_mapped(values, path, node_size, dtype)
+        mapped: MappedUnrolledLinkedList[Any] = MappedUnrolledLinkedList(
+            path, cache_nodes)
+        self.addCleanup(mapped.close)
+        return mapped
+
+    def test_read(self) -> None:
+        mapped = self._mapped(list(range(10)), 3)
+        self.assertEqual(str(mapped), "[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]")
+        self.assertEqual(len(mapped), 10)
+        self.assertEqual(mapped.node_size, 3)
+        self.assertEqual(mapped.dtype, 'i8')
+        self.assertEqual(list(mapped), list(range(10)))
+        self.assertEqual(mapped[-1], 9)
+        self.assertTrue(mapped.member(7))
+        self.assertFalse(mapped.member(10))
+        self.assertEqual(mapped.find(lambda x: x > 4), (True, 5))
+        self.assertEqual(mapped.find(lambda x: x > 9), (False, None))
+        self.assertEqual(mapped.reduce(operator.add, 0), 45)
+        self.assertEqual(mapped.reduce(lambda acc, x: acc * 2 + x, None),
+                         1013)
+        with self.assertRaises(IndexError):
+            mapped.nth(10)
+        floats = self._mapped([0.5, 1.5], 4, 'f8')
+        self.assertEqual(floats.to_list(), [0.5, 1.5])
+        empty_list = self._mapped([], 4)
+        self.assertEqual(str(empty_list), "[]")
+        self.assertEqual(len(empty_list), 0)
+
+    def test_objects(self) -> None:
+        values = ["a", (1, [2]), None, Fraction(1, 3), {"b": 2.5}]
+        mapped = self._mapped(values, 2, None)
+        self.assertEqual(mapped.to_list(), values)
+        self.assertIsNone(mapped.dtype)
+        self.assertTrue(mapped.member(Fraction(1, 3)))
+        with self.assertRaises(ValueError):
+            write_mapped(["x" * 100], self._path("small"), 1, None,
+                         record_bytes=16)
+        with self.assertRaises(ValueError):
+            write_mapped([1], self._path("bad"), 1, None, record_bytes=0)
+        # Buffers are pickled, marshal would read them back as bytes
+        buffers: List[Any] = [bytearray(b'ab'), 1, array('b', [1]),
+                              (b'c', bytearray(b'd'))]
+        restored = self._mapped(buffers, 4, None).to_list()
+        self.assertEqual(restored, buffers)
+        self.assertEqual([type(value) for value in restored],
+                         [bytearray, int, array, tuple])
+        self.assertIs(type(restored[3][1]), bytearray)
+        # Object records are the default, like from_list
+        path = self._path("default")
+        write_mapped(["a", 1], path)
+        with MappedUnrolledLinkedList[Any](path) as default:
+            self.assertIsNone(default.dtype)
+            self.assertEqual(default.to_list(), ["a", 1])
+
+    def test_invalid_file(self) -> None:
+        path = self._path("invalid")
+        with open(path, 'wb') as fp:
+            fp.write(b"not a node file" * 4)
+        with self.assertRaises(ValueError):
+            MappedUnrolledLinkedList(path)
+        with self.assertRaises(ValueError):
+            MappedUnrolledLinkedList(path, cache_nodes=0)
+
+    def test_close(self) -> None:
+        path = self._path("closed")
+        write_mapped(range(10), path, 4, 'i8')
+        with MappedUnrolledLinkedList[int](path) as mapped:
+            consed = mapped.cons(-1)
+            self.assertEqual(mapped[5], 5)
+            self.assertFalse(mapped.closed)
+        # Leaving the block unmaps the file for every version sharing it
+        self.assertTrue(mapped.closed)
+        self.assertTrue(consed.closed)
+        self.assertEqual(len(consed), 11)
+        self.assertEqual(consed[0], -1)
+        with self.assertRaises(ValueError):
+            mapped.to_list()
+        with self.assertRaises(ValueError):
+            consed[5]
+        mapped.close()  # Closing twice is fine
+        # Numeric nodes are views into the map, which stays mapped while
+        # one is referenced
+        reopened: MappedUnrolledLinkedList[int] = \
+            MappedUnrolledLinkedList(path)
+        chunk = next(reopened.iter_chunks())
+        with self.assertRaises(BufferError):
+            reopened.close()
+        self.assertEqual(list(chunk), [0, 1, 2, 3])
+        del chunk
+        reopened.close()
+        self.assertTrue(reopened.closed)
+
+    def test_lazy_decoding(self) -> None:
+        mapped = self._mapped(list(range(100)), 10, cache_nodes=3)
+        # Opening and length() decode nothing, nth() decodes one node
+        self.assertEqual(len(mapped), 100)
+        self.assertEqual(mapped.cache_info()["misses"], 0)
+        self.assertEqual(mapped[55], 55)
+        self.assertEqual(mapped[56], 56)
+        self.assertEqual(mapped.cache_info(),
+                         {"hits": 1, "misses": 1, "cached": 1,
+                          "capacity": 3})
+        # A full scan keeps at most cache_nodes decoded nodes
+        self.assertEqual(mapped.reduce(operator.add, 0), 4950)
+        self.assertEqual(mapped.cache_info()["cached"], 3)
+
+    def test_new_versions_share_records(self) -> None:
+        mapped = self._mapped(list(range(100)), 10, cache_nodes=100)
+        # Only the nodes up to the one holding the element are decoded,
+        # and only that node is copied
+        removed = mapped.remove(12)
+        self.assertEqual(mapped.cache_info()["misses"], 2)
+        consed = mapped.cons(-1).cons(-2)
+        self.assertEqual(mapped.cache_info()["misses"], 2)
+        self.assertEqual(consed.to_list()[:3], [-2, -1, 0])
+        self.assertEqual(len(consed), 102)
+        removed = removed.remove(42).remove(1000)
+        self.assertEqual(removed.to_list(),
+                         [x for x in range(100) if x not in (12, 42)])
+        self.assertEqual(len(removed), 98)
+        self.assertEqual(removed[40], 41)
+        self.assertEqual(removed[41], 43)
+        self.assertIs(removed.remove(1000), removed)
+        self.assertEqual(mapped.to_list(), list(range(100)))
+        joined = removed.concat(consed).concat(from_list([7, 8], 10))
+        self.assertEqual(joined.to_list(),
+                         removed.to_list() + consed.to_list() + [7, 8])
+        self.assertEqual(len(joined), 98 + 102 + 2)
+        self.assertEqual(joined[-3], 99)
+
+    @settings(max_examples=30)
+    @given(st.lists(st.integers(-5, 5)),
+           st.lists(st.tuples(st.sampled_from(['cons', 'remove', 'concat']),
+                              st.integers(-5, 5)), max_size=10),
+           st.integers(min_value=1, max_value=4))
+    def test_matches_immutable_list(self, values: List[int],
+                                    edits: List[Any], node_size: int) -> None:
+        mapped = self._mapped(values, node_size, cache_nodes=2)
+        source = mapped
+        expected = from_list(values, node_size)
+        for operation, value in edits:
+            if operation == 'cons':
+                mapped, expected = mapped.cons(value), \
+                    from_list([value] + to_list(expected), node_size)
+            elif operation == 'remove':
+                mapped = mapped.remove(value)
+                rest = to_list(expected)
+                if value in rest:
+                    rest.remove(value)
+                expected = from_list(rest, node_size)
+            else:
+                mapped = mapped.concat(from_list([value], node_size))
+                expected = from_list(to_list(expected) + [value], node_size)
+        self.assertEqual(mapped.to_list(), to_list(expected))
+        self.assertEqual(len(mapped), len(expected))
+        for index in range(len(expected)):
+            self.assertEqual(mapped[index], expected[index])
+        source.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
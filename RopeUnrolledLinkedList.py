@@ -0,0 +1,312 @@
+from ImmutableUnrollLinkedList import (ImmutableUnrolledLinkedList, Node,
+                                       _check_dtype, _dtype_of, _iter_nodes,
+                                       _new_list, _new_node,
+                                       _node_size_or_default, _pack)
+from itertools import chain, islice
+from typing import (Any, Generic, Iterable, Iterator, List, Optional,
+                    Sequence, Tuple, TypeVar, Union, cast)
+
+T = TypeVar('T')
+
+
+class _Branch:
+    # Inner node of the chunk tree: the leaves under left come first.
+    # size is the element count and height the AVL height (leaves are 0)
+    __slots__ = ('left', 'right', 'size', 'height')
+
+    def __init__(self, left: '_Tree', right: '_Tree'):
+        self.left = left
+        self.right = right
+        self.size: int = _size(left) + _size(right)
+        self.height: int = max(_height(left), _height(right)) + 1
+
+
+# A tree is a _Branch or a leaf, which is the element storage of one node
+# (a tuple, or a typed buffer for numeric lists) shared with Node chains
+_Tree = Union[_Branch, Sequence[Any]]
+
+
+def _size(tree: _Tree) -> int:
+    return tree.size if type(tree) is _Branch \
+        else len(cast(Sequence[Any], tree))
+
+
+def _height(tree: _Tree) -> int:
+    return tree.height if type(tree) is _Branch else 0
+
+
+def _balanced(leaves: Sequence[_Tree], start: int = 0,
+              stop: Optional[int] = None) -> Optional[_Tree]:
+    # A balanced tree over leaves[start:stop] in O(leaves): the halves
+    # differ by at most one leaf, so their heights differ by at most one
+    stop = len(leaves) if stop is None else stop
+    if stop - start <= 1:
+        return leaves[start] if stop > start else None
+    middle = (start + stop) // 2
+    return _Branch(cast(_Tree, _balanced(leaves, start, middle)),
+                   cast(_Tree, _balanced(leaves, middle, stop)))
+
+
+def _rebalanced(left: _Tree, right: _Tree) -> _Tree:
+    # A branch over left and right whose heights differ by at most two,
+    # with the AVL single or double rotation when they differ by two
+    height_left, height_right = _height(left), _height(right)
+    if height_left > height_right + 1:
+        branch = cast(_Branch, left)
+        if _height(branch.left) >= _height(branch.right):
+            return _Branch(branch.left, _Branch(branch.right, right))
+        inner = cast(_Branch, branch.right)
+        return _Branch(_Branch(branch.left, inner.left),
+                       _Branch(inner.right, right))
+    if height_right > height_left + 1:
+        branch = cast(_Branch, right)
+        if _height(branch.right) >= _height(branch.left):
+            return _Branch(_Branch(left, branch.left), branch.right)
+        inner = cast(_Branch, branch.left)
+        return _Branch(_Branch(left, inner.left),
+                       _Branch(inner.right, branch.right))
+    return _Branch(left, right)
+
+
+def _join(left: Optional[_Tree], right: Optional[_Tree],
+          node_size: int) -> Optional[_Tree]:
+    # Concatenates two trees in O(|height difference| + 1): the shorter
+    # tree is hung into the spine of the taller one, rebalancing on the
+    # way back up. Two leaves that fit into one node are merged
+    if left is None or right is None:
+        return right if left is None else left
+    height_left, height_right = _height(left), _height(right)
+    if height_left > height_right + 1:
+        branch = cast(_Branch, left)
+        return _rebalanced(branch.left,
+                           cast(_Tree, _join(branch.right, right, node_size)))
+    if height_right > height_left + 1:
+        branch = cast(_Branch, right)
+        return _rebalanced(cast(_Tree, _join(left, branch.left, node_size)),
+                           branch.right)
+    if type(left) is not _Branch and type(right) is not _Branch and \
+            _size(left) + _size(right) <= node_size:
+        return _merged(cast(Sequence[Any], left), cast(Sequence[Any], right))
+    return _Branch(left, right)
+
+
+def _merged(first: Sequence[Any], second: Sequence[Any]) -> Sequence[Any]:
+    # One leaf holding the elements of two, keeping typed storage when both
+    # share it
+    if type(first) is tuple and type(second) is tuple:
+        return first + second
+    dtype = _dtype_of(first)
+    if dtype != _dtype_of(second):
+        dtype = None
+    return _pack([*first, *second], dtype)
+
+
+def _split(tree: _Tree, index: int,
+           node_size: int) -> Tuple[_Tree, _Tree]:
+    # The first index elements and the rest, 0 < index < _size(tree), in
+    # O(log n): one path is cut and the pieces on both sides are joined
+    if type(tree) is not _Branch:
+        leaf = cast(Sequence[Any], tree)
+        return leaf[:index], leaf[index:]
+    left_size = _size(tree.left)
+    if index < left_size:
+        first, rest = _split(tree.left, index, node_size)
+        return first, cast(_Tree, _join(rest, tree.right, node_size))
+    if index > left_size:
+        first, rest = _split(tree.right, index - left_size, node_size)
+        return cast(_Tree, _join(tree.left, first, node_size)), rest
+    return tree.left, tree.right
+
+
+def _leaves(tree: Optional[_Tree]) -> Iterator[Sequence[Any]]:
+    # The leaves from left to right, walked with an explicit stack
+    stack: List[_Tree] = [] if tree is None else [tree]
+    while stack:
+        tree = stack.pop()
+        if type(tree) is _Branch:
+            stack.append(tree.right)
+            stack.append(tree.left)
+        else:
+            yield cast(Sequence[Any], tree)
+
+
+class RopeUnrolledLinkedList(Generic[T]):
+    # Immutable unrolled list whose node-sized chunks are the leaves of a
+    # balanced (AVL) persistent tree instead of a linked chain. Every
+    # branch knows its element count, so nth, set_at, concat and split_at
+    # take O(log n) and only copy the O(log n) branches on one path.
+    # The leaves are node storage shared with ImmutableUnrolledLinkedList:
+    # unrolled_list links them into a Node chain for the function-style
+    # API, and from_unrolled_list() builds a rope over a chain's nodes
+    __slots__ = ('_root', '_node_size', '_dtype', '_chain')
+
+    def __init__(self, values: Iterable[T] = (),
+                 node_size: Optional[int] = None,
+                 dtype: Optional[str] = None):
+        node_size = _node_size_or_default(node_size)
+        _check_dtype(dtype)
+        iterator = iter(values)
+        leaves: List[Sequence[T]] = []
+        while True:
+            leaf = _pack(islice(iterator, node_size), dtype)
+            if not leaf:
+                break
+            leaves.append(leaf)
+        self._root: Optional[_Tree] = _balanced(leaves)
+        self._node_size = node_size
+        self._dtype = dtype
+        # Node chain over the leaves, built by unrolled_list on first use
+        self._chain: Optional[ImmutableUnrolledLinkedList[T]] = None
+
+    @property
+    def node_size(self) -> int:
+        return self._node_size
+
+    @property
+    def dtype(self) -> Optional[str]:
+        return self._dtype
+
+    @property
+    def height(self) -> int:
+        # Height of the tree, O(log(number of leaves))
+        return 0 if self._root is None else _height(self._root)
+
+    @property
+    def unrolled_list(self) -> ImmutableUnrolledLinkedList[T]:
+        # The elements as an ImmutableUnrolledLinkedList for the
+        # function-style API (cons, filter, map_list, reduce, ...). The
+        # chain reuses the leaf storage, linking it costs O(leaves) once
+        if self._chain is None:
+            head_node: Optional[Node[T]] = None
+            for leaf in reversed(list(_leaves(self._root))):
+                head_node = _new_node(leaf, head_node)
+            self._chain = _new_list(head_node, self._node_size, len(self),
+                                    self._dtype)
+        return self._chain
+
+    def __str__(self) -> str:
+        return ", ".join("[" + ", ".join(map(str, leaf)) + "]"
+                         for leaf in _leaves(self._root)) or "[]"
+
+    def __eq__(self, other: object) -> bool:
+        # Same node size and equal elements, whatever the tree shape
+        if not isinstance(other, RopeUnrolledLinkedList):
+            return False
+        return self.unrolled_list == other.unrolled_list
+
+    def __hash__(self) -> int:
+        return hash(self.unrolled_list)
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(_leaves(self._root))
+
+    def __len__(self) -> int:
+        return 0 if self._root is None else _size(self._root)
+
+    def __getitem__(self, index: int) -> T:
+        return self.nth(index)
+
+    def iter_chunks(self) -> Iterator[Sequence[T]]:
+        # Yields the leaves, front to back and without copying
+        return _leaves(self._root)
+
+    def _checked(self, index: int) -> int:
+        if not isinstance(index, int):
+            raise TypeError("list indices must be integers")
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("RopeUnrolledLinkedList index out of range")
+        return index
+
+    def nth(self, index: int) -> T:
+        # Element at index (negative counts from the end), O(log n)
+        index = self._checked(index)
+        tree = cast(_Tree, self._root)
+        while type(tree) is _Branch:
+            left_size = _size(tree.left)
+            if index < left_size:
+                tree = tree.left
+            else:
+                index -= left_size
+                tree = tree.right
+        return cast(T, cast(Sequence[Any], tree)[index])
+
+    def set_at(self, index: int, value: T) -> 'RopeUnrolledLinkedList[T]':
+        # New rope with the element at index replaced, copying the leaf and
+        # the branches on its path, O(log n + node_size)
+        index = self._checked(index)
+        path: List[Tuple[_Branch, bool]] = []  # Branch, went left
+        tree = cast(_Tree, self._root)
+        while type(tree) is _Branch:
+            left_size = _size(tree.left)
+            path.append((tree, index < left_size))
+            if index < left_size:
+                tree = tree.left
+            else:
+                index -= left_size
+                tree = tree.right
+        leaf = cast(Sequence[Any], tree)
+        if type(leaf) is tuple:
+            updated: _Tree = leaf[:index] + (value, ) + leaf[index + 1:]
+        else:
+            values = list(leaf)
+            values[index] = value
+            updated = _pack(values, _dtype_of(leaf))
+        for branch, went_left in reversed(path):
+            updated = _Branch(updated, branch.right) if went_left \
+                else _Branch(branch.left, updated)
+        return self._derived(updated)
+
+    def cons(self, value: T) -> 'RopeUnrolledLinkedList[T]':
+        # New rope with value in front, O(log n)
+        leaf = _pack((value, ), self._dtype)
+        return self._derived(_join(leaf, self._root, self._node_size))
+
+    def concat(self, other: 'RopeUnrolledLinkedList[T]'
+               ) -> 'RopeUnrolledLinkedList[T]':
+        # New rope with the elements of other behind these, O(log n); both
+        # trees are shared except for the branches along one spine
+        return self._derived(_join(self._root, other._root, self._node_size))
+
+    def split_at(self, index: int) -> Tuple['RopeUnrolledLinkedList[T]',
+                                            'RopeUnrolledLinkedList[T]']:
+        # The first index elements and the rest as two ropes, O(log n).
+        # index is clamped to 0..len(self) like a slice bound
+        index = max(0, min(index + len(self) if index < 0 else index,
+                           len(self)))
+        if index == 0:
+            return self._derived(None), self
+        if index == len(self):
+            return self, self._derived(None)
+        first, rest = _split(cast(_Tree, self._root), index, self._node_size)
+        return self._derived(first), self._derived(rest)
+
+    def to_list(self) -> List[T]:
+        res: List[T] = []
+        for leaf in _leaves(self._root):
+            res.extend(leaf)
+        return res
+
+    def _derived(self, root: Optional[_Tree]) -> 'RopeUnrolledLinkedList[T]':
+        # A new rope over root with this rope's settings
+        rope: RopeUnrolledLinkedList[T] = object.__new__(
+            RopeUnrolledLinkedList)
+        rope._root = root
+        rope._node_size = self._node_size
+        rope._dtype = self._dtype
+        rope._chain = None
+        return rope
+
+
+def from_unrolled_list(unrolled_list: ImmutableUnrolledLinkedList[T]
+                       ) -> RopeUnrolledLinkedList[T]:
+    # A rope over the nodes of an ImmutableUnrolledLinkedList, sharing
+    # their element storage, O(nodes)
+    rope: RopeUnrolledLinkedList[T] = RopeUnrolledLinkedList(
+        (), unrolled_list.node_size, unrolled_list.dtype)
+    rope._root = _balanced([node._elements
+                            for node in _iter_nodes(unrolled_list.head_node)
+                            if node._elements])
+    rope._chain = unrolled_list
+    return rope
@@ -0,0 +1,142 @@
+from RopeUnrolledLinkedList import (RopeUnrolledLinkedList, _Branch, _Tree,
+                                    _size, from_unrolled_list)
+from ImmutableUnrollLinkedList import (cons, filter, from_list, map_list,
+                                       reduce, to_list)
+from hypothesis import given
+import hypothesis.strategies as st
+import unittest
+from typing import Any, List, Optional, Tuple
+
+
+def _check_balanced(tree: Optional[_Tree], node_size: int) -> int:
+    # Height of tree after asserting the AVL invariant, the cached sizes
+    # and that no leaf is empty or overfull
+    if tree is None:
+        return 0
+    if type(tree) is not _Branch:
+        assert 0 < _size(tree) <= node_size
+        return 0
+    left = _check_balanced(tree.left, node_size)
+    right = _check_balanced(tree.right, node_size)
+    assert abs(left - right) <= 1
+    assert tree.height == max(left, right) + 1
+    assert tree.size == _size(tree.left) + _size(tree.right)
+    return tree.height
+
+
+class TestRopeUnrolledLinkedList(unittest.TestCase):
+
+    def test_construction(self) -> None:
+        rope = RopeUnrolledLinkedList([1, 2, 3, 4, 5], 2)
+        self.assertEqual(list(rope), [1, 2, 3, 4, 5])
+        self.assertEqual(str(rope), "[1, 2], [3, 4], [5]")
+        self.assertEqual(len(rope), 5)
+        self.assertEqual(rope.height, 2)
+        self.assertEqual(rope[-1], 5)
+        self.assertEqual(rope.to_list(), [1, 2, 3, 4, 5])
+        self.assertEqual(rope, RopeUnrolledLinkedList([1, 2, 3, 4, 5], 2))
+        self.assertNotEqual(rope, RopeUnrolledLinkedList([1, 2, 3, 4], 2))
+        self.assertEqual(str(RopeUnrolledLinkedList[int]()), "[]")
+        with self.assertRaises(IndexError):
+            rope.nth(5)
+        with self.assertRaises(IndexError):
+            RopeUnrolledLinkedList[int]().nth(0)
+        with self.assertRaises(ValueError):
+            RopeUnrolledLinkedList([1], 0)
+
+    def test_unrolled_list(self) -> None:
+        rope = RopeUnrolledLinkedList(range(10), 3)
+        chain = rope.unrolled_list
+        # The chain shares the leaf storage and is built once
+        self.assertIs(rope.unrolled_list, chain)
+        self.assertEqual(list(rope.iter_chunks())[1],
+                         chain.head_node.next_node.elements  # type: ignore
+                         )
+        self.assertEqual(to_list(filter(chain, lambda x: x % 2 == 0)),
+                         [0, 2, 4, 6, 8])
+        self.assertEqual(reduce(map_list(chain, lambda x: x * 2),
+                                lambda acc, x: acc + x, 0), 90)
+        self.assertEqual(to_list(cons(-1, chain)), [-1] + list(range(10)))
+        # A rope over an existing list shares its nodes' storage
+        unrolled = from_list(list(range(7)), 2)
+        converted = from_unrolled_list(unrolled)
+        self.assertIs(converted.unrolled_list, unrolled)
+        head = unrolled.head_node
+        assert head is not None
+        self.assertIs(next(converted.iter_chunks()), head.elements)
+        self.assertEqual(list(converted.set_at(3, 30)),
+                         [0, 1, 2, 30, 4, 5, 6])
+
+    def test_set_at(self) -> None:
+        rope = RopeUnrolledLinkedList(range(16), 4)
+        updated = rope.set_at(5, 50)
+        self.assertEqual(updated[5], 50)
+        self.assertEqual(rope[5], 5)
+        self.assertEqual(updated.set_at(-1, 150)[15], 150)
+        # Only the path to the leaf is copied, the other half is shared
+        root, updated_root = rope._root, updated._root
+        assert type(root) is _Branch and type(updated_root) is _Branch
+        self.assertIs(updated_root.right, root.right)
+        with self.assertRaises(IndexError):
+            rope.set_at(16, 0)
+        typed = RopeUnrolledLinkedList([1.5, 2.5, 3.5], 2, dtype='f8')
+        self.assertEqual(list(typed.set_at(2, 0.5)), [1.5, 2.5, 0.5])
+        self.assertEqual(typed.set_at(2, 0.5).unrolled_list.dtype, 'f8')
+
+    def test_concat_and_split(self) -> None:
+        first = RopeUnrolledLinkedList(range(100), 4)
+        second = RopeUnrolledLinkedList(range(100, 103), 4)
+        joined = first.concat(second)
+        self.assertEqual(list(joined), list(range(103)))
+        _check_balanced(joined._root, 4)
+        left, right = joined.split_at(41)
+        self.assertEqual(list(left), list(range(41)))
+        self.assertEqual(list(right), list(range(41, 103)))
+        _check_balanced(left._root, 4)
+        _check_balanced(right._root, 4)
+        self.assertEqual(left.concat(right), joined)
+        self.assertEqual(len(joined.split_at(-3)[1]), 3)
+        self.assertEqual(len(joined.split_at(0)[0]), 0)
+        self.assertEqual(len(joined.split_at(500)[0]), 103)
+        empty = RopeUnrolledLinkedList[int]([], 4)
+        self.assertEqual(list(empty.concat(second)), [100, 101, 102])
+        self.assertEqual(list(second.concat(empty)), [100, 101, 102])
+        # Building a long rope by repeated cons stays balanced
+        rope = empty
+        for value in range(1000):
+            rope = rope.cons(value)
+        self.assertEqual(list(rope), list(range(999, -1, -1)))
+        self.assertLessEqual(_check_balanced(rope._root, 4), 14)
+
+    @given(st.lists(st.integers()), st.lists(st.integers()),
+           st.integers(min_value=1, max_value=5),
+           st.lists(st.tuples(st.integers(0, 60), st.integers())))
+    def test_matches_list(self, values: List[int], others: List[int],
+                          node_size: int,
+                          updates: List[Tuple[int, int]]) -> None:
+        rope: RopeUnrolledLinkedList[Any] = RopeUnrolledLinkedList(
+            values, node_size)
+        expected = list(values)
+        joined = rope.concat(RopeUnrolledLinkedList(others, node_size))
+        self.assertEqual(list(joined), values + others)
+        _check_balanced(joined._root, node_size)
+        for index, value in updates:
+            if index < len(expected):
+                rope = rope.set_at(index, value)
+                expected[index] = value
+            else:
+                rope = rope.cons(value)
+                expected.insert(0, value)
+            _check_balanced(rope._root, node_size)
+        self.assertEqual(list(rope), expected)
+        self.assertEqual(to_list(rope.unrolled_list), expected)
+        for index in range(len(expected) + 1):
+            left, right = rope.split_at(index)
+            self.assertEqual(list(left), expected[:index])
+            self.assertEqual(list(right), expected[index:])
+            if index < len(expected):
+                self.assertEqual(rope.nth(index), expected[index])
+
+
+if __name__ == '__main__':
+    unittest.main()
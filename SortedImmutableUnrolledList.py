@@ -0,0 +1,264 @@
+from ImmutableUnrollLinkedList import (ImmutableUnrolledLinkedList, Node,
+                                       from_list, length, _copy_path,
+                                       _iter_nodes, _length_after,
+                                       _new_list, _new_node, _skip_index)
+from bisect import bisect_left, bisect_right
+from typing import (Any, Callable, Generic, Iterable, Iterator, List,
+                    Optional, Tuple, TypeVar)
+
+T = TypeVar('T')
+
+# Marks an exhausted input in the merges
+_END: Any = object()
+
+
+class SortedImmutableUnrolledList(Generic[T]):
+    # Immutable unrolled list kept sorted by key (the elements themselves
+    # when key is None). The elements live in a plain
+    # ImmutableUnrolledLinkedList whose Node chain is shared, not copied.
+    # The max key of every node is indexed lazily, so lookups bisect over
+    # the nodes first and then inside one node, O(log n) in total
+    __slots__ = ('_list', '_key', '_max_keys')
+
+    def __init__(self, values: Iterable[T] = (),
+                 node_size: Optional[int] = None,
+                 key: Optional[Callable[[T], Any]] = None):
+        ordered: List[Any] = list(values)
+        ordered.sort(key=key)
+        self._list: ImmutableUnrolledLinkedList[T] = from_list(ordered,
+                                                               node_size)
+        self._key = key
+        # Key of the last element of every indexed node, see _node_keys
+        self._max_keys: Optional[List[Any]] = None
+
+    @property
+    def key(self) -> Optional[Callable[[T], Any]]:
+        # The sort key, None for the natural order
+        return self._key
+
+    @property
+    def node_size(self) -> int:
+        return self._list._node_size
+
+    @property
+    def unrolled_list(self) -> ImmutableUnrolledLinkedList[T]:
+        # The elements as an ImmutableUnrolledLinkedList sharing the same
+        # Node chain, for the function-style API (filter, map_list, ...)
+        return self._list
+
+    def __str__(self) -> str:
+        return str(self._list)
+
+    def __eq__(self, other: object) -> bool:
+        # Equal when sorted by the same key and holding equal elements
+        if not isinstance(other, SortedImmutableUnrolledList):
+            return False
+        return self._key is other._key and self._list == other._list
+
+    def __hash__(self) -> int:
+        return hash(self._list)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._list)
+
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self._list)
+
+    def __len__(self) -> int:
+        return length(self._list)
+
+    def __getitem__(self, index: int) -> T:
+        return self._list[index]
+
+    def _key_of(self, value: T) -> Any:
+        return value if self._key is None else self._key(value)
+
+    def _node_keys(self) -> Tuple[List[int], List[Node[T]], List[Any]]:
+        # The skip index of the list (offsets and non-empty nodes) and the
+        # max key of every one of those nodes
+        offsets, nodes = _skip_index(self._list)
+        if self._max_keys is None:
+            self._max_keys = [self._key_of(node._elements[-1])
+                              for node in nodes]
+        return offsets, nodes, self._max_keys
+
+    def _locate(self, key: Any) -> Tuple[int, int]:
+        # (node position, element position) of the first element whose
+        # key is not below key; (len(nodes), 0) if there is none
+        _, nodes, max_keys = self._node_keys()
+        position = bisect_left(max_keys, key)
+        if position == len(nodes):
+            return position, 0
+        return position, bisect_left(nodes[position]._elements, key,
+                                     key=self._key)
+
+    def _equal_keys(self, key: Any) -> Iterator[Tuple[int, T]]:
+        # (index, element) of every element whose key equals key, in order
+        offsets, nodes, _ = self._node_keys()
+        position, start = self._locate(key)
+        while position < len(nodes):
+            elements = nodes[position]._elements
+            for index in range(start, len(elements)):
+                if key < self._key_of(elements[index]):
+                    return
+                yield offsets[position] + index, elements[index]
+            position, start = position + 1, 0
+
+    def member(self, value: T) -> bool:
+        # True if an element == value, found by binary search in O(log n)
+        return any(element == value
+                   for _, element in self._equal_keys(self._key_of(value)))
+
+    def index_of(self, value: T) -> int:
+        # Index of the first element == value, ValueError if there is none
+        for index, element in self._equal_keys(self._key_of(value)):
+            if element == value:
+                return index
+        raise ValueError(f"{value!r} is not in the list")
+
+    def insert(self, value: T) -> 'SortedImmutableUnrolledList[T]':
+        # New list with value in sorted position (after equal keys). Only
+        # the nodes in front of the target node are copied; a full target
+        # node is split in two, every node after it is shared
+        node_size = self._list._node_size
+        key = self._key_of(value)
+        _, nodes, max_keys = self._node_keys()
+        if not nodes:
+            return self._derived(_new_list(_new_node((value, ), None),
+                                           node_size, 1))
+
+        # First node whose max key is above key, else the last node
+        position = min(bisect_right(max_keys, key), len(nodes) - 1)
+        node = nodes[position]
+        elements = tuple(node._elements)
+        index = bisect_right(elements, key, key=self._key)
+        new_elements = elements[:index] + (value, ) + elements[index:]
+        if len(new_elements) <= node_size:
+            replacement = _new_node(new_elements, node._next)
+        else:  # Split the overfull node in two halves
+            half = len(new_elements) // 2
+            replacement = _new_node(
+                new_elements[:half],
+                _new_node(new_elements[half:], node._next))
+        head_node = _copy_path(self._list._head_node, node, replacement)
+        return self._derived(_new_list(head_node, node_size,
+                                       _length_after(self._list, 1)))
+
+    def range(self, low: Any = None,
+              high: Any = None) -> 'SortedImmutableUnrolledList[T]':
+        # New list of the elements with low <= key < high (None: no bound)
+        # Interior nodes are copied as node shells only, their element
+        # tuples are shared; a range that runs to the end shares every
+        # node after its first one
+        offsets, nodes, _ = self._node_keys()
+        start = (0, 0) if low is None else self._locate(low)
+        end = (len(nodes), 0) if high is None else self._locate(high)
+        node_size = self._list._node_size
+        if start >= end:
+            return self._derived(_new_list(None, node_size, 0))
+
+        first, first_index = start
+        first_node = nodes[first]
+        if end[0] == len(nodes):  # Up to the end, share the tail
+            count = length(self._list) - offsets[first] - first_index
+            head_node: Optional[Node[T]] = first_node
+            if first_index:
+                head_node = _new_node(first_node._elements[first_index:],
+                                      first_node._next)
+            return self._derived(_new_list(head_node, node_size, count))
+
+        last, last_index = end
+        count = offsets[last] + last_index - offsets[first] - first_index
+        if first == last:
+            return self._derived(_new_list(
+                _new_node(first_node._elements[first_index:last_index],
+                          None), node_size, count))
+        tail = _new_node(nodes[last]._elements[:last_index], None) \
+            if last_index else None
+        head_node = _copy_path(first_node, nodes[last], tail)
+        if first_index and head_node is not None:
+            head_node = _new_node(first_node._elements[first_index:],
+                                  head_node._next)
+        return self._derived(_new_list(head_node, node_size, count))
+
+    def irange(self, low: Any = None, high: Any = None) -> Iterator[T]:
+        # Yields the elements with low <= key < high without building a list
+        _, nodes, _ = self._node_keys()
+        position, start = (0, 0) if low is None else self._locate(low)
+        for node in _iter_nodes(nodes[position] if position < len(nodes)
+                                else None):
+            for element in node._elements[start:]:
+                if high is not None and not self._key_of(element) < high:
+                    return
+                yield element
+            start = 0
+
+    def intersection(self, other: 'SortedImmutableUnrolledList[T]'
+                     ) -> 'SortedImmutableUnrolledList[T]':
+        # Elements whose key is in both lists, as a multiset (min counts)
+        return self._merge(other, False, True, False)
+
+    def union(self, other: 'SortedImmutableUnrolledList[T]'
+              ) -> 'SortedImmutableUnrolledList[T]':
+        # Elements of both lists, as a multiset (max counts); for equal
+        # keys the elements of self are kept
+        return self._merge(other, True, True, True)
+
+    def difference(self, other: 'SortedImmutableUnrolledList[T]'
+                   ) -> 'SortedImmutableUnrolledList[T]':
+        # Elements of self whose key is not matched in other (multiset)
+        return self._merge(other, True, False, False)
+
+    def _merge(self, other: 'SortedImmutableUnrolledList[T]',
+               left_only: bool, both: bool,
+               right_only: bool) -> 'SortedImmutableUnrolledList[T]':
+        # One merge pass over both sorted lists, O(n + m). Elements with
+        # equal keys are paired one to one; the flags select which of the
+        # unpaired left, paired and unpaired right elements are kept
+        if not isinstance(other, SortedImmutableUnrolledList) or \
+                other._key is not self._key:
+            raise ValueError("both lists must be sorted by the same key")
+        key_of = self._key_of
+        values: List[T] = []
+        left, right = iter(self), iter(other)
+        x, y = next(left, _END), next(right, _END)
+        if x is not _END and y is not _END:
+            key_x, key_y = key_of(x), key_of(y)
+        while x is not _END and y is not _END:
+            if key_x < key_y:
+                if left_only:
+                    values.append(x)
+                x = next(left, _END)
+                if x is not _END:
+                    key_x = key_of(x)
+            elif key_y < key_x:
+                if right_only:
+                    values.append(y)
+                y = next(right, _END)
+                if y is not _END:
+                    key_y = key_of(y)
+            else:
+                if both:
+                    values.append(x)
+                x, y = next(left, _END), next(right, _END)
+                if x is not _END:
+                    key_x = key_of(x)
+                if y is not _END:
+                    key_y = key_of(y)
+        if left_only and x is not _END:
+            values.append(x)
+            values.extend(left)
+        if right_only and y is not _END:
+            values.append(y)
+            values.extend(right)
+        return self._derived(from_list(values, self._list._node_size))
+
+    def _derived(self, unrolled_list: ImmutableUnrolledLinkedList[T]
+                 ) -> 'SortedImmutableUnrolledList[T]':
+        # A new sorted list with the same key over an already sorted list
+        sorted_list: SortedImmutableUnrolledList[T] = object.__new__(
+            SortedImmutableUnrolledList)
+        sorted_list._list = unrolled_list
+        sorted_list._key = self._key
+        sorted_list._max_keys = None
+        return sorted_list
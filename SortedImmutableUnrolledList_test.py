@@ -0,0 +1,143 @@
+from SortedImmutableUnrolledList import SortedImmutableUnrolledList
+from ImmutableUnrollLinkedList import filter, to_list
+from hypothesis import given
+import hypothesis.strategies as st
+import unittest
+from collections import Counter
+from typing import List, Tuple
+
+
+class TestSortedImmutableUnrolledList(unittest.TestCase):
+
+    def test_construction(self) -> None:
+        sorted_list = SortedImmutableUnrolledList([5, 1, 4, 2, 3], 2)
+        self.assertEqual(list(sorted_list), [1, 2, 3, 4, 5])
+        self.assertEqual(str(sorted_list), "[1, 2], [3, 4], [5]")
+        self.assertEqual(len(sorted_list), 5)
+        self.assertEqual(sorted_list[-1], 5)
+        self.assertEqual(sorted_list,
+                         SortedImmutableUnrolledList([1, 2, 3, 4, 5], 2))
+        self.assertEqual(len(SortedImmutableUnrolledList[int]()), 0)
+        # The unrolled list shares the Node chain and works with the API
+        self.assertEqual(to_list(filter(sorted_list.unrolled_list,
+                                        lambda x: x % 2 == 1)), [1, 3, 5])
+
+    def test_member_and_index_of(self) -> None:
+        sorted_list = SortedImmutableUnrolledList([1, 3, 3, 3, 5, 7, 9], 2)
+        self.assertTrue(sorted_list.member(3))
+        self.assertTrue(sorted_list.member(9))
+        self.assertFalse(sorted_list.member(4))
+        self.assertFalse(sorted_list.member(10))
+        self.assertEqual(sorted_list.index_of(3), 1)
+        self.assertEqual(sorted_list.index_of(9), 6)
+        with self.assertRaises(ValueError):
+            sorted_list.index_of(0)
+        self.assertFalse(SortedImmutableUnrolledList[int]().member(1))
+
+    def test_insert(self) -> None:
+        sorted_list = SortedImmutableUnrolledList([10, 20, 30, 40, 50, 60], 3)
+        inserted = sorted_list.insert(25)
+        self.assertEqual(list(inserted), [10, 20, 25, 30, 40, 50, 60])
+        self.assertEqual(list(sorted_list), [10, 20, 30, 40, 50, 60])
+        # The full node is split, the node after it is shared
+        self.assertEqual(str(inserted), "[10, 20], [25, 30], [40, 50, 60]")
+        head = inserted.unrolled_list.head_node
+        original_head = sorted_list.unrolled_list.head_node
+        assert head is not None and original_head is not None
+        assert head.next_node is not None
+        self.assertIs(head.next_node.next_node, original_head.next_node)
+        self.assertEqual(list(sorted_list.insert(70)),
+                         [10, 20, 30, 40, 50, 60, 70])
+        self.assertEqual(list(sorted_list.insert(0))[0], 0)
+        self.assertEqual(list(SortedImmutableUnrolledList[int]().insert(1)),
+                         [1])
+        self.assertEqual(len(inserted), 7)
+
+    def test_key(self) -> None:
+        words = SortedImmutableUnrolledList(["ccc", "a", "bb", "dd"], 2,
+                                            key=len)
+        self.assertEqual(list(words), ["a", "bb", "dd", "ccc"])
+        self.assertTrue(words.member("dd"))
+        self.assertFalse(words.member("xx"))
+        self.assertEqual(words.index_of("dd"), 2)
+        # Inserted after the elements with an equal key
+        self.assertEqual(list(words.insert("ee")),
+                         ["a", "bb", "dd", "ee", "ccc"])
+        self.assertEqual(list(words.range(2, 3)), ["bb", "dd"])
+        other = SortedImmutableUnrolledList(["xx"], 2, key=len)
+        self.assertEqual(list(words.intersection(other)), ["bb"])
+        with self.assertRaises(ValueError):
+            words.union(SortedImmutableUnrolledList(["xx"], 2))
+
+    def test_range(self) -> None:
+        sorted_list = SortedImmutableUnrolledList(list(range(0, 20, 2)), 3)
+        self.assertEqual(list(sorted_list.range(3, 11)), [4, 6, 8, 10])
+        self.assertEqual(list(sorted_list.range(4, 5)), [4])
+        self.assertEqual(list(sorted_list.range(5, 5)), [])
+        self.assertEqual(list(sorted_list.range(None, 3)), [0, 2])
+        self.assertEqual(list(sorted_list.range()), list(range(0, 20, 2)))
+        self.assertEqual(list(sorted_list.irange(5, 9)), [6, 8])
+        # A range to the end shares every node after its first one
+        tail = sorted_list.range(7)
+        self.assertEqual(list(tail), [8, 10, 12, 14, 16, 18])
+        self.assertEqual(len(tail), 6)
+        head = tail.unrolled_list.head_node
+        original = sorted_list.unrolled_list.head_node
+        assert head is not None and original is not None
+        assert original.next_node is not None
+        self.assertIs(head.next_node, original.next_node.next_node)
+
+    def test_set_operations(self) -> None:
+        first = SortedImmutableUnrolledList([1, 2, 2, 3, 5, 8], 2)
+        second = SortedImmutableUnrolledList([2, 3, 3, 4, 8, 9], 2)
+        self.assertEqual(list(first.intersection(second)), [2, 3, 8])
+        self.assertEqual(list(first.union(second)),
+                         [1, 2, 2, 3, 3, 4, 5, 8, 9])
+        self.assertEqual(list(first.difference(second)), [1, 2, 5])
+        self.assertEqual(list(second.difference(first)), [3, 4, 9])
+        empty = SortedImmutableUnrolledList[int]([], 2)
+        self.assertEqual(list(first.union(empty)), list(first))
+        self.assertEqual(list(empty.intersection(first)), [])
+
+    @given(st.lists(st.integers(-20, 20)), st.lists(st.integers(-20, 20)),
+           st.integers(min_value=1, max_value=5))
+    def test_matches_naive(self, values: List[int], others: List[int],
+                           node_size: int) -> None:
+        sorted_list = SortedImmutableUnrolledList(values, node_size)
+        other = SortedImmutableUnrolledList(others, node_size)
+        counts, other_counts = Counter(values), Counter(others)
+        for probe in range(-21, 22):
+            self.assertEqual(sorted_list.member(probe), probe in values)
+            if probe in values:
+                self.assertEqual(sorted_list.index_of(probe),
+                                 sorted(values).index(probe))
+            self.assertEqual(list(sorted_list.insert(probe)),
+                             sorted(values + [probe]))
+            self.assertEqual(list(sorted_list.range(probe, probe + 5)),
+                             [x for x in sorted(values)
+                              if probe <= x < probe + 5])
+        self.assertEqual(list(sorted_list.intersection(other)),
+                         sorted((counts & other_counts).elements()))
+        self.assertEqual(list(sorted_list.union(other)),
+                         sorted((counts | other_counts).elements()))
+        self.assertEqual(list(sorted_list.difference(other)),
+                         sorted((counts - other_counts).elements()))
+
+    @given(st.lists(st.tuples(st.integers(0, 5), st.integers())),
+           st.integers(min_value=1, max_value=4))
+    def test_key_is_stable(self, pairs: List[Tuple[int, int]],
+                           node_size: int) -> None:
+        def first(pair: Tuple[int, int]) -> int:
+            return pair[0]
+
+        sorted_list = SortedImmutableUnrolledList(pairs, node_size,
+                                                  key=first)
+        self.assertEqual(list(sorted_list), sorted(pairs, key=first))
+        for pair in pairs:
+            self.assertTrue(sorted_list.member(pair))
+        inserted = sorted_list.insert((2, -1))
+        self.assertEqual(list(inserted), sorted(pairs + [(2, -1)], key=first))
+
+
+if __name__ == '__main__':
+    unittest.main()